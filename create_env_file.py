@@ -99,7 +99,8 @@ def validate_input(value: str, var_info: Dict[str, Any]) -> Tuple[bool, str]:
     
     Args:
         value: Введенное значение
-        var_info: Информация о переменной окружения
+        var_info: Информация о переменной окружения; "pattern" может быть
+            строкой или уже скомпилированным регулярным выражением
         
     Returns:
         Кортеж (is_valid, error_message)
@@ -114,7 +115,9 @@ def validate_input(value: str, var_info: Dict[str, Any]) -> Tuple[bool, str]:
         
     # Проверяем по регулярному выражению
     if "pattern" in var_info and var_info["pattern"]:
-        pattern = re.compile(var_info["pattern"])
+        pattern = var_info["pattern"]
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern)
         if not pattern.match(value):
             return False, var_info.get("error_message", "Неверный формат значения")
     
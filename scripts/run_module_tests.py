@@ -101,7 +101,7 @@ def main():
         if args.telegram_bot:
             module_paths.append("src/telegram_bot/tests")
         if args.utils:
-            module_paths.append("src/utils/tests")
+            module_paths.append("tests/utils")
 
     success = run_tests(module_paths, args.verbose, args.report)
     return 0 if success else 1
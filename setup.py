@@ -35,6 +35,8 @@ setup(
             "pytest",
             "pytest-asyncio",
             "pytest-cov",
+            "pytest-mock",
+            "pytest-xdist",
             "black",
             "sphinx",
             "sphinx-rtd-theme",
@@ -76,6 +76,11 @@ def main():
 
         atexit.register(cleanup)
 
+        # Use uvloop when it is installed
+        from utils.event_loop import install_event_loop_policy
+
+        install_event_loop_policy()
+
         # Start the bot
         asyncio.run(run_bot())
 
@@ -10,6 +10,7 @@ This module provides tools for analyzing:
 Based on DMarket API documentation: https://docs.dmarket.com/v1/swagger.html
 """
 
+import asyncio
 import datetime
 import logging
 import time
@@ -22,6 +23,9 @@ from src.utils.rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of items batch_analyze_items evaluates at the same time
+BATCH_ANALYSIS_CONCURRENCY = 5
+
 
 class SalesAnalyzer:
     """Analyzer for historical sales data on DMarket."""
@@ -517,6 +521,9 @@ async def batch_analyze_items(
 ) -> dict[str, dict[str, Any]]:
     """Batch analyze multiple items for arbitrage potential.
 
+    Items are evaluated concurrently, at most BATCH_ANALYSIS_CONCURRENCY at
+    a time; the API requests themselves are still paced by the rate limiter.
+
     Args:
         items: List of items with name, buy_price, and sell_price
         game: Game name
@@ -526,9 +533,7 @@ async def batch_analyze_items(
         Dictionary of item names to analysis results
 
     """
-    analyzer = SalesAnalyzer()
-    results = {}
-
+    valid_items = []
     for item in items:
         item_name = item.get("name", "")
         buy_price = item.get("buy_price", 0)
@@ -537,25 +542,38 @@ async def batch_analyze_items(
         if not item_name or buy_price <= 0 or sell_price <= 0:
             continue
 
-        try:
-            analysis = await analyzer.evaluate_arbitrage_potential(
-                item_name=item_name,
-                buy_price=buy_price,
-                sell_price=sell_price,
-                game=game,
-                days=days,
-            )
+        valid_items.append((item_name, buy_price, sell_price))
 
-            results[item_name] = analysis
+    # Nothing to analyze: skip creating the analyzer and its API client
+    if not valid_items:
+        return {}
 
-        except Exception as e:
-            logger.error(f"Error analyzing {item_name}: {e}")
-            results[item_name] = {
-                "error": str(e),
-                "success": False,
-            }
+    analyzer = SalesAnalyzer()
+    semaphore = asyncio.Semaphore(BATCH_ANALYSIS_CONCURRENCY)
+
+    async def analyze(item_name: str, buy_price: float, sell_price: float) -> dict[str, Any]:
+        async with semaphore:
+            try:
+                return await analyzer.evaluate_arbitrage_potential(
+                    item_name=item_name,
+                    buy_price=buy_price,
+                    sell_price=sell_price,
+                    game=game,
+                    days=days,
+                )
+            except Exception as e:
+                logger.error(f"Error analyzing {item_name}: {e}")
+                return {
+                    "error": str(e),
+                    "success": False,
+                }
+
+    analyses = await asyncio.gather(*(analyze(*item) for item in valid_items))
 
-    return results
+    return {
+        item_name: analysis
+        for (item_name, _, _), analysis in zip(valid_items, analyses, strict=True)
+    }
 
 
 async def find_best_arbitrage_opportunities(
@@ -23,6 +23,7 @@ Example usage:
 Documentation: https://docs.dmarket.com/v1/swagger.html
 """
 import asyncio
+import functools
 import hashlib
 import hmac
 import json
@@ -51,6 +52,31 @@ CACHE_TTL = {
 api_cache = {}
 
 
+@functools.lru_cache(maxsize=8)
+def _hmac_template(secret_key: bytes) -> "hmac.HMAC":
+    """Возвращает HMAC-SHA256 с подготовленным секретным ключом.
+
+    Ключ разворачивается один раз, каждая подпись считается на копии шаблона.
+    """
+    return hmac.new(secret_key, digestmod=hashlib.sha256)
+
+
+def _sign(secret_key: bytes, message: str) -> str:
+    """Подписывает сообщение HMAC-SHA256.
+
+    Args:
+        secret_key: Секретный ключ API
+        message: Строка для подписи
+
+    Returns:
+        str: Подпись в шестнадцатеричном виде
+
+    """
+    mac = _hmac_template(secret_key).copy()
+    mac.update(message.encode("utf-8"))
+    return mac.hexdigest()
+
+
 class DMarketAPI:
     """Асинхронный клиент для работы с DMarket API.
 
@@ -217,11 +243,7 @@ class DMarketAPI:
             string_to_sign += body
 
         # Generate HMAC-SHA256 signature
-        signature = hmac.new(
-            self.secret_key,
-            string_to_sign.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()
+        signature = _sign(self.secret_key, string_to_sign)
 
         # Return headers with signature
         return {
@@ -1528,11 +1550,7 @@ class DMarketAPI:
             string_to_sign = f"GET{endpoint}{timestamp}"
 
             # Создаем HMAC подпись
-            signature = hmac.new(
-                self.secret_key,
-                string_to_sign.encode(),
-                hashlib.sha256,
-            ).hexdigest()
+            signature = _sign(self.secret_key, string_to_sign)
 
             # Формируем заголовки запроса согласно последней документации DMarket
             headers = {
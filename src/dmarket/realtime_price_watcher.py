@@ -18,6 +18,9 @@ from src.utils.websocket_client import DMarketWebSocketClient
 
 logger = logging.getLogger(__name__)
 
+# Максимальное число одновременных REST-запросов при обновлении цен
+PRICE_UPDATE_CONCURRENCY = 2
+
 
 class PriceAlert:
     """Класс для представления оповещения о цене."""
@@ -335,67 +338,87 @@ class RealtimePriceWatcher:
                 game = self.item_metadata[item_id]["gameId"]
             items_by_game[game].append(item_id)
 
-        # Обновляем цены для каждой игры
-        for game, item_ids in items_by_game.items():
-            # Разбиваем на чанки по 50 предметов для избежания слишком длинных запросов
-            chunk_size = 50
-            for i in range(0, len(item_ids), chunk_size):
-                chunk = item_ids[i : i + chunk_size]
-                try:
-                    # Формируем строку с ID предметов через запятую
-                    item_ids_str = ",".join(chunk)
-
-                    # Запрашиваем информацию о предметах через API
-                    response = await self.api_client._request(
-                        "GET",
-                        "/exchange/v1/market/items",
-                        params={
+        # Разбиваем на чанки по 50 предметов для избежания слишком длинных запросов
+        chunk_size = 50
+        chunks = [
+            (game, item_ids[i : i + chunk_size])
+            for game, item_ids in items_by_game.items()
+            for i in range(0, len(item_ids), chunk_size)
+        ]
+
+        # Запрашиваем чанки параллельно, но не больше PRICE_UPDATE_CONCURRENCY
+        # одновременно; темп запросов дополнительно задает ограничитель клиента API
+        semaphore = asyncio.Semaphore(PRICE_UPDATE_CONCURRENCY)
+
+        async def fetch(game: str, chunk: list[str]) -> list[dict[str, Any]]:
+            async with semaphore:
+                return await self._fetch_items_chunk(game, chunk)
+
+        responses = await asyncio.gather(*(fetch(game, chunk) for game, chunk in chunks))
+
+        for (game, _), items in zip(chunks, responses):
+            try:
+                for item in items:
+                    item_id = item.get("itemId")
+                    if not item_id:
+                        continue
+
+                    # Получаем цену
+                    price_data = item.get("price", {})
+                    if isinstance(price_data, dict) and "USD" in price_data:
+                        price = (
+                            float(price_data["USD"]) / 100
+                        )  # Цена в центах, конвертируем в доллары
+
+                        # Сохраняем метаданные
+                        self.item_metadata[item_id] = {
+                            "title": item.get("title", ""),
                             "gameId": game,
-                            "itemIds": item_ids_str,
-                            "currency": "USD",
-                        },
-                    )
-
-                    if "items" in response:
-                        # Обрабатываем полученные данные
-                        for item in response["items"]:
-                            item_id = item.get("itemId")
-                            if not item_id:
-                                continue
-
-                            # Получаем цену
-                            price_data = item.get("price", {})
-                            if isinstance(price_data, dict) and "USD" in price_data:
-                                price = (
-                                    float(price_data["USD"]) / 100
-                                )  # Цена в центах, конвертируем в доллары
-
-                                # Сохраняем метаданные
-                                self.item_metadata[item_id] = {
-                                    "title": item.get("title", ""),
-                                    "gameId": game,
-                                    "lastUpdated": time.time(),
-                                }
-
-                                # Обрабатываем изменение цены
-                                old_price = self.price_cache.get(item_id)
-                                if old_price != price:
-                                    self.price_cache[item_id] = price
-
-                                    # Добавляем в историю цен
-                                    self._add_to_price_history(item_id, price)
-
-                                    # Запускаем обработчики изменения цены
-                                    await self._process_price_change(item_id, old_price, price)
-
-                                    # Проверяем оповещения
-                                    await self._check_alerts(item_id, price)
-
-                except Exception as e:
-                    logger.error(f"Ошибка при обновлении цен для игры {game}: {e}")
-
-                # Задержка между запросами чанков
-                await asyncio.sleep(1)
+                            "lastUpdated": time.time(),
+                        }
+
+                        # Обрабатываем изменение цены
+                        old_price = self.price_cache.get(item_id)
+                        if old_price != price:
+                            self.price_cache[item_id] = price
+
+                            # Добавляем в историю цен
+                            self._add_to_price_history(item_id, price)
+
+                            # Запускаем обработчики изменения цены
+                            await self._process_price_change(item_id, old_price, price)
+
+                            # Проверяем оповещения
+                            await self._check_alerts(item_id, price)
+            except Exception as e:
+                logger.error(f"Ошибка при обновлении цен для игры {game}: {e}")
+
+    async def _fetch_items_chunk(self, game: str, item_ids: list[str]) -> list[dict[str, Any]]:
+        """Запрашивает через REST API данные о чанке предметов одной игры.
+
+        Args:
+            game: Идентификатор игры
+            item_ids: ID предметов чанка
+
+        Returns:
+            Список предметов из ответа API (пустой при ошибке)
+
+        """
+        try:
+            # Запрашиваем информацию о предметах, передавая ID через запятую
+            response = await self.api_client._request(
+                "GET",
+                "/exchange/v1/market/items",
+                params={
+                    "gameId": game,
+                    "itemIds": ",".join(item_ids),
+                    "currency": "USD",
+                },
+            )
+            return response.get("items", [])
+        except Exception as e:
+            logger.error(f"Ошибка при обновлении цен для игры {game}: {e}")
+            return []
 
     async def _process_price_change(
         self,
@@ -6,6 +6,7 @@
 Документация DMarket API: https://docs.dmarket.com/v1/swagger.html
 """
 
+import asyncio
 import json
 import logging
 import os
@@ -16,6 +17,11 @@ from typing import Any
 
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # orjson необязателен: без него кеш читается модулем json
+    orjson = None
+
 from src.dmarket.dmarket_api import DMarketAPI
 from src.utils.rate_limiter import RateLimiter
 
@@ -56,6 +62,9 @@ DMARKET_PUBLIC_KEY = os.getenv("DMARKET_PUBLIC_KEY", "")
 DMARKET_SECRET_KEY = os.getenv("DMARKET_SECRET_KEY", "")
 DMARKET_API_URL = os.getenv("DMARKET_API_URL", "https://api.dmarket.com")
 
+# Запросы истории продаж, которые выполняются прямо сейчас: (игра, предмет, период) -> задача
+_inflight_requests: dict[tuple[str, str, str], asyncio.Task] = {}
+
 
 async def get_item_sales_history(
     item_name: str,
@@ -80,6 +89,10 @@ async def get_item_sales_history(
         - market_hash_name: название предмета
 
     """
+    # Без названия предмета запрашивать нечего: не трогаем ни кеш, ни API
+    if not item_name:
+        return []
+
     # Проверяем валидность периода
     if period not in CACHE_TTL:
         period = "24h"
@@ -91,6 +104,40 @@ async def get_item_sales_history(
             logger.info(f"Загружена история продаж {item_name} ({game}) из кеша")
             return cached_data
 
+    # Одновременные запросы одного и того же предмета ждут общий вызов API
+    key = (game, item_name, period)
+    task = _inflight_requests.get(key)
+    if task is None:
+        task = asyncio.ensure_future(
+            _fetch_item_sales_history(item_name, game, period, use_cache, dmarket_api)
+        )
+        _inflight_requests[key] = task
+        task.add_done_callback(lambda _: _inflight_requests.pop(key, None))
+
+    # Копия списка: вызывающие сортируют результат на месте
+    return list(await asyncio.shield(task))
+
+
+async def _fetch_item_sales_history(
+    item_name: str,
+    game: str,
+    period: str,
+    use_cache: bool,
+    dmarket_api: DMarketAPI | None,
+) -> list[dict[str, Any]]:
+    """Запрашивает историю продаж предмета у API и сохраняет ее в кеш.
+
+    Args:
+        item_name: Название предмета (market hash name)
+        game: Код игры (csgo, dota2, rust, tf2)
+        period: Период истории (1h, 12h, 24h, 7d, 30d)
+        use_cache: Сохранять ли результат в кеш
+        dmarket_api: Экземпляр DMarketAPI или None для создания нового
+
+    Returns:
+        Список продаж в формате get_item_sales_history
+
+    """
     # Создаем API клиент, если не предоставлен
     close_client = False
     if dmarket_api is None:
@@ -517,10 +564,11 @@ def _load_from_cache(item_name: str, game: str, period: str) -> list[dict[str, A
             return []
 
         # Загружаем данные из файла
-        with open(cache_file, encoding="utf-8") as f:
-            cached_data = json.load(f)
+        if orjson is not None:
+            return orjson.loads(cache_file.read_bytes())
 
-        return cached_data
+        with open(cache_file, encoding="utf-8") as f:
+            return json.load(f)
 
     except Exception as e:
         logger.warning(f"Ошибка при загрузке кеша истории продаж: {e}")
@@ -536,6 +584,10 @@ def _save_to_cache(item_name: str, game: str, period: str, data: list[dict[str,
         cache_file.parent.mkdir(parents=True, exist_ok=True)
 
         # Сохраняем данные в файл
+        if orjson is not None:
+            cache_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            return
+
         with open(cache_file, "w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
 
@@ -3,17 +3,10 @@
 Этот файл содержит фикстуры для тестирования модулей в директории src/dmarket.
 """
 
-import sys
-from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-# Добавляем корневую директорию проекта в PYTHONPATH
-project_root = Path(__file__).parent.parent.parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
-
 
 @pytest.fixture
 def mock_api_client():
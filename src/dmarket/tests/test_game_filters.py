@@ -17,6 +17,31 @@ from src.dmarket.game_filters import (
 )
 
 
+# Предметы CS2 для apply_filters_to_items: функция только читает их и
+# возвращает новый список, поэтому кортеж собирается один раз на модуль.
+# CS2Filter читает category и rarity из корня предмета, а внешний вид — из title
+CSGO_ITEMS = (
+    {
+        "price": {"amount": 1000},  # $10.00
+        "title": "AK-47 | Redline (Field-Tested)",
+        "category": "Rifle",
+        "rarity": "Classified",
+    },
+    {
+        "price": {"amount": 5000},  # $50.00
+        "title": "Karambit | Fade (Factory New)",
+        "category": "Knife",
+        "rarity": "Covert",
+    },
+    {
+        "price": {"amount": 2000},  # $20.00
+        "title": "AWP | Asiimov (Field-Tested)",
+        "category": "Rifle",
+        "rarity": "Covert",
+    },
+)
+
+
 def test_base_game_filter():
     """Тестирует базовый класс фильтров."""
     base_filter = BaseGameFilter()
@@ -65,14 +90,9 @@ def test_cs2_filter():
     item = {
         "price": {"amount": 1500},  # $15.00
         "title": "AK-47 | Redline (Field-Tested)",
-        "extra": {
-            "floatValue": 0.25,
-            "category": "Rifle",
-            "rarity": "Classified",
-            "exterior": "ft",
-            "stattrak": False,
-            "souvenir": False,
-        },
+        "float": 0.25,
+        "category": "Rifle",
+        "rarity": "Classified",
     }
 
     # Проверка прохождения фильтров
@@ -219,49 +239,18 @@ def test_filter_factory():
 
 def test_apply_filters_to_items():
     """Тестирует применение фильтров к списку предметов."""
-    # Создаем тестовые предметы
-    items = [
-        {
-            "price": {"amount": 1000},  # $10.00
-            "title": "AK-47 | Redline (Field-Tested)",
-            "extra": {
-                "category": "Rifle",
-                "rarity": "Classified",
-                "exterior": "ft",
-            },
-        },
-        {
-            "price": {"amount": 5000},  # $50.00
-            "title": "Karambit | Fade (Factory New)",
-            "extra": {
-                "category": "Knife",
-                "rarity": "Covert",
-                "exterior": "fn",
-            },
-        },
-        {
-            "price": {"amount": 2000},  # $20.00
-            "title": "AWP | Asiimov (Field-Tested)",
-            "extra": {
-                "category": "Rifle",
-                "rarity": "Covert",
-                "exterior": "ft",
-            },
-        },
-    ]
-
     # Применяем фильтры
-    filtered_items = apply_filters_to_items(items, "csgo", {"min_price": 20.0})
+    filtered_items = apply_filters_to_items(CSGO_ITEMS, "csgo", {"min_price": 20.0})
     assert len(filtered_items) == 2  # AWP и Karambit
 
-    filtered_items = apply_filters_to_items(items, "csgo", {"category": "Rifle"})
+    filtered_items = apply_filters_to_items(CSGO_ITEMS, "csgo", {"category": "Rifle"})
     assert len(filtered_items) == 2  # AK-47 и AWP
 
-    filtered_items = apply_filters_to_items(items, "csgo", {"exterior": "Factory New"})
+    filtered_items = apply_filters_to_items(CSGO_ITEMS, "csgo", {"exterior": "Factory New"})
     assert len(filtered_items) == 1  # Karambit
 
     filtered_items = apply_filters_to_items(
-        items,
+        CSGO_ITEMS,
         "csgo",
         {"rarity": "Covert", "category": "Rifle"},
     )
@@ -86,11 +86,6 @@ from src.telegram_bot.handlers.market_analysis_handler import register_market_an
 # Импортируем обработчики для уведомлений о рынке
 from src.telegram_bot.handlers.market_alerts_handler import register_alerts_handlers
 
-# Настройка логирования
-logging.basicConfig(
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", 
-    level=logging.INFO
-)
 logger = logging.getLogger(__name__)
 
 async def set_bot_commands(application: Application) -> None:
@@ -150,6 +145,12 @@ async def initialize_application(application: Application) -> None:
 
 async def main() -> None:
     """Основная функция для запуска бота."""
+    # Настройка логирования выполняется только при запуске бота, а не при импорте модуля
+    logging.basicConfig(
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        level=logging.INFO
+    )
+
     # Загружаем переменные окружения из .env файла
     env_path = Path(__file__).parent.parent.parent / ".env"
     load_dotenv(dotenv_path=str(env_path))
@@ -315,14 +316,17 @@ async def main() -> None:
             # Обрабатываем завершение бота
             logger.info("Получен сигнал для завершения работы бота")
         finally:
-        # Ожидаем завершения работы
-        await application.updater.stop()
-        await application.stop()
-        await application.shutdown()
+            # Ожидаем завершения работы
+            await application.updater.stop()
+            await application.stop()
+            await application.shutdown()
     except Exception as e:
         logger.exception(f"Критическая ошибка при запуске бота: {e}")
 
 
 if __name__ == "__main__":
-    # Запускаем бота через asyncio.run()
+    from src.utils.event_loop import install_event_loop_policy
+
+    # Запускаем бота через asyncio.run(), на uvloop, если он установлен
+    install_event_loop_policy()
     asyncio.run(main())
@@ -11,15 +11,24 @@ from telegram.ext import Application, CommandHandler, ContextTypes
 
 logger = logging.getLogger(__name__)
 
+# Тексты ответов на команды: собираются один раз при импорте модуля
+_START_MSG = "Привет! Я бот для работы с DMarket. Используй /help, чтобы увидеть доступные команды."
+_HELP_MSG = (
+    "Доступные команды:\n"
+    "/start — приветствие\n"
+    "/help — показать это сообщение\n"
+    "/dmarket — проверить статус API DMarket\n"
+    "/balance — проверить баланс на DMarket\n"
+    "/arbitrage — поиск арбитражных возможностей"
+)
+
 
 async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Отправляет приветственное сообщение при команде /start."""
     logger.info(f"Пользователь {update.effective_user.id} использовал команду /start")
 
     if update.message:
-        await update.message.reply_text(
-            "Привет! Я бот для работы с DMarket. Используй /help, чтобы увидеть доступные команды.",
-        )
+        await update.message.reply_text(_START_MSG)
 
 
 async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -27,14 +36,7 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     logger.info(f"Пользователь {update.effective_user.id} использовал команду /help")
 
     if update.message:
-        await update.message.reply_text(
-            "Доступные команды:\n"
-            "/start — приветствие\n"
-            "/help — показать это сообщение\n"
-            "/dmarket — проверить статус API DMarket\n"
-            "/balance — проверить баланс на DMarket\n"
-            "/arbitrage — поиск арбитражных возможностей",
-        )
+        await update.message.reply_text(_HELP_MSG)
 
 
 def register_basic_commands(app: Application) -> None:
@@ -21,6 +21,27 @@ from src.telegram_bot.keyboards import (
 
 logger = logging.getLogger(__name__)
 
+# Тексты ответов на команды: собираются один раз при импорте модуля
+_START_MSG = "👋 Привет! Я бот для работы с DMarket API. Выберите действие:"
+_QUICK_ACCESS_MSG = (
+    "⚡ <b>Быстрый доступ</b>\n\n"
+    "Используйте клавиатуру ниже для быстрого доступа к основным функциям:"
+)
+_HELP_MSG = (
+    "❓ <b>Доступные команды:</b>\n"
+    "/start - Начать работу с ботом\n"
+    "/arbitrage - Меню арбитража\n"
+    "/balance - Проверить баланс\n"
+    "/webapp - Открыть DMarket в WebApp"
+)
+_WEBAPP_MSG = (
+    "🌐 <b>DMarket WebApp</b>\n\n"
+    "Нажмите кнопку ниже, чтобы открыть DMarket прямо в Telegram:"
+)
+_MARKETS_MSG = "📊 <b>Сравнение рынков</b>\n\nВыберите рынки для сравнения:"
+_STATUS_CHECKING_MSG = "🔍 <b>Проверка статуса DMarket API...</b>"
+_ARBITRAGE_MENU_MSG = "🔍 <b>Меню арбитража:</b>"
+
 
 async def start_command(update, context):
     """Обрабатывает команду /start.
@@ -32,14 +53,14 @@ async def start_command(update, context):
     """
     # Отправляем приветственное сообщение с inline кнопками
     await update.message.reply_text(
-        "👋 Привет! Я бот для работы с DMarket API. Выберите действие:",
+        _START_MSG,
         reply_markup=get_modern_arbitrage_keyboard(),
         parse_mode=ParseMode.HTML,
     )
 
     # Добавляем постоянную клавиатуру для быстрого доступа с улучшенными параметрами
     await update.message.reply_text(
-        "⚡ <b>Быстрый доступ</b>\n\nИспользуйте клавиатуру ниже для быстрого доступа к основным функциям:",
+        _QUICK_ACCESS_MSG,
         reply_markup=get_permanent_reply_keyboard(),
         parse_mode=ParseMode.HTML,
     )
@@ -58,11 +79,7 @@ async def help_command(update, context):
 
     """
     await update.message.reply_text(
-        "❓ <b>Доступные команды:</b>\n"
-        "/start - Начать работу с ботом\n"
-        "/arbitrage - Меню арбитража\n"
-        "/balance - Проверить баланс\n"
-        "/webapp - Открыть DMarket в WebApp",
+        _HELP_MSG,
         parse_mode=ParseMode.HTML,
         reply_markup=get_modern_arbitrage_keyboard(),
     )
@@ -77,8 +94,7 @@ async def webapp_command(update, context):
 
     """
     await update.message.reply_text(
-        "🌐 <b>DMarket WebApp</b>\n\n"
-        "Нажмите кнопку ниже, чтобы открыть DMarket прямо в Telegram:",
+        _WEBAPP_MSG,
         reply_markup=get_webapp_button(),
         parse_mode=ParseMode.HTML,
     )
@@ -93,7 +109,7 @@ async def markets_command(update, context):
 
     """
     await update.message.reply_text(
-        "📊 <b>Сравнение рынков</b>\n\n" "Выберите рынки для сравнения:",
+        _MARKETS_MSG,
         reply_markup=get_marketplace_comparison_keyboard(),
         parse_mode=ParseMode.HTML,
     )
@@ -108,7 +124,7 @@ async def dmarket_status_command(update, context):
 
     """
     await update.message.reply_text(
-        "🔍 <b>Проверка статуса DMarket API...</b>",
+        _STATUS_CHECKING_MSG,
         parse_mode=ParseMode.HTML,
     )
 
@@ -126,7 +142,7 @@ async def arbitrage_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
     # Используем современную клавиатуру для арбитража
     keyboard = get_modern_arbitrage_keyboard()
     await update.message.reply_text(
-        "🔍 <b>Меню арбитража:</b>",
+        _ARBITRAGE_MENU_MSG,
         reply_markup=keyboard,
         parse_mode=ParseMode.HTML,
     )
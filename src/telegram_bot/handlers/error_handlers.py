@@ -7,7 +7,8 @@
 import logging
 import traceback
 
-from telegram import ParseMode, Update
+from telegram import Update
+from telegram.constants import ParseMode
 from telegram.ext import ContextTypes
 
 from src.telegram_bot.keyboards import get_back_to_arbitrage_keyboard
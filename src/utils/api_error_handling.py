@@ -482,7 +482,7 @@ async def retry_request(
 
     # Ожидаем разрешения от лимитера, если он предоставлен
     if limiter:
-        await limiter.wait_for_call(endpoint_type)
+        await limiter.wait_if_needed(endpoint_type)
 
     attempt = 0
     last_error = None
@@ -494,9 +494,9 @@ async def retry_request(
             # Выполняем запрос
             result = await request_func(**kwargs)
 
-            # Обновляем состояние лимитера после успешного запроса
+            # Сбрасываем счетчик попыток 429 в лимитере после успешного запроса
             if limiter:
-                limiter.update_after_call(endpoint_type)
+                limiter.reset_retry_attempts(endpoint_type)
 
             # Если запрос был повторным, логируем успех
             if attempt > 0:
@@ -539,9 +539,11 @@ async def retry_request(
                 logger.info(f"Прекращаем повторные попытки после {attempt} неудачных попыток")
                 break
 
-            # Обновляем лимитер, если это ошибка превышения лимита
+            # При превышении лимита паузу выдерживает сам лимитер: он учитывает
+            # Retry-After и задерживает остальные запросы к этому эндпоинту
             if status_code == 429 and limiter:
-                limiter.mark_rate_limited(endpoint_type, retry_after or 60)
+                await limiter.handle_429(endpoint_type, retry_after)
+                continue
 
             # Определяем задержку перед следующей попыткой
             delay = retry_strategy.get_delay(attempt, retry_after)
@@ -0,0 +1,33 @@
+"""Настройка цикла событий asyncio.
+
+Если установлен uvloop, бот работает на нем: на сетевой нагрузке (поток
+обновлений рынка по WebSocket, запросы к API) он быстрее стандартного цикла.
+"""
+
+import asyncio
+import logging
+
+try:
+    import uvloop
+except ImportError:  # uvloop необязателен и не поддерживает Windows
+    uvloop = None
+
+logger = logging.getLogger(__name__)
+
+
+def install_event_loop_policy() -> bool:
+    """Делает uvloop циклом событий по умолчанию, если он установлен.
+
+    Вызывается в точке входа до asyncio.run().
+
+    Returns:
+        bool: True, если включен uvloop
+
+    """
+    if uvloop is None:
+        logger.debug("uvloop не установлен, используется стандартный цикл asyncio")
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Используется цикл событий uvloop")
+    return True
@@ -4,6 +4,7 @@ This module provides tools for analyzing market data to detect trends, patterns,
 opportunities in DMarket prices, volumes, and sales history.
 """
 
+import bisect
 import logging
 import math
 from datetime import datetime
@@ -120,14 +121,8 @@ class MarketAnalyzer:
             week_ago = now - (7 * 24 * 60 * 60)
 
             # Find closest points to 24h and 7d ago
-            day_ago_price = prices[0]
-            week_ago_price = prices[0]
-
-            for i, ts in enumerate(timestamps):
-                if abs(ts - day_ago) < abs(timestamps[prices.index(day_ago_price)] - day_ago):
-                    day_ago_price = prices[i]
-                if abs(ts - week_ago) < abs(timestamps[prices.index(week_ago_price)] - week_ago):
-                    week_ago_price = prices[i]
+            day_ago_price = self._price_at(timestamps, prices, day_ago)
+            week_ago_price = self._price_at(timestamps, prices, week_ago)
 
             # Calculate percentage changes
             if day_ago_price > 0:
@@ -170,6 +165,26 @@ class MarketAnalyzer:
             "insufficient_data": False,
         }
 
+    @staticmethod
+    def _price_at(timestamps: list[float], prices: list[float], target: float) -> float:
+        """Find the price of the data point closest in time to the target.
+
+        Args:
+            timestamps: Timestamps sorted in ascending order
+            prices: Prices matching the timestamps
+            target: Timestamp to look up
+
+        Returns:
+            Price of the closest point, the earlier one on a tie
+
+        """
+        i = bisect.bisect_left(timestamps, target)
+        if i == len(timestamps):
+            return prices[-1]
+        if i > 0 and target - timestamps[i - 1] <= timestamps[i] - target:
+            return prices[i - 1]
+        return prices[i]
+
     def _analyze_trend(self, prices: list[float]) -> tuple[str, float]:
         """Analyze the trend in the price data.
 
@@ -183,41 +198,26 @@ class MarketAnalyzer:
         if len(prices) < self.min_data_points:
             return TREND_STABLE, 0.0
 
-        # Use linear regression to determine trend
-        x = np.array(range(len(prices)))
-        y = np.array(prices)
-
-        # Calculate slope and correlation coefficient
-        n = len(prices)
-        sum_x = sum(x)
-        sum_y = sum(y)
-        sum_x_squared = sum(x**2)
-        sum_xy = sum(x * y)
-
-        # Calculate slope
-        slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x_squared - sum_x**2)
+        # Use linear regression to determine trend, vectorized over the whole series
+        y = np.asarray(prices, dtype=np.float64)
+        dx = np.arange(len(y), dtype=np.float64)
+        dx -= dx.mean()
+        dy = y - y.mean()
 
-        # Calculate Pearson correlation coefficient for confidence
-        mean_x = sum_x / n
-        mean_y = sum_y / n
+        # Slope is cov(x, y) / var(x); Pearson correlation gives the confidence
+        ss_x = float(dx @ dx)
+        ss_y = float(dy @ dy)
+        ss_xy = float(dx @ dy)
+        slope = ss_xy / ss_x if ss_x else 0.0
 
-        variance_x = sum((xi - mean_x) ** 2 for xi in x) / n
-        variance_y = sum((yi - mean_y) ** 2 for yi in y) / n
-
-        if variance_x == 0 or variance_y == 0:
-            correlation = 0.0
-        else:
-            covariance = (
-                sum((xi - mean_x) * (yi - mean_y) for xi, yi in zip(x, y, strict=False)) / n
-            )
-            correlation = covariance / (math.sqrt(variance_x) * math.sqrt(variance_y))
+        correlation = 0.0 if ss_x == 0 or ss_y == 0 else ss_xy / math.sqrt(ss_x * ss_y)
 
         # Determine trend type
         confidence = abs(correlation)
 
         # Check for volatility vs stable trend
-        price_range = max(prices) - min(prices)
-        avg_price = sum(prices) / len(prices)
+        price_range = float(y.max() - y.min())
+        avg_price = float(y.mean())
         relative_range = price_range / avg_price if avg_price > 0 else 0
 
         if relative_range > 0.15 and confidence < 0.7:
@@ -2,25 +2,102 @@
 """
 
 import asyncio
+import functools
 import logging
+import random
+import re
 import time
+from collections.abc import Awaitable, Callable
+from types import MappingProxyType
 
 # Настройка логирования
 logger = logging.getLogger(__name__)
 
 # Ограничения запросов для различных типов эндпоинтов DMarket API
 # Значения в запросах в секунду (rps)
-DMARKET_API_RATE_LIMITS = {
-    "market": 2,  # Рыночные запросы (2 запроса в секунду)
-    "trade": 1,  # Торговые операции (1 запрос в секунду)
-    "user": 5,  # Запросы пользовательских данных
-    "balance": 10,  # Запросы баланса
-    "other": 5,  # Прочие запросы
-}
+DMARKET_API_RATE_LIMITS = MappingProxyType(
+    {
+        "market": 2,  # Рыночные запросы (2 запроса в секунду)
+        "trade": 1,  # Торговые операции (1 запрос в секунду)
+        "user": 5,  # Запросы пользовательских данных
+        "balance": 10,  # Запросы баланса
+        "other": 5,  # Прочие запросы
+    },
+)
+
+# Типы эндпоинтов, лимиты которых вдвое ниже для неавторизованных клиентов
+UNAUTHORIZED_HALVED_TYPES = frozenset({"market", "trade"})
 
 # Базовая задержка для экспоненциального отступа при ошибках 429
 BASE_RETRY_DELAY = 1.0  # 1 секунда
 
+# Доля случайного отклонения задержки после 429, чтобы клиенты, получившие ошибку
+# одновременно, не повторяли запросы в один и тот же момент
+RETRY_JITTER = 0.1
+
+# Фрагменты путей DMarket API для каждого типа эндпоинта.
+# Порядок важен: путь относится к первому типу, фрагмент которого в нем найден.
+ENDPOINT_KEYWORDS = MappingProxyType(
+    {
+        # DMarket маркет эндпоинты
+        "market": (
+            "/exchange/v1/market/",
+            "/market/items",
+            "/market/aggregated-prices",
+            "/market/best-offers",
+            "/market/search",
+        ),
+        # DMarket торговые эндпоинты
+        "trade": (
+            "/exchange/v1/market/buy",
+            "/exchange/v1/market/create-offer",
+            "/exchange/v1/user/offers/edit",
+            "/exchange/v1/user/offers/delete",
+        ),
+        # DMarket баланс и аккаунт
+        "balance": (
+            "/api/v1/account/balance",
+            "/account/v1/balance",
+        ),
+        # DMarket пользовательские эндпоинты
+        "user": (
+            "/exchange/v1/user/inventory",
+            "/api/v1/account/details",
+            "/exchange/v1/user/offers",
+            "/exchange/v1/user/targets",
+        ),
+    },
+)
+
+# Фрагменты каждого типа, собранные в одно регулярное выражение при импорте:
+# определение типа — несколько вызовов search вместо перебора подстрок в Python
+_ENDPOINT_PATTERNS = tuple(
+    (endpoint_type, re.compile("|".join(map(re.escape, keywords))))
+    for endpoint_type, keywords in ENDPOINT_KEYWORDS.items()
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _classify_endpoint(path: str) -> str:
+    """Определяет тип эндпоинта по пути, приведенному к нижнему регистру.
+
+    Клиент обращается к небольшому набору постоянных путей, поэтому результат
+    кешируется: повторный запрос к тому же пути не проверяет фрагменты заново,
+    сколько бы их ни было в ENDPOINT_KEYWORDS.
+
+    Args:
+        path: Путь эндпоинта API в нижнем регистре
+
+    Returns:
+        Тип эндпоинта ("market", "trade", "user", "balance", "other")
+
+    """
+    for endpoint_type, pattern in _ENDPOINT_PATTERNS:
+        if pattern.search(path):
+            return endpoint_type
+
+    return "other"
+
 
 class RateLimiter:
     """Класс для контроля скорости запросов к API DMarket.
@@ -32,18 +109,43 @@ class RateLimiter:
     - Реализовывать экспоненциальную задержку для обработки ошибок 429
     """
 
-    def __init__(self, is_authorized: bool = True):
+    # Без __dict__ у экземпляров: ограничитель может создаваться на каждого клиента API
+    __slots__ = (
+        "is_authorized",
+        "rate_limits",
+        "custom_limits",
+        "last_request_times",
+        "reset_times",
+        "remaining_requests",
+        "retry_attempts",
+        "_clock",
+        "_sleep",
+    )
+
+    def __init__(
+        self,
+        is_authorized: bool = True,
+        clock: Callable[[], float] | None = None,
+        sleep: Callable[[float], Awaitable[object]] | None = None,
+    ):
         """Инициализирует контроллер лимитов запросов.
 
         Args:
             is_authorized: Является ли клиент авторизованным
                 (влияет на доступные лимиты запросов)
+            clock: Источник монотонного времени (по умолчанию time.monotonic)
+            sleep: Функция ожидания (по умолчанию asyncio.sleep)
 
         """
         self.is_authorized = is_authorized
 
+        # Источники времени и ожидания; None — стандартные функции, которые
+        # ищутся при каждом вызове
+        self._clock = clock
+        self._sleep = sleep
+
         # Лимиты запросов для разных типов эндпоинтов
-        self.rate_limits = DMARKET_API_RATE_LIMITS.copy()
+        self.rate_limits = dict(DMARKET_API_RATE_LIMITS)
 
         # Пользовательские лимиты запросов
         self.custom_limits = {}
@@ -51,7 +153,7 @@ class RateLimiter:
         # Временные точки последних запросов для разных типов эндпоинтов
         self.last_request_times: dict[str, float] = {}
 
-        # Временные метки сброса лимитов для каждого эндпоинта
+        # Моменты сброса лимитов для каждого эндпоинта (по часам ограничителя)
         self.reset_times: dict[str, float] = {}
 
         # Счетчики оставшихся запросов для каждого эндпоинта
@@ -64,6 +166,17 @@ class RateLimiter:
             f"Инициализирован контроллер лимитов запросов API (авторизован: {is_authorized})"
         )
 
+    def _now(self) -> float:
+        """Возвращает текущее время по часам ограничителя."""
+        return self._clock() if self._clock is not None else time.monotonic()
+
+    async def _wait(self, delay: float) -> None:
+        """Ожидает указанное время функцией ожидания ограничителя."""
+        if self._sleep is not None:
+            await self._sleep(delay)
+        else:
+            await asyncio.sleep(delay)
+
     def get_endpoint_type(self, path: str) -> str:
         """Определяет тип эндпоинта по его пути для DMarket API.
 
@@ -74,48 +187,7 @@ class RateLimiter:
             Тип эндпоинта ("market", "trade", "user", "balance", "other")
 
         """
-        path = path.lower()
-
-        # DMarket маркет эндпоинты
-        market_keywords = [
-            "/exchange/v1/market/",
-            "/market/items",
-            "/market/aggregated-prices",
-            "/market/best-offers",
-            "/market/search",
-        ]
-        if any(keyword in path for keyword in market_keywords):
-            return "market"
-
-        # DMarket торговые эндпоинты
-        trade_keywords = [
-            "/exchange/v1/market/buy",
-            "/exchange/v1/market/create-offer",
-            "/exchange/v1/user/offers/edit",
-            "/exchange/v1/user/offers/delete",
-        ]
-        if any(keyword in path for keyword in trade_keywords):
-            return "trade"
-
-        # DMarket баланс и аккаунт
-        balance_keywords = [
-            "/api/v1/account/balance",
-            "/account/v1/balance",
-        ]
-        if any(keyword in path for keyword in balance_keywords):
-            return "balance"
-
-        # DMarket пользовательские эндпоинты
-        user_keywords = [
-            "/exchange/v1/user/inventory",
-            "/api/v1/account/details",
-            "/exchange/v1/user/offers",
-            "/exchange/v1/user/targets",
-        ]
-        if any(keyword in path for keyword in user_keywords):
-            return "user"
-
-        return "other"
+        return _classify_endpoint(path.lower())
 
     def update_from_headers(self, headers: dict[str, str]) -> None:
         """Обновляет лимиты запросов на основе заголовков ответа DMarket API.
@@ -170,10 +242,11 @@ class RateLimiter:
                 if remaining <= 0 and reset_header in headers:
                     try:
                         reset_time = float(headers[reset_header])
-                        self.reset_times[endpoint_type] = reset_time
 
-                        # Вычисляем время ожидания до сброса
+                        # Заголовок содержит unix-время сброса: переводим его
+                        # в монотонные часы, не зависящие от перевода системных
                         wait_time = max(0, reset_time - time.time())
+                        self.reset_times[endpoint_type] = self._now() + wait_time
                         logger.warning(
                             f"Достигнут лимит запросов для {endpoint_type}. "
                             f"Сброс через {wait_time:.2f} сек",
@@ -186,53 +259,95 @@ class RateLimiter:
     async def wait_if_needed(self, endpoint_type: str = "other") -> None:
         """Ожидает, если необходимо, перед выполнением запроса указанного типа.
 
+        Момент отправки резервируется до сна, поэтому параллельные корутины
+        одного типа эндпоинта получают разные слоты и ждут одновременно,
+        а не выстраиваются в очередь за одной спящей. Проверка и резервирование
+        не содержат await, так что отдельная блокировка не нужна.
+
+        Args:
+            endpoint_type: Тип эндпоинта
+
+        """
+        # Ждем окончания ограничения, пока оно не истечет. Время читается один
+        # раз за проход, и резервирование видит тот же момент, что и проверка
+        while True:
+            now = self._now()
+            wait_time = self._get_reset_wait_time(endpoint_type, now)
+            if wait_time <= 0:
+                break
+            await self._wait(wait_time)
+
+        wait_time = self._reserve_request_slot(endpoint_type, now)
+        if wait_time > 0:
+            await self._wait(wait_time)
+
+    def _get_reset_wait_time(self, endpoint_type: str, now: float) -> float:
+        """Возвращает время до сброса ограничения эндпоинта.
+
+        Истекшее ограничение удаляется, а счетчик оставшихся запросов
+        восстанавливается.
+
         Args:
             endpoint_type: Тип эндпоинта
+            now: Текущее время по часам ограничителя
+
+        Returns:
+            Время ожидания в секундах (0, если ограничения нет)
 
         """
-        # Проверяем, не находится ли эндпоинт под ограничением
-        if endpoint_type in self.reset_times:
-            reset_time = self.reset_times[endpoint_type]
-            current_time = time.time()
+        if endpoint_type not in self.reset_times:
+            return 0
+
+        wait_time = self.reset_times[endpoint_type] - now
 
-            # Если время сброса еще не наступило
-            if reset_time > current_time:
-                wait_time = reset_time - current_time
-                logger.info(f"Ожидание сброса лимита для {endpoint_type}: {wait_time:.2f} сек")
-                await asyncio.sleep(wait_time)
+        # Если время сброса еще не наступило
+        if wait_time > 0:
+            logger.info(f"Ожидание сброса лимита для {endpoint_type}: {wait_time:.2f} сек")
+            return wait_time
 
-                # После ожидания удаляем запись о временном ограничении
-                del self.reset_times[endpoint_type]
-                self.remaining_requests[endpoint_type] = self.rate_limits.get(endpoint_type, 5)
+        # После ожидания удаляем запись о временном ограничении
+        del self.reset_times[endpoint_type]
+        self.remaining_requests[endpoint_type] = self.rate_limits.get(endpoint_type, 5)
+        return 0
 
+    def _reserve_request_slot(self, endpoint_type: str, now: float) -> float:
+        """Резервирует ближайший разрешенный момент отправки запроса.
+
+        Запросы одного типа идут не чаще одного раза в 1/лимит секунд, поэтому
+        ни в одном окне длиной в секунду их не больше лимита. Накопление
+        запросов за время простоя (корзина токенов емкостью больше одного)
+        пропустило бы в таком окне больше лимита, поэтому его нет.
+
+        Args:
+            endpoint_type: Тип эндпоинта
+            now: Текущее время по часам ограничителя
+
+        Returns:
+            Время ожидания до зарезервированного момента в секундах
+
+        """
         # Получаем лимит запросов в секунду
         rate_limit = self.get_rate_limit(endpoint_type)
 
         # Если лимит не указан или равен бесконечности, нет необходимости ждать
         if rate_limit <= 0:
-            return
+            return 0
 
         # Минимальный интервал между запросами в секундах
         min_interval = 1.0 / rate_limit
 
-        # Время последнего запроса этого типа
-        last_time = self.last_request_times.get(endpoint_type, 0)
-        current_time = time.time()
-
-        # Если с момента последнего запроса прошло меньше минимального интервала
-        if current_time - last_time < min_interval:
-            # Вычисляем необходимое время ожидания
-            wait_time = min_interval - (current_time - last_time)
+        # Ближайший момент после последнего запроса этого типа
+        send_time = max(now, self.last_request_times.get(endpoint_type, 0) + min_interval)
 
-            # Если время ожидания значительное, логируем его
-            if wait_time > 0.1:
-                logger.debug(f"Соблюдение лимита {endpoint_type}: ожидание {wait_time:.3f} сек")
+        # Занимаем слот сразу, чтобы следующий вызов встал за нами
+        self.last_request_times[endpoint_type] = send_time
+        wait_time = send_time - now
 
-            # Ожидаем необходимое время
-            await asyncio.sleep(wait_time)
+        # Если время ожидания значительное, логируем его
+        if wait_time > 0.1:
+            logger.debug(f"Соблюдение лимита {endpoint_type}: ожидание {wait_time:.3f} сек")
 
-        # Обновляем время последнего запроса
-        self.last_request_times[endpoint_type] = time.time()
+        return wait_time
 
     async def handle_429(
         self, endpoint_type: str, retry_after: int | None = None
@@ -251,21 +366,22 @@ class RateLimiter:
         current_attempts = self.retry_attempts.get(endpoint_type, 0) + 1
         self.retry_attempts[endpoint_type] = current_attempts
 
-        # Если есть заголовок Retry-After, используем его значение
+        # Если есть заголовок Retry-After, используем его значение. Отклонение
+        # только в большую сторону: раньше указанного сервером повторять нельзя
         if retry_after is not None and retry_after > 0:
-            wait_time = retry_after
+            wait_time = retry_after * (1 + random.uniform(0, RETRY_JITTER))
         else:
-            # Иначе используем экспоненциальную задержку с небольшим случайным компонентом
-            # Base * 2^(attempts - 1) + random jitter
+            # Иначе используем экспоненциальную задержку со случайным отклонением
+            # Base * 2^(attempts - 1) ± 10%
             base_wait = BASE_RETRY_DELAY * (2 ** (current_attempts - 1))
-            jitter = 0.1 * base_wait * (0.5 - (time.time() % 1.0))  # 10% случайное отклонение
+            jitter = base_wait * random.uniform(-RETRY_JITTER, RETRY_JITTER)
             wait_time = base_wait + jitter
 
             # Ограничиваем максимальное время ожидания 30 секундами
             wait_time = min(wait_time, 30.0)
 
         # Устанавливаем время сброса лимита
-        self.reset_times[endpoint_type] = time.time() + wait_time
+        self.reset_times[endpoint_type] = self._now() + wait_time
 
         logger.warning(
             f"Превышен лимит запросов для {endpoint_type} (попытка {current_attempts}). "
@@ -273,7 +389,7 @@ class RateLimiter:
         )
 
         # Выполняем ожидание
-        await asyncio.sleep(wait_time)
+        await self._wait(wait_time)
 
         return wait_time, current_attempts
 
@@ -304,7 +420,7 @@ class RateLimiter:
         # Проверяем стандартные лимиты
         if endpoint_type in self.rate_limits:
             # Для неавторизованных пользователей снижаем лимиты
-            if not self.is_authorized and endpoint_type in ["market", "trade"]:
+            if not self.is_authorized and endpoint_type in UNAUTHORIZED_HALVED_TYPES:
                 return self.rate_limits[endpoint_type] / 2  # 50% от авторизованного лимита
             return self.rate_limits[endpoint_type]
 
@@ -333,7 +449,7 @@ class RateLimiter:
 
         """
         # Если эндпоинт находится под ограничением
-        if endpoint_type in self.reset_times and time.time() < self.reset_times[endpoint_type]:
+        if endpoint_type in self.reset_times and self._now() < self.reset_times[endpoint_type]:
             return 0
 
         # Возвращаем оставшееся количество запросов (или максимальное значение, если неизвестно)
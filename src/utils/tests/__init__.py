@@ -1,9 +0,0 @@
-"""Tests for utils module."""
-
-import sys
-from pathlib import Path
-
-# Добавляем корневую директорию проекта в PYTHONPATH
-project_root = Path(__file__).parent.parent.parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
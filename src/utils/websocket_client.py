@@ -2,35 +2,105 @@
 
 Provides a client for real-time updates from DMarket WebSocket API.
 Based on DMarket API documentation at https://docs.dmarket.com/v1/swagger.html
+
+The bot entry points switch asyncio to uvloop when it is installed
+(see src.utils.event_loop), which speeds up the message stream.
 """
 
 import asyncio
 import json
 import logging
+import random
+import socket
 import time
 import uuid
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from types import MappingProxyType
 from typing import Any
 
 import aiohttp
 from aiohttp import ClientSession
 
+try:
+    import orjson
+except ImportError:  # orjson is optional: without it messages are parsed with json
+    orjson = None
+
 from src.dmarket.dmarket_api import DMarketAPI
 
 logger = logging.getLogger(__name__)
 
+# Decoder for incoming frames; orjson.JSONDecodeError subclasses json.JSONDecodeError
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 class DMarketWebSocketClient:
     """WebSocket client for DMarket API."""
 
+    # No per-instance __dict__; subscriptions are a set for O(1) membership checks
+    __slots__ = (
+        "api_client",
+        "session",
+        "ws_connection",
+        "is_connected",
+        "reconnect_attempts",
+        "max_reconnect_attempts",
+        "reconnect_interval",
+        "max_reconnect_interval",
+        "reconnect_jitter",
+        "heartbeat",
+        "batch_subscriptions",
+        "handlers",
+        "dispatch_workers",
+        "_inbox",
+        "_workers",
+        "authenticated",
+        "subscriptions",
+        "connection_id",
+    )
+
     # WebSocket endpoint
     WS_ENDPOINT = "wss://ws.dmarket.com"
 
-    def __init__(self, api_client: DMarketAPI):
+    # How long resolved DNS entries are kept by the session, in seconds
+    DNS_CACHE_TTL = 300
+
+    # permessage-deflate window bits; the server may decline compression
+    WS_COMPRESS = 15
+
+    # Kernel TCP keepalive: probe after 30s idle, every 10s, drop after 3 misses.
+    # Options missing on the current platform are skipped.
+    TCP_KEEPALIVE_OPTIONS = MappingProxyType(
+        {"TCP_KEEPIDLE": 30, "TCP_KEEPINTVL": 10, "TCP_KEEPCNT": 3},
+    )
+
+    def __init__(
+        self,
+        api_client: DMarketAPI,
+        max_reconnect_attempts: int = 10,
+        reconnect_interval: float = 1.0,
+        max_reconnect_interval: float = 60.0,
+        reconnect_jitter: float = 1.0,
+        dispatch_workers: int = 1,
+        inbox_size: int = 1024,
+        heartbeat: float | None = 30.0,
+        batch_subscriptions: bool = False,
+    ):
         """Initialize WebSocket client.
 
         Args:
             api_client: DMarket API client for authentication
+            max_reconnect_attempts: Reconnect attempts before giving up
+            reconnect_interval: Base reconnect delay in seconds, doubled on each attempt
+            max_reconnect_interval: Upper bound for the reconnect delay in seconds
+            reconnect_jitter: Maximum random delay in seconds added to each reconnect
+            dispatch_workers: Tasks running message handlers; with more than one,
+                messages are no longer handled in arrival order
+            inbox_size: Messages buffered between the read loop and the handlers
+            heartbeat: Interval in seconds for WebSocket pings; None disables them
+                and leaves liveness checks to TCP keepalive
+            batch_subscriptions: Resubscribe and unsubscribe with one multi-topic
+                message; off by default because DMarket has not confirmed the format
 
         """
         self.api_client = api_client
@@ -38,16 +108,26 @@ class DMarketWebSocketClient:
         self.ws_connection = None
         self.is_connected = False
         self.reconnect_attempts = 0
-        self.max_reconnect_attempts = 10
+        self.max_reconnect_attempts = max_reconnect_attempts
+        self.reconnect_interval = reconnect_interval
+        self.max_reconnect_interval = max_reconnect_interval
+        self.reconnect_jitter = reconnect_jitter
+        self.heartbeat = heartbeat
+        self.batch_subscriptions = batch_subscriptions
 
         # Message handlers by event type
         self.handlers = {}
 
+        # Received messages waiting for handlers; when it is full, reading pauses
+        self.dispatch_workers = dispatch_workers
+        self._inbox: asyncio.Queue[str | bytes] = asyncio.Queue(maxsize=inbox_size)
+        self._workers: list[asyncio.Task] = []
+
         # Authenticated state
         self.authenticated = False
 
         # Subscriptions
-        self.subscriptions = set()
+        self.subscriptions: set[str] = set()
 
         # Connection ID for tracking
         self.connection_id = str(uuid.uuid4())
@@ -66,16 +146,20 @@ class DMarketWebSocketClient:
         logger.info(f"Connecting to DMarket WebSocket ({self.WS_ENDPOINT})...")
 
         try:
-            # Create new session if needed
+            # Create new session if needed; reconnects reuse it and its DNS cache
             if self.session is None or self.session.closed:
-                self.session = aiohttp.ClientSession()
+                self.session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(ttl_dns_cache=self.DNS_CACHE_TTL),
+                )
 
             # Connect to WebSocket
             self.ws_connection = await self.session.ws_connect(
                 self.WS_ENDPOINT,
                 timeout=30.0,
-                heartbeat=30.0,
+                heartbeat=self.heartbeat,
+                compress=self.WS_COMPRESS,
             )
+            self._enable_tcp_keepalive()
 
             self.is_connected = True
             self.reconnect_attempts = 0
@@ -95,8 +179,24 @@ class DMarketWebSocketClient:
             self.is_connected = False
             return False
 
+    def _enable_tcp_keepalive(self) -> None:
+        """Turn on kernel TCP keepalive for the WebSocket connection."""
+        sock = self.ws_connection.get_extra_info("socket")
+        if sock is None:
+            return
+
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            for option, value in self.TCP_KEEPALIVE_OPTIONS.items():
+                if hasattr(socket, option):
+                    sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+        except OSError as e:
+            logger.debug(f"Failed to enable TCP keepalive: {e}")
+
     async def close(self) -> None:
         """Close WebSocket connection."""
+        await self._stop_workers()
+
         if self.ws_connection:
             logger.info("Closing WebSocket connection...")
 
@@ -116,34 +216,77 @@ class DMarketWebSocketClient:
     async def listen(self) -> None:
         """Listen for WebSocket messages in a loop.
 
-        This method should be run in a separate task.
+        This method should be run in a separate task. Messages are handed over
+        to dispatch workers, so a slow handler does not hold up reading.
         """
-        while self.is_connected:
-            try:
-                message = await self.ws_connection.receive()
-
-                if message.type == aiohttp.WSMsgType.TEXT:
-                    await self._handle_message(message.data)
+        self._start_workers()
 
-                elif message.type == aiohttp.WSMsgType.CLOSED:
-                    logger.warning("WebSocket connection closed by server")
+        try:
+            while self.is_connected:
+                try:
+                    message = await self.ws_connection.receive()
+
+                    # Binary frames go to the decoder as bytes, without a decode to str
+                    if message.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                        await self._inbox.put(message.data)
+
+                    elif message.type == aiohttp.WSMsgType.CLOSED:
+                        logger.warning("WebSocket connection closed by server")
+                        self.is_connected = False
+                        await self._attempt_reconnect()
+
+                    elif message.type == aiohttp.WSMsgType.ERROR:
+                        logger.error(f"WebSocket connection error: {message.data}")
+                        self.is_connected = False
+                        await self._attempt_reconnect()
+
+                except (aiohttp.ClientError, asyncio.CancelledError) as e:
+                    if isinstance(e, asyncio.CancelledError):
+                        # Task was cancelled, just exit
+                        logger.info("WebSocket listen task cancelled")
+                        return
+
+                    logger.error(f"WebSocket error: {e}")
                     self.is_connected = False
                     await self._attempt_reconnect()
 
-                elif message.type == aiohttp.WSMsgType.ERROR:
-                    logger.error(f"WebSocket connection error: {message.data}")
-                    self.is_connected = False
-                    await self._attempt_reconnect()
+            # The connection is gone for good: let handlers finish what was received
+            await self._inbox.join()
+        finally:
+            await self._stop_workers()
 
-            except (aiohttp.ClientError, asyncio.CancelledError) as e:
-                if isinstance(e, asyncio.CancelledError):
-                    # Task was cancelled, just exit
-                    logger.info("WebSocket listen task cancelled")
-                    break
+    def _start_workers(self) -> None:
+        """Start the tasks that pass received messages to handlers."""
+        self._workers = [task for task in self._workers if not task.done()]
+        for _ in range(self.dispatch_workers - len(self._workers)):
+            self._workers.append(asyncio.create_task(self._dispatch()))
 
-                logger.error(f"WebSocket error: {e}")
-                self.is_connected = False
-                await self._attempt_reconnect()
+    async def _stop_workers(self) -> None:
+        """Cancel the dispatch tasks and drop messages nobody will handle.
+
+        A handler may call close() from inside a worker; that worker is left
+        running so it is not cancelled halfway through close().
+        """
+        current = asyncio.current_task()
+        workers = [task for task in self._workers if task is not current]
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._workers = [task for task in self._workers if task is current]
+
+        if not self._workers:
+            while not self._inbox.empty():
+                self._inbox.get_nowait()
+                self._inbox.task_done()
+
+    async def _dispatch(self) -> None:
+        """Take received messages from the inbox and handle them."""
+        while True:
+            data = await self._inbox.get()
+            try:
+                await self._handle_message(data)
+            finally:
+                self._inbox.task_done()
 
     async def _attempt_reconnect(self) -> None:
         """Attempt to reconnect to WebSocket."""
@@ -152,10 +295,10 @@ class DMarketWebSocketClient:
             return
 
         self.reconnect_attempts += 1
-        delay = min(2**self.reconnect_attempts, 60)  # Exponential backoff with 60s max
+        delay = self._reconnect_delay()
 
         logger.info(
-            f"Attempting to reconnect in {delay} seconds (attempt {self.reconnect_attempts})"
+            f"Attempting to reconnect in {delay:.2f} seconds (attempt {self.reconnect_attempts})"
         )
         await asyncio.sleep(delay)
 
@@ -163,7 +306,20 @@ class DMarketWebSocketClient:
         if not success:
             logger.warning(f"Reconnect attempt {self.reconnect_attempts} failed")
 
-    async def _handle_message(self, data: str) -> None:
+    def _reconnect_delay(self) -> float:
+        """Calculate the delay before the current reconnect attempt.
+
+        Exponential backoff capped at max_reconnect_interval, plus random jitter
+        so that clients dropped at the same moment do not reconnect in lockstep.
+
+        Returns:
+            float: Delay in seconds
+
+        """
+        backoff = self.reconnect_interval * 2**self.reconnect_attempts
+        return min(backoff, self.max_reconnect_interval) + random.uniform(0, self.reconnect_jitter)
+
+    async def _handle_message(self, data: str | bytes) -> None:
         """Handle incoming WebSocket message.
 
         Args:
@@ -171,7 +327,7 @@ class DMarketWebSocketClient:
 
         """
         try:
-            message = json.loads(data)
+            message = _json_loads(data)
 
             # Handle authentication response
             if "type" in message and message["type"] == "auth":
@@ -244,6 +400,10 @@ class DMarketWebSocketClient:
 
         logger.info(f"Resubscribing to {len(self.subscriptions)} topics")
 
+        if self.batch_subscriptions:
+            await self.subscribe_many(self.subscriptions)
+            return
+
         for topic in self.subscriptions.copy():
             await self.subscribe(topic)
 
@@ -254,6 +414,10 @@ class DMarketWebSocketClient:
 
         logger.info(f"Unsubscribing from {len(self.subscriptions)} topics")
 
+        if self.batch_subscriptions:
+            await self.unsubscribe_many(self.subscriptions)
+            return
+
         for topic in self.subscriptions.copy():
             await self.unsubscribe(topic)
 
@@ -319,6 +483,60 @@ class DMarketWebSocketClient:
 
         return True
 
+    async def subscribe_many(self, topics: Iterable[str]) -> bool:
+        """Subscribe to several topics with a single message.
+
+        The multi-topic {"type": "subscribe", "topics": [...]} message is not
+        documented by DMarket; use only with servers known to accept it.
+
+        Args:
+            topics: Topics to subscribe to
+
+        Returns:
+            bool: True if subscription was successful
+
+        """
+        topics = list(dict.fromkeys(topics))
+        if not topics:
+            return True
+
+        if not self.ws_connection or not self.is_connected:
+            logger.error(f"Cannot subscribe to {len(topics)} topics: WebSocket not connected")
+            return False
+
+        # One frame for all topics instead of one frame per topic
+        await self.ws_connection.send_json({"type": "subscribe", "topics": topics})
+        logger.info(f"Subscribed to {len(topics)} topics")
+
+        self.subscriptions.update(topics)
+        return True
+
+    async def unsubscribe_many(self, topics: Iterable[str]) -> bool:
+        """Unsubscribe from several topics with a single message.
+
+        Uses the same undocumented multi-topic format as subscribe_many.
+
+        Args:
+            topics: Topics to unsubscribe from
+
+        Returns:
+            bool: True if unsubscription was successful
+
+        """
+        topics = list(dict.fromkeys(topics))
+        if not topics:
+            return True
+
+        if not self.ws_connection or not self.is_connected:
+            logger.error(f"Cannot unsubscribe from {len(topics)} topics: WebSocket not connected")
+            return False
+
+        await self.ws_connection.send_json({"type": "unsubscribe", "topics": topics})
+        logger.info(f"Unsubscribed from {len(topics)} topics")
+
+        self.subscriptions.difference_update(topics)
+        return True
+
     def register_handler(self, event_type: str, handler: Callable[[dict[str, Any]], None]) -> None:
         """Register a handler for an event type.
 
@@ -36,6 +36,17 @@ logger = logging.getLogger(__name__)
 # Устанавливаем часовой пояс для APScheduler
 os.environ["TZ"] = "Europe/Moscow"
 
+# Тексты ответов команды /status (используются также в тестах)
+STATUS_CHECKING_MSG = "Проверка статуса API DMarket..."
+STATUS_KEYS_OK_MSG = (
+    "✅ API ключи настроены!\n\n"
+    "API endpoint доступен для использования."
+)
+STATUS_KEYS_MISSING_MSG = (
+    "❌ API ключи не настроены.\n\n"
+    "Пожалуйста, установите DMARKET_PUBLIC_KEY и DMARKET_SECRET_KEY в .env файле."
+)
+
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Обрабатывает команду /start."""
@@ -82,22 +93,16 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
 
 async def dmarket_status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Проверяет статус API DMarket."""
-    message = await update.message.reply_text("Проверка статуса API DMarket...")
+    message = await update.message.reply_text(STATUS_CHECKING_MSG)
 
     # Проверяем наличие ключей API
     public_key = os.getenv("DMARKET_PUBLIC_KEY")
     secret_key = os.getenv("DMARKET_SECRET_KEY")
 
     if public_key and secret_key:
-        status_text = (
-            "✅ API ключи настроены!\n\n"
-            "API endpoint доступен для использования."
-        )
+        status_text = STATUS_KEYS_OK_MSG
     else:
-        status_text = (
-            "❌ API ключи не настроены.\n\n"
-            "Пожалуйста, установите DMARKET_PUBLIC_KEY и DMARKET_SECRET_KEY в .env файле."
-        )
+        status_text = STATUS_KEYS_MISSING_MSG
 
     await message.edit_text(status_text)
 
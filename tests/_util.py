@@ -0,0 +1,129 @@
+"""Вспомогательные функции для тестов."""
+
+from collections.abc import Iterable
+from types import MappingProxyType
+from unittest.mock import AsyncMock, MagicMock
+
+
+def assert_contains_all(text: str, needles: Iterable[str]) -> None:
+    """Проверяет, что текст содержит все указанные подстроки.
+
+    Args:
+        text: Проверяемый текст
+        needles: Подстроки, которые должны присутствовать в тексте
+
+    """
+    missing = [needle for needle in needles if needle not in text]
+    assert not missing, f"missing: {missing}"
+
+
+def call_text(mock, param="text"):
+    """Возвращает текст из последнего вызова мока отправки или правки сообщения.
+
+    Обработчики передают текст то позиционно, то именованным аргументом.
+
+    Args:
+        mock: Мок метода, например callback_query.edit_message_text
+        param: Имя аргумента с текстом
+
+    Returns:
+        str: Переданный текст или пустая строка, если текста в вызове нет
+
+    """
+    call = mock.call_args
+    return call.kwargs.get(param, call.args[0] if call.args else "")
+
+
+class FakeRequest:
+    """Простая асинхронная замена DMarketAPI._request.
+
+    Возвращает заранее заданный ответ и записывает аргументы вызовов в calls.
+    В отличие от AsyncMock не проходит через механизм моков на каждом вызове.
+    """
+
+    def __init__(self, response=None, exception: Exception | None = None) -> None:
+        self.response = response
+        self.exception = exception
+        self.calls: list[tuple[tuple, dict]] = []
+
+    async def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        if self.exception is not None:
+            raise self.exception
+        return self.response
+
+
+# Прототип объекта Update: статичные атрибуты собираются один раз при импорте,
+# а каждая фикстура лишь применяет их к новому MagicMock через configure_mock.
+# Так тесты не платят за MagicMock(spec=...) и не делят между собой состояние.
+UPDATE_PROTOTYPE = MappingProxyType(
+    {
+        "effective_chat.id": 12345,
+        "effective_user.id": 12345,
+        "effective_user.mention_html.return_value": "@username",
+        "message.chat_id": 12345,
+        "message.chat.id": 12345,
+        "message.from_user.id": 12345,
+        "message.from_user.first_name": "Test User",
+        "message.from_user.username": "testuser",
+        "message.text": "/start",
+        "callback_query": None,
+    },
+)
+
+# Методы, которые обработчики ожидают через await, — создаются заново для каждого теста
+UPDATE_ASYNC_METHODS = (
+    "message.reply_text",
+    "message.reply_html",
+    "message.reply_markdown",
+)
+
+
+def make_mock_update(**overrides):
+    """Создает мок объекта Update по прототипу.
+
+    Args:
+        **overrides: Атрибуты в формате configure_mock, переопределяющие прототип
+
+    Returns:
+        MagicMock: Новый мок Update
+
+    """
+    update = MagicMock()
+    update.configure_mock(**{**UPDATE_PROTOTYPE, **overrides})
+    for path in UPDATE_ASYNC_METHODS:
+        parent_path, _, name = path.rpartition(".")
+        parent = update
+        for part in parent_path.split("."):
+            parent = getattr(parent, part)
+        setattr(parent, name, AsyncMock())
+    return update
+
+
+# Методы CallbackQuery, которые обработчики ожидают через await
+CALLBACK_QUERY_ASYNC_METHODS = (
+    "answer",
+    "edit_message_text",
+    "edit_message_reply_markup",
+)
+
+
+def make_callback_update():
+    """Создает мок объекта Update с callback-запросом.
+
+    Returns:
+        MagicMock: Новый мок Update с callback_query.data = None
+
+    """
+    # telegram импортируется здесь, чтобы тесты без бота не платили за его импорт
+    from telegram import Message, Update
+
+    update = MagicMock(spec=Update)
+    update.message = MagicMock(spec=Message)
+    update.message.reply_text = AsyncMock()
+    update.callback_query = MagicMock()
+    update.callback_query.message = MagicMock()
+    update.callback_query.data = None
+    for name in CALLBACK_QUERY_ASYNC_METHODS:
+        setattr(update.callback_query, name, AsyncMock())
+    return update
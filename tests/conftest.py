@@ -1,10 +1,94 @@
 """Configuration module for running pytest.
 """
 
+import asyncio
+import importlib
 import os
 import sys
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from tests._util import make_callback_update, make_mock_update
 
 # Add src directory to path so that imports in tests work correctly
 src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
 if src_path not in sys.path:
     sys.path.insert(0, src_path)
+
+
+@pytest.fixture(scope="session")
+def bot_v2_module():
+    """Импортирует модуль бота один раз за сессию.
+
+    Тесты и строки patch("src.telegram_bot.bot_v2....") после этого берут модуль
+    из sys.modules, а не разрешают его заново. Фикстуру запрашивают только
+    тесты бота, остальные не платят за импорт его зависимостей.
+    """
+    return importlib.import_module("src.telegram_bot.bot_v2")
+
+
+_real_asyncio_sleep = asyncio.sleep
+
+
+async def _instant_sleep(delay, result=None):
+    """Заменяет asyncio.sleep: отдает управление циклу событий, но не ждет."""
+    await _real_asyncio_sleep(0)
+    return result
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """Убирает реальные ожидания из тестов.
+
+    Повторные попытки, паузы между запросами и циклы опроса иначе тратят
+    секунды реального времени. asyncio.sleep по-прежнему переключает задачи,
+    поэтому код, рассчитывающий на кооперативную многозадачность, не зависает.
+    Тесты, которым нужен собственный мок sleep, патчат его поверх.
+    """
+    monkeypatch.setattr(asyncio, "sleep", _instant_sleep)
+    monkeypatch.setattr(time, "sleep", lambda *_: None)
+
+
+@pytest.fixture
+def mock_update():
+    """Создает мок объекта Update для Telegram."""
+    return make_mock_update()
+
+
+@pytest.fixture
+def callback_update():
+    """Создает мок Update с callback-запросом; данные запроса тест задает сам."""
+    return make_callback_update()
+
+
+@pytest.fixture
+def mock_context_empty():
+    """Создает мок объекта Context с пустыми user_data."""
+    context = MagicMock()
+    context.user_data = {}
+    return context
+
+
+@pytest.fixture
+def mock_context_with_game():
+    """Создает мок объекта Context с выбранной игрой csgo в user_data."""
+    context = MagicMock()
+    context.user_data = {"current_game": "csgo"}
+    return context
+
+
+# Методы логгера, которые вызывает тестируемый код
+LOGGER_METHODS = ("debug", "info", "warning", "error", "critical", "exception")
+
+
+@pytest.fixture
+def mock_logger():
+    """Создает заглушку логгера для тестирования функций логирования и обработки ошибок.
+
+    Вместо MagicMock(spec=logging.Logger), который разбирает весь класс Logger
+    при каждом создании, — простое пространство имен с моками нужных методов.
+    """
+    return SimpleNamespace(**{name: MagicMock() for name in LOGGER_METHODS})
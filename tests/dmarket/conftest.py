@@ -21,27 +21,24 @@ def mock_api_client():
 
 @pytest.fixture
 def dmarket_api():
-    """Фикстура для создания инстанса DMarketAPI с моками.
-    Обходит необходимость наличия реальных ключей API.
-    """
-    with patch("src.dmarket.dmarket_api.DMarketAPI.__init__", return_value=None) as mock_init:
-        from src.dmarket.dmarket_api import DMarketAPI
+    """Создает экземпляр DMarketAPI для тестов с моками.
 
-        api = DMarketAPI.__new__(DMarketAPI)
+    Общая фикстура для тестов клиента. Остается function-scoped: тесты
+    переключают enable_cache и подменяют методы экземпляра.
+    """
+    from src.dmarket.dmarket_api import DMarketAPI
 
-        # Мокируем необходимые атрибуты
-        api.public_key = "mock_public_key"
-        api.secret_key = "mock_secret_key"
-        api.client = AsyncMock()
-        api._generate_headers = MagicMock(
-            return_value={
-                "x-api-key": "mock_key",
-                "x-sign": "mock_sign",
-                "Content-Type": "application/json",
-            },
+    with patch("httpx.AsyncClient"):
+        api = DMarketAPI(
+            public_key="test_public_key",
+            secret_key="test_secret_key",
+            api_url="https://api.test.dmarket.com",
+            max_retries=1,
+            enable_cache=False,
         )
-
-        return api
+    # Заменяем httpx клиент на мок
+    api._client = AsyncMock()
+    return api
 
 
 @pytest.fixture
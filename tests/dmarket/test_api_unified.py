@@ -9,15 +9,10 @@
 """
 
 import asyncio
-import os
-import sys
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
-# Импортируем необходимые модули для тестирования
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
-
 from dmarket.dmarket_api import DMarketAPI
 
 # Тестовые константы
@@ -0,0 +1,44 @@
+"""Тесты пакетного анализа предметов в arbitrage_sales_analysis.py."""
+
+import asyncio
+from unittest.mock import patch
+
+from src.dmarket import arbitrage_sales_analysis
+from src.dmarket.arbitrage_sales_analysis import SalesAnalyzer, batch_analyze_items
+
+
+async def test_batch_analyze_items_bounded_concurrency():
+    """Предметы анализируются параллельно, но не больше BATCH_ANALYSIS_CONCURRENCY сразу."""
+    active = 0
+    max_active = 0
+
+    async def evaluate(self, item_name, buy_price, sell_price, game, days):
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        await asyncio.sleep(0)
+        active -= 1
+        if item_name == "item_3":
+            raise ValueError("API error")
+        return {"rating": 5, "item": item_name}
+
+    items = [{"name": f"item_{i}", "buy_price": 1.0, "sell_price": 2.0} for i in range(12)]
+    items.append({"name": "free_item", "buy_price": 0, "sell_price": 2.0})
+
+    with patch.object(SalesAnalyzer, "evaluate_arbitrage_potential", evaluate):
+        results = await batch_analyze_items(items)
+
+    assert max_active == arbitrage_sales_analysis.BATCH_ANALYSIS_CONCURRENCY
+    assert list(results) == [f"item_{i}" for i in range(12)]
+    assert results["item_3"] == {"error": "API error", "success": False}
+    assert results["item_4"] == {"rating": 5, "item": "item_4"}
+
+
+async def test_batch_analyze_items_without_valid_items():
+    """Без подходящих предметов анализатор не создается."""
+    items = [{"name": "", "buy_price": 1.0, "sell_price": 2.0}]
+
+    with patch.object(arbitrage_sales_analysis, "SalesAnalyzer") as analyzer_cls:
+        assert await batch_analyze_items(items) == {}
+
+    analyzer_cls.assert_not_called()
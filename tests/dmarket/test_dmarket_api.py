@@ -17,28 +17,14 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 import httpx
 
-from src.dmarket.dmarket_api import DMarketAPI
+from src.dmarket.dmarket_api import DMarketAPI, _sign
+from tests._util import FakeRequest
 
 # Константы для тестов
 TEST_PUBLIC_KEY = "test_public_key"
 TEST_SECRET_KEY = "test_secret_key"
 TEST_API_URL = "https://api.test.dmarket.com"
-
-
-@pytest.fixture
-def dmarket_api():
-    """Создает экземпляр DMarketAPI для тестов с моками."""
-    with patch("httpx.AsyncClient") as mock_client_class:
-        api = DMarketAPI(
-            public_key=TEST_PUBLIC_KEY,
-            secret_key=TEST_SECRET_KEY,
-            api_url=TEST_API_URL,
-            max_retries=1,
-            enable_cache=False,
-        )
-        # Устанавливаем мок клиента
-        api._client = AsyncMock()
-        return api
+TEST_BODY = json.dumps({"test": "value"})
 
 
 def test_dmarket_api_init():
@@ -77,7 +63,7 @@ def test_generate_signature(dmarket_api):
     # Тестируем генерацию подписи
     method = "GET"
     path = "/test/path"
-    body = json.dumps({"test": "value"})
+    body = TEST_BODY
 
     # Ожидаемая подпись
     timestamp = "1234567890"
@@ -104,50 +90,58 @@ def test_generate_signature(dmarket_api):
     assert headers == {"Content-Type": "application/json"}
 
 
-@pytest.mark.asyncio
+def test_sign_reuses_key_template():
+    """Тест подписи разных сообщений с общего шаблона ключа."""
+    key = TEST_SECRET_KEY.encode("utf-8")
+
+    for message in ("first", "second", "first"):
+        expected = hmac.new(key, message.encode("utf-8"), hashlib.sha256).hexdigest()
+        assert _sign(key, message) == expected
+
+
+def use_mock_transport(api, handler):
+    """Подключает к клиенту API httpx.AsyncClient с MockTransport.
+
+    Запрос проходит через настоящий код AsyncClient, а ответ формирует handler.
+    """
+    api._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
 async def test_request_get(dmarket_api):
     """Тест выполнения GET запроса."""
-    # Подменяем метод _request для непосредственного тестирования
-    with patch.object(dmarket_api, "_request", new=AsyncMock()) as mock_request:
-        # Настраиваем мок
-        mock_request.return_value = {"data": "test_data"}
 
-        # Вызываем метод get_market_items, который внутри вызовет _request
-        result = await dmarket_api._request("GET", "/test/path", params={"param": "value"})
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.method == "GET"
+        assert request.url.path == "/test/path"
+        assert request.url.params["param"] == "value"
+        assert request.headers["X-Api-Key"] == TEST_PUBLIC_KEY
+        return httpx.Response(200, json={"data": "test_data"})
 
-        # Проверяем результат
-        assert result == {"data": "test_data"}
-        mock_request.assert_called_once_with(
-            "GET", 
-            "/test/path", 
-            params={"param": "value"}
-        )
+    use_mock_transport(dmarket_api, handler)
+
+    result = await dmarket_api._request("GET", "/test/path", params={"param": "value"})
+
+    assert result == {"data": "test_data"}
 
 
-@pytest.mark.asyncio
 async def test_request_post(dmarket_api):
     """Тест выполнения POST запроса."""
-    # Подменяем метод _request для непосредственного тестирования
-    with patch.object(dmarket_api, "_request", new=AsyncMock()) as mock_request:
-        # Настраиваем мок
-        mock_request.return_value = {"data": "test_data"}
+    data = {"test": "value"}
 
-        # Данные для запроса
-        data = {"test": "value"}
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.method == "POST"
+        assert request.url.path == "/test/path"
+        assert json.loads(request.content) == data
+        assert request.headers["X-Api-Key"] == TEST_PUBLIC_KEY
+        return httpx.Response(200, json={"data": "test_data"})
 
-        # Вызываем метод
-        result = await dmarket_api._request("POST", "/test/path", data=data)
+    use_mock_transport(dmarket_api, handler)
 
-        # Проверяем результат
-        assert result == {"data": "test_data"}
-        mock_request.assert_called_once_with(
-            "POST", 
-            "/test/path", 
-            data=data
-        )
+    result = await dmarket_api._request("POST", "/test/path", data=data)
+
+    assert result == {"data": "test_data"}
 
 
-@pytest.mark.asyncio
 async def test_request_error_handling(dmarket_api):
     """Тест обработки ошибок при выполнении запроса."""
     # Создаем мок-метод для _client.get, который будет вызывать исключение
@@ -200,7 +194,6 @@ async def test_request_error_handling(dmarket_api):
         assert "description" in result
 
 
-@pytest.mark.asyncio
 async def test_request_network_error(dmarket_api):
     """Тест обработки сетевых ошибок."""
     # Создаем мок-метод для _client.get, который будет вызывать исключение
@@ -226,68 +219,62 @@ async def test_request_network_error(dmarket_api):
         assert result["code"] == "REQUEST_FAILED"
 
 
-@pytest.mark.asyncio
-async def test_get_balance(dmarket_api):
-    """Тест получения баланса пользователя."""
-    # Тестируем разные форматы ответов API
-
-    # Случай 1: Стандартный формат с полем usd.amount
-    with patch.object(dmarket_api, "_request", new=AsyncMock()) as mock_request:
-        mock_request.return_value = {"usd": {"amount": 1550}}
-        result = await dmarket_api.get_balance()
-        assert result["usd"]["amount"] == 1550
-        assert result["balance"] == 15.50
-        assert result["error"] is False
-        assert result["has_funds"] is True
-
-    # Случай 2: Формат с usdAvailableToWithdraw
-    with patch.object(dmarket_api, "_request", new=AsyncMock()) as mock_request:
-        mock_request.return_value = {"usdAvailableToWithdraw": "20.50"}
-        result = await dmarket_api.get_balance()
-        assert result["usd"]["amount"] == 2050
-        assert result["balance"] == 20.50
-        assert result["error"] is False
-        assert result["has_funds"] is True
-
-    # Случай 3: Новый формат с полями balance/available/total
-    with patch.object(dmarket_api, "_request", new=AsyncMock()) as mock_request:
-        mock_request.return_value = {"balance": 30.75, "available": 28.50, "total": 32.25}
-        result = await dmarket_api.get_balance()
-        assert result["balance"] == 30.75
-        assert result["available_balance"] == 28.50
-        assert result["total_balance"] == 32.25
-        assert result["error"] is False
-        assert result["has_funds"] is True
-
-    # Случай 4: Формат с funds.usdWallet
-    with patch.object(dmarket_api, "_request", new=AsyncMock()) as mock_request:
-        mock_request.return_value = {
-            "funds": {
-                "usdWallet": {
-                    "balance": 42.25, 
-                    "availableBalance": 40.0, 
-                    "totalBalance": 45.0
-                }
-            }
-        }
-        result = await dmarket_api.get_balance()
-        assert result["balance"] == 42.25
-        assert result["available_balance"] == 40.0
-        assert result["total_balance"] == 45.0
-        assert result["error"] is False
-        assert result["has_funds"] is True
-
-    # Случай 5: Ошибка API
-    with patch.object(dmarket_api, "_request", new=AsyncMock()) as mock_request:
-        mock_request.return_value = {"error": True, "code": "UNAUTHORIZED", "message": "Invalid API key"}
-        result = await dmarket_api.get_balance()
-        assert result["error"] is True
+# Форматы ответов API баланса и ожидаемые поля результата get_balance
+BALANCE_CASES = [
+    pytest.param(
+        {"usd": {"amount": 1550}},
+        {"balance": 15.50, "error": False, "has_funds": True},
+        id="usd_amount",
+    ),
+    pytest.param(
+        {"usdAvailableToWithdraw": "20.50"},
+        {"balance": 20.50, "error": False, "has_funds": True},
+        id="usd_available_to_withdraw",
+    ),
+    pytest.param(
+        {"balance": 30.75, "available": 28.50, "total": 32.25},
+        {
+            "balance": 30.75,
+            "available_balance": 28.50,
+            "total_balance": 32.25,
+            "error": False,
+            "has_funds": True,
+        },
+        id="balance_available_total",
+    ),
+    pytest.param(
+        {"funds": {"usdWallet": {"balance": 42.25, "availableBalance": 40.0, "totalBalance": 45.0}}},
+        {
+            "balance": 42.25,
+            "available_balance": 40.0,
+            "total_balance": 45.0,
+            "error": False,
+            "has_funds": True,
+        },
+        id="funds_usd_wallet",
+    ),
+    pytest.param(
+        {"error": True, "code": "UNAUTHORIZED", "message": "Invalid API key"},
+        {"balance": 0.0, "error": True, "has_funds": False},
+        id="api_error",
+    ),
+]
+
+
+@pytest.mark.parametrize(("response", "expected"), BALANCE_CASES)
+async def test_get_balance(dmarket_api, response, expected):
+    """Тест получения баланса пользователя для разных форматов ответа API."""
+    dmarket_api._request = FakeRequest(response)
+
+    result = await dmarket_api.get_balance()
+
+    assert {key: result[key] for key in expected} == expected
+    if expected["error"]:
         assert "error_message" in result
-        assert result["balance"] == 0.0
-        assert result["has_funds"] is False
+    else:
+        assert result["usd"]["amount"] == round(expected["balance"] * 100)
 
 
-@pytest.mark.asyncio
 async def test_get_user_balance_deprecated(dmarket_api):
     """Тест устаревшего метода get_user_balance."""
     # Настройка патча для логгера
@@ -309,7 +296,6 @@ async def test_get_user_balance_deprecated(dmarket_api):
         assert result == {"balance": 10.0}
 
 
-@pytest.mark.asyncio
 async def test_direct_balance_request(dmarket_api):
     """Тест прямого запроса баланса."""
     # Патчим requests.get для имитации успешного ответа
@@ -350,7 +336,6 @@ async def test_direct_balance_request(dmarket_api):
         assert "ошибка авторизации" in result["error"].lower()
 
 
-@pytest.mark.asyncio
 async def test_get_market_items(dmarket_api):
     """Тест получения предметов с рынка."""
     # Подготавливаем тестовые данные
@@ -400,7 +385,6 @@ async def test_get_market_items(dmarket_api):
         assert result["total"] == 2
 
 
-@pytest.mark.asyncio
 async def test_clear_cache(dmarket_api):
     """Тест очистки кэша."""
     # Включаем кэширование для теста
@@ -416,7 +400,6 @@ async def test_clear_cache(dmarket_api):
         assert len(api_cache) == 0
 
 
-@pytest.mark.asyncio
 async def test_clear_cache_for_endpoint(dmarket_api):
     """Тест очистки кэша для конкретного эндпоинта."""
     # Включаем кэширование для теста
@@ -4,28 +4,12 @@
 фокусируясь на основных функциях и правильном обращении с API.
 """
 
-import json
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from src.dmarket.dmarket_api import DMarketAPI
-
-
-@pytest.fixture
-def dmarket_api():
-    """Создает экземпляр DMarketAPI для тестов с моками."""
-    with patch("httpx.AsyncClient"):
-        api = DMarketAPI(
-            public_key="test_public_key",
-            secret_key="test_secret_key",
-            api_url="https://api.test.dmarket.com",
-            max_retries=1,
-            enable_cache=False,
-        )
-        # Заменяем httpx клиент на мок
-        api._client = AsyncMock()
-        return api
+from tests._util import FakeRequest
 
 
 def test_dmarket_api_init():
@@ -61,83 +45,73 @@ def test_dmarket_api_init():
 @pytest.mark.asyncio
 async def test_get_balance_success(dmarket_api):
     """Тест успешного получения баланса."""
-    # Патчим внутренний метод _request, чтобы избежать реальных запросов
-    with patch.object(dmarket_api, "_request", new=AsyncMock()) as mock_request:
-        # Имитируем ответ API с балансом
-        mock_request.return_value = {"usd": {"amount": 1550}}
-        
-        # Вызываем метод get_balance
-        result = await dmarket_api.get_balance()
-        
-        # Проверяем, что метод _request был вызван с правильными параметрами
-        mock_request.assert_called_once_with(
-            "GET", "/account/v1/balance"
-        )
-        
-        # Проверяем результат
-        assert result["usd"]["amount"] == 1550
-        assert result["balance"] == 15.50
-        assert result["error"] is False
-        assert result["has_funds"] is True
+    # Подменяем внутренний метод _request, чтобы избежать реальных запросов
+    dmarket_api._request = FakeRequest({"usd": {"amount": 1550}})
+
+    # Вызываем метод get_balance
+    result = await dmarket_api.get_balance()
+
+    # Проверяем, что метод _request был вызван с правильными параметрами
+    assert dmarket_api._request.calls == [(("GET", "/account/v1/balance"), {})]
+
+    # Проверяем результат
+    assert result["usd"]["amount"] == 1550
+    assert result["balance"] == 15.50
+    assert result["error"] is False
+    assert result["has_funds"] is True
 
 
 @pytest.mark.asyncio
 async def test_get_balance_alternative_format(dmarket_api):
     """Тест получения баланса в альтернативном формате."""
-    # Патчим внутренний метод _request
-    with patch.object(dmarket_api, "_request", new=AsyncMock()) as mock_request:
-        # Имитируем ответ API с балансом в формате usdAvailableToWithdraw
-        mock_request.return_value = {"usdAvailableToWithdraw": "20.50"}
-        
-        # Вызываем метод get_balance
-        result = await dmarket_api.get_balance()
-        
-        # Проверяем результат
-        assert result["usd"]["amount"] == 2050
-        assert result["balance"] == 20.50
-        assert result["error"] is False
-        assert result["has_funds"] is True
+    # Подменяем _request ответом с балансом в формате usdAvailableToWithdraw
+    dmarket_api._request = FakeRequest({"usdAvailableToWithdraw": "20.50"})
+
+    # Вызываем метод get_balance
+    result = await dmarket_api.get_balance()
+
+    # Проверяем результат
+    assert result["usd"]["amount"] == 2050
+    assert result["balance"] == 20.50
+    assert result["error"] is False
+    assert result["has_funds"] is True
 
 
 @pytest.mark.asyncio
 async def test_get_balance_new_format(dmarket_api):
     """Тест получения баланса в новом формате с полями balance/available/total."""
-    # Патчим внутренний метод _request
-    with patch.object(dmarket_api, "_request", new=AsyncMock()) as mock_request:
-        # Имитируем ответ API с балансом в новом формате
-        mock_request.return_value = {"balance": 30.75, "available": 28.50, "total": 32.25}
-        
-        # Вызываем метод get_balance
-        result = await dmarket_api.get_balance()
-        
-        # Проверяем результат
-        assert result["balance"] == 30.75
-        assert result["available_balance"] == 28.50
-        assert result["total_balance"] == 32.25
-        assert result["error"] is False
-        assert result["has_funds"] is True
+    # Подменяем _request ответом с балансом в новом формате
+    dmarket_api._request = FakeRequest({"balance": 30.75, "available": 28.50, "total": 32.25})
+
+    # Вызываем метод get_balance
+    result = await dmarket_api.get_balance()
+
+    # Проверяем результат
+    assert result["balance"] == 30.75
+    assert result["available_balance"] == 28.50
+    assert result["total_balance"] == 32.25
+    assert result["error"] is False
+    assert result["has_funds"] is True
 
 
 @pytest.mark.asyncio
 async def test_get_balance_error(dmarket_api):
     """Тест получения баланса с ошибкой."""
-    # Патчим внутренний метод _request
-    with patch.object(dmarket_api, "_request", new=AsyncMock()) as mock_request:
-        # Имитируем ответ API с ошибкой
-        mock_request.return_value = {
-            "error": True,
-            "code": "UNAUTHORIZED",
-            "message": "Invalid API key"
-        }
-        
-        # Вызываем метод get_balance
-        result = await dmarket_api.get_balance()
-        
-        # Проверяем результат
-        assert result["error"] is True
-        assert "error_message" in result
-        assert result["balance"] == 0.0
-        assert result["has_funds"] is False
+    # Подменяем _request ответом API с ошибкой
+    dmarket_api._request = FakeRequest({
+        "error": True,
+        "code": "UNAUTHORIZED",
+        "message": "Invalid API key",
+    })
+
+    # Вызываем метод get_balance
+    result = await dmarket_api.get_balance()
+
+    # Проверяем результат
+    assert result["error"] is True
+    assert "error_message" in result
+    assert result["balance"] == 0.0
+    assert result["has_funds"] is False
 
 
 @pytest.mark.asyncio
@@ -166,47 +140,46 @@ async def test_get_user_balance_deprecated(dmarket_api):
 @pytest.mark.asyncio
 async def test_get_market_items(dmarket_api):
     """Тест получения предметов с рынка."""
-    # Патчим внутренний метод _request
-    with patch.object(dmarket_api, "_request", new=AsyncMock()) as mock_request:
-        # Данные для ответа API
-        test_items = [
-            {"id": "item1", "title": "Test Item 1", "price": {"USD": 1000}},
-            {"id": "item2", "title": "Test Item 2", "price": {"USD": 2000}},
-        ]
-        mock_request.return_value = {"items": test_items, "total": 2}
-        
-        # Вызываем метод
-        result = await dmarket_api.get_market_items(
-            game="csgo",
-            limit=10,
-            offset=0,
-            currency="USD",
-            price_from=1.0,
-            price_to=50.0,
-            title="Test",
-            sort="price",
-        )
-        
-        # Проверяем параметры запроса
-        mock_request.assert_called_once()
-        args, kwargs = mock_request.call_args
-        assert args[0] == "GET"
-        assert args[1] == "/exchange/v1/market/items"  # Используем прямой путь
-        
-        # Проверяем параметры запроса
-        params = kwargs["params"]
-        assert params["gameId"] == "csgo"
-        assert params["limit"] == 10
-        assert params["offset"] == 0
-        assert params["currency"] == "USD"
-        assert params["priceFrom"] == "100"  # 1.0 * 100
-        assert params["priceTo"] == "5000"  # 50.0 * 100
-        assert params["title"] == "Test"
-        assert params["orderBy"] == "price"
-        
-        # Проверяем результат
-        assert result["items"] == test_items
-        assert result["total"] == 2
+    # Данные для ответа API
+    test_items = [
+        {"id": "item1", "title": "Test Item 1", "price": {"USD": 1000}},
+        {"id": "item2", "title": "Test Item 2", "price": {"USD": 2000}},
+    ]
+    # Подменяем внутренний метод _request
+    dmarket_api._request = FakeRequest({"items": test_items, "total": 2})
+
+    # Вызываем метод
+    result = await dmarket_api.get_market_items(
+        game="csgo",
+        limit=10,
+        offset=0,
+        currency="USD",
+        price_from=1.0,
+        price_to=50.0,
+        title="Test",
+        sort="price",
+    )
+
+    # Проверяем параметры запроса
+    assert len(dmarket_api._request.calls) == 1
+    args, kwargs = dmarket_api._request.calls[0]
+    assert args[0] == "GET"
+    assert args[1] == "/exchange/v1/market/items"  # Используем прямой путь
+
+    # Проверяем параметры запроса
+    params = kwargs["params"]
+    assert params["gameId"] == "csgo"
+    assert params["limit"] == 10
+    assert params["offset"] == 0
+    assert params["currency"] == "USD"
+    assert params["priceFrom"] == "100"  # 1.0 * 100
+    assert params["priceTo"] == "5000"  # 50.0 * 100
+    assert params["title"] == "Test"
+    assert params["orderBy"] == "price"
+
+    # Проверяем результат
+    assert result["items"] == test_items
+    assert result["total"] == 2
 
 
 @pytest.mark.asyncio
@@ -3,6 +3,9 @@
 Этот модуль тестирует функциональность src.dmarket.game_filters.
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+
 import pytest
 
 from src.dmarket.game_filters import (
@@ -15,6 +18,34 @@ from src.dmarket.game_filters import (
 )
 
 
+# Базовые шаблоны предметов CS2: тесты добавляют к ним только проверяемые поля.
+# CS2Filter читает category и rarity из корня предмета, а внешний вид — из title
+AK47_REDLINE = MappingProxyType({"title": "AK-47 | Redline"})
+AWP_ASIIMOV = MappingProxyType({"title": "AWP | Asiimov"})
+
+
+@pytest.fixture(scope="module")
+def csgo_filter():
+    """Возвращает фильтр CS2 из фабрики, один на модуль (фильтры не хранят состояния)."""
+    return FilterFactory.get_filter("csgo")
+
+
+@pytest.fixture(scope="module")
+def cached_filter_factory():
+    """Кэширует FilterFactory.get_filter на время тестов модуля.
+
+    apply_filters_to_items и build_api_params_for_game создают новый фильтр
+    при каждом вызове; с кэшем повторные вызовы получают тот же экземпляр.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            FilterFactory,
+            "get_filter",
+            staticmethod(lru_cache(maxsize=8)(FilterFactory.get_filter)),
+        )
+        yield
+
+
 @pytest.fixture
 def mock_csgo_filters():
     """Возвращает мок для фильтров CS:GO."""
@@ -45,77 +76,47 @@ def mock_csgo_filters():
     }
 
 
-def test_get_csgo_filters():
+def test_get_csgo_filters(csgo_filter):
     """Тестирует получение фильтров для CS:GO."""
     # Test that we can get a CS2Filter
-    filter_obj = FilterFactory.get_filter("csgo")
-    assert isinstance(filter_obj, CS2Filter)
-    assert filter_obj.game_name == "csgo"
+    assert isinstance(csgo_filter, CS2Filter)
+    assert csgo_filter.game_name == "csgo"
 
 
-def test_cs2_filter_rarity():
+def test_cs2_filter_rarity(csgo_filter):
     """Тестирует фильтрацию по редкости в CS2Filter."""
-    filter_obj = CS2Filter()
-
     # Create test items
-    classified_item = {
-        "title": "AK-47 | Redline",
-        "extra": {"rarity": {"name": "Classified"}},
-    }
-
-    covert_item = {
-        "title": "AWP | Asiimov",
-        "extra": {"rarity": {"name": "Covert"}},
-    }
+    classified_item = {**AK47_REDLINE, "rarity": "Classified"}
+    covert_item = {**AWP_ASIIMOV, "rarity": "Covert"}
 
     # Check filter matching
-    assert filter_obj.apply_filters(classified_item, {"rarity": "Classified"})
-    assert not filter_obj.apply_filters(classified_item, {"rarity": "Covert"})
-    assert filter_obj.apply_filters(covert_item, {"rarity": "Covert"})
+    assert csgo_filter.apply_filters(classified_item, {"rarity": "Classified"})
+    assert not csgo_filter.apply_filters(classified_item, {"rarity": "Covert"})
+    assert csgo_filter.apply_filters(covert_item, {"rarity": "Covert"})
 
 
-def test_cs2_filter_exterior():
+def test_cs2_filter_exterior(csgo_filter):
     """Тестирует фильтрацию по внешнему виду в CS2Filter."""
-    filter_obj = CS2Filter()
-
     # Create test items
-    ft_item = {
-        "title": "AK-47 | Redline",
-        "description": "Field-Tested",
-        "extra": {"exterior": {"name": "Field-Tested"}},
-    }
-
-    fn_item = {
-        "title": "AWP | Asiimov",
-        "description": "Factory New",
-        "extra": {"exterior": {"name": "Factory New"}},
-    }
+    ft_item = {"title": f"{AK47_REDLINE['title']} (Field-Tested)"}
+    fn_item = {"title": f"{AWP_ASIIMOV['title']} (Factory New)"}
 
     # Check filter matching
-    assert filter_obj.apply_filters(ft_item, {"exterior": "Field-Tested"})
-    assert not filter_obj.apply_filters(ft_item, {"exterior": "Factory New"})
-    assert filter_obj.apply_filters(fn_item, {"exterior": "Factory New"})
+    assert csgo_filter.apply_filters(ft_item, {"exterior": "Field-Tested"})
+    assert not csgo_filter.apply_filters(ft_item, {"exterior": "Factory New"})
+    assert csgo_filter.apply_filters(fn_item, {"exterior": "Factory New"})
 
 
-def test_cs2_filter_category():
+def test_cs2_filter_category(csgo_filter):
     """Тестирует фильтрацию по категории в CS2Filter."""
-    filter_obj = CS2Filter()
-
     # Create test items
-    rifle_item = {
-        "title": "AK-47 | Redline",
-        "extra": {"category": {"name": "Rifle"}},
-    }
-
-    knife_item = {
-        "title": "Karambit | Fade",
-        "extra": {"category": {"name": "Knife"}},
-    }
+    rifle_item = {**AK47_REDLINE, "category": "Rifle"}
+    knife_item = {"title": "Karambit | Fade", "category": "Knife"}
 
     # Check filter matching
-    assert filter_obj.apply_filters(rifle_item, {"category": "Rifle"})
-    assert not filter_obj.apply_filters(rifle_item, {"category": "Knife"})
-    assert filter_obj.apply_filters(knife_item, {"category": "Knife"})
+    assert csgo_filter.apply_filters(rifle_item, {"category": "Rifle"})
+    assert not csgo_filter.apply_filters(rifle_item, {"category": "Knife"})
+    assert csgo_filter.apply_filters(knife_item, {"category": "Knife"})
 
 
 def test_price_filter():
@@ -144,22 +145,14 @@ def test_price_filter():
     )
 
 
-def test_complete_cs2_filter():
+def test_complete_cs2_filter(csgo_filter):
     """Тестирует получение полного фильтра для CS2."""
-    filter_obj = CS2Filter()
-
     # Create a test item that matches all filters
     item = {
-        "title": "AK-47 | Redline",
-        "description": "Field-Tested",
+        "title": f"{AK47_REDLINE['title']} (Field-Tested)",
         "price": {"USD": 50},
-        "extra": {
-            "category": {"name": "Rifle"},
-            "rarity": {"name": "Classified"},
-            "exterior": {"name": "Field-Tested"},
-            "stattrak": False,
-            "souvenir": False,
-        },
+        "category": "Rifle",
+        "rarity": "Classified",
     }
 
     # Test with all filters matching
@@ -173,12 +166,12 @@ def test_complete_cs2_filter():
         "souvenir": False,
     }
 
-    assert filter_obj.apply_filters(item, filters)
+    assert csgo_filter.apply_filters(item, filters)
 
     # Test with one non-matching filter
     non_matching = filters.copy()
     non_matching["rarity"] = "Covert"
-    assert not filter_obj.apply_filters(item, non_matching)
+    assert not csgo_filter.apply_filters(item, non_matching)
 
 
 def test_valid_filter_factory():
@@ -196,6 +189,7 @@ def test_valid_filter_factory():
         pass
 
 
+@pytest.mark.usefixtures("cached_filter_factory")
 def test_parse_filters():
     """Тестирует парсинг фильтров."""
     # Create sample items
@@ -203,17 +197,17 @@ def test_parse_filters():
         {
             "title": "AK-47 | Redline",
             "price": {"USD": 50},
-            "extra": {"category": {"name": "Rifle"}},
+            "category": "Rifle",
         },
         {
             "title": "USP-S | Kill Confirmed",
             "price": {"USD": 80},
-            "extra": {"category": {"name": "Pistol"}},
+            "category": "Pistol",
         },
         {
             "title": "Karambit | Fade",
             "price": {"USD": 500},
-            "extra": {"category": {"name": "Knife"}},
+            "category": "Knife",
         },
     ]
 
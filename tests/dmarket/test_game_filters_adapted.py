@@ -78,32 +78,31 @@ def sample_rust_item():
     }
 
 
-def test_base_filter_price():
+@pytest.fixture(scope="module")
+def base_filter():
+    """Создает экземпляр BaseGameFilter один раз на модуль (фильтр не хранит состояния)."""
+    return BaseGameFilter()
+
+
+# Предмет (цена в центах), фильтры цены и ожидаемый результат apply_filters
+PRICE_FILTER_CASES = [
+    pytest.param({"price": {"USD": 100}}, {"min_price": 50}, True, id="above_min"),
+    pytest.param({"price": {"USD": 100}}, {"min_price": 150}, False, id="below_min"),
+    pytest.param({"price": {"USD": 1000}}, {"max_price": 1500}, True, id="below_max"),
+    pytest.param({"price": {"USD": 5000}}, {"max_price": 3000}, False, id="above_max"),
+    pytest.param(
+        {"price": {"USD": 1000}}, {"min_price": 500, "max_price": 1500}, True, id="in_range",
+    ),
+    pytest.param(
+        {"price": {"USD": 1000}}, {"min_price": 1500, "max_price": 3000}, False, id="out_of_range",
+    ),
+]
+
+
+@pytest.mark.parametrize(("item", "filters", "expected"), PRICE_FILTER_CASES)
+def test_base_filter_price(base_filter, item, filters, expected):
     """Проверяет фильтрацию по цене в базовом фильтре."""
-    base_filter = BaseGameFilter()
-
-    # Создаем тестовые предметы
-    cheap_item = {"price": {"USD": 100}}
-    mid_price_item = {"price": {"USD": 1000}}
-    expensive_item = {"price": {"USD": 5000}}
-
-    # Проверяем фильтр минимальной цены
-    assert base_filter.apply_filters(cheap_item, {"min_price": 50})
-    assert not base_filter.apply_filters(cheap_item, {"min_price": 150})
-
-    # Проверяем фильтр максимальной цены
-    assert base_filter.apply_filters(mid_price_item, {"max_price": 1500})
-    assert not base_filter.apply_filters(expensive_item, {"max_price": 3000})
-
-    # Проверяем комбинацию фильтров
-    assert base_filter.apply_filters(
-        mid_price_item,
-        {"min_price": 500, "max_price": 1500},
-    )
-    assert not base_filter.apply_filters(
-        mid_price_item,
-        {"min_price": 1500, "max_price": 3000},
-    )
+    assert base_filter.apply_filters(item, filters) is expected
 
 
 def test_csgo_filter_full(csgo_filter, sample_csgo_item):
@@ -234,9 +233,7 @@ def test_csgo_filter_stattrak_souvenir(csgo_filter, sample_csgo_item):
         assert not csgo_filter.apply_filters(sample_csgo_item, {"souvenir": True})
 
         # Меняем предмет на StatTrak
-        stattrak_item = sample_csgo_item.copy()
-        stattrak_item["extra"] = sample_csgo_item["extra"].copy()
-        stattrak_item["extra"]["stattrak"] = True
+        stattrak_item = {**sample_csgo_item, "extra": {**sample_csgo_item["extra"], "stattrak": True}}
 
         assert csgo_filter.apply_filters(stattrak_item, {"stattrak": True})
         assert not csgo_filter.apply_filters(stattrak_item, {"stattrak": False})
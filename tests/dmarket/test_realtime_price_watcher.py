@@ -6,7 +6,11 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from src.dmarket.dmarket_api import DMarketAPI
-from src.dmarket.realtime_price_watcher import PriceAlert, RealtimePriceWatcher
+from src.dmarket.realtime_price_watcher import (
+    PRICE_UPDATE_CONCURRENCY,
+    PriceAlert,
+    RealtimePriceWatcher,
+)
 from src.utils.websocket_client import DMarketWebSocketClient
 
 
@@ -269,3 +273,81 @@ async def test_process_price_change(price_watcher):
 
     assert not specific_handler.called
     assert not global_handler.called
+
+
+async def test_update_watched_items_prices_bounded_concurrency(price_watcher, mock_api_client):
+    """Тест ограничения числа одновременных запросов при обновлении цен."""
+    for i in range(300):
+        price_watcher.watch_item(f"item_{i}")
+
+    in_flight = 0
+    peak = 0
+
+    async def fake_request(method, path, params):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return {"items": []}
+
+    mock_api_client._request = AsyncMock(side_effect=fake_request)
+
+    await price_watcher._update_watched_items_prices()
+
+    assert mock_api_client._request.call_count == 6
+    assert peak == PRICE_UPDATE_CONCURRENCY
+
+
+async def test_update_watched_items_prices_chunks(price_watcher, mock_api_client):
+    """Тест обновления цен через REST API чанками по 50 предметов."""
+    item_ids = [f"item_{i}" for i in range(60)]
+    for item_id in item_ids:
+        price_watcher.watch_item(item_id)
+
+    async def fake_request(method, path, params):
+        ids = params["itemIds"].split(",")
+        # Первый чанк отвечает ошибкой: второй должен обработаться независимо от него
+        if "item_0" in ids:
+            raise Exception("API Error")
+        return {"items": [{"itemId": item_id, "price": {"USD": "150"}} for item_id in ids]}
+
+    mock_api_client._request = AsyncMock(side_effect=fake_request)
+
+    await price_watcher._update_watched_items_prices()
+
+    requested = [
+        call.kwargs["params"]["itemIds"].split(",")
+        for call in mock_api_client._request.call_args_list
+    ]
+    assert sorted(len(ids) for ids in requested) == [10, 50]
+    assert sorted(sum(requested, [])) == sorted(item_ids)
+
+    failed = next(ids for ids in requested if "item_0" in ids)
+    assert all(item_id not in price_watcher.price_cache for item_id in failed)
+    assert all(
+        price_watcher.price_cache[item_id] == 1.5
+        for item_id in item_ids
+        if item_id not in failed
+    )
+
+
+async def test_update_watched_items_prices_chunk_returns_none(price_watcher, mock_api_client):
+    """Тест, что пустой ответ API для одного чанка не прерывает обновление остальных."""
+    item_ids = [f"item_{i}" for i in range(60)]
+    for item_id in item_ids:
+        price_watcher.watch_item(item_id)
+
+    async def fake_request(method, path, params):
+        ids = params["itemIds"].split(",")
+        if "item_0" in ids:
+            return None
+        return {"items": [{"itemId": item_id, "price": {"USD": "150"}} for item_id in ids]}
+
+    mock_api_client._request = AsyncMock(side_effect=fake_request)
+
+    await price_watcher._update_watched_items_prices()
+
+    assert mock_api_client._request.call_count == 2
+    assert "item_0" not in price_watcher.price_cache
+    assert sum(item_id in price_watcher.price_cache for item_id in item_ids) == 10
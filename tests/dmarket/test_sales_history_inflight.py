@@ -0,0 +1,65 @@
+"""Тесты получения истории продаж в src.dmarket.sales_history."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from src.dmarket import sales_history
+
+SALES_DATA = [
+    {"date": 1700000000, "price": 1050},
+    {"date": 1700003600, "price": 1100},
+]
+
+
+async def test_get_item_sales_history_coalesces_concurrent_calls():
+    """Одновременные запросы одного предмета выполняют один вызов API."""
+    api = MagicMock()
+    api.get_item_price_history = AsyncMock(return_value=SALES_DATA)
+
+    results = await asyncio.gather(
+        *(
+            sales_history.get_item_sales_history(
+                "AK-47 | Redline", period="7d", use_cache=False, dmarket_api=api
+            )
+            for _ in range(3)
+        ),
+    )
+
+    api.get_item_price_history.assert_awaited_once()
+    assert [sale["price"] for sale in results[0]] == [11.0, 10.5]
+    assert results[0] == results[1] == results[2]
+    # Каждый вызывающий получает свой список
+    assert results[0] is not results[1]
+    assert not sales_history._inflight_requests
+
+
+async def test_get_item_sales_history_refetches_after_completion():
+    """Завершенный запрос не переиспользуется следующими вызовами."""
+    api = MagicMock()
+    api.get_item_price_history = AsyncMock(return_value=SALES_DATA)
+
+    for _ in range(2):
+        await sales_history.get_item_sales_history(
+            "AK-47 | Redline", period="7d", use_cache=False, dmarket_api=api
+        )
+
+    assert api.get_item_price_history.await_count == 2
+
+
+def test_sales_cache_round_trip(tmp_path, monkeypatch):
+    """История продаж, сохраненная в кеш, читается обратно без изменений."""
+    monkeypatch.setattr(sales_history, "SALES_CACHE_DIR", tmp_path)
+    sales = [{"price": 11.0, "timestamp": 1700003600, "market_hash_name": "AK-47 | Redline"}]
+
+    sales_history._save_to_cache("AK-47 | Redline", "csgo", "7d", sales)
+
+    assert sales_history._load_from_cache("AK-47 | Redline", "csgo", "7d") == sales
+
+
+async def test_get_item_sales_history_empty_name():
+    """Пустое название предмета возвращает пустую историю без обращения к API."""
+    api = MagicMock()
+    api.get_item_price_history = AsyncMock()
+
+    assert await sales_history.get_item_sales_history("", dmarket_api=api) == []
+    api.get_item_price_history.assert_not_called()
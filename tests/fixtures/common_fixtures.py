@@ -6,7 +6,7 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from telegram import CallbackQuery, Message, Update, User
+from telegram import Message, Update, User
 from telegram.ext import CallbackContext
 
 
@@ -33,7 +33,7 @@ def mock_telegram_callback_query():
     update = MagicMock(spec=Update)
     update.message = None
 
-    query = MagicMock(spec=CallbackQuery)
+    query = MagicMock()
     query.data = "test_callback"
     query.from_user = MagicMock(spec=User)
     query.from_user.id = 12345
@@ -7,14 +7,22 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from tests._util import make_mock_update
+
 
 @pytest.fixture
 def mock_update():
     """Создает мок объекта Update из библиотеки python-telegram-bot."""
-    update = MagicMock()
-    update.effective_chat = MagicMock(id=12345678)
-    update.effective_user = MagicMock(id=87654321, first_name="Test", username="test_user")
-    update.effective_message = MagicMock(message_id=1, text="Test message")
+    update = make_mock_update(
+        **{
+            "effective_chat.id": 12345678,
+            "effective_user.id": 87654321,
+            "effective_user.first_name": "Test",
+            "effective_user.username": "test_user",
+            "effective_message.message_id": 1,
+            "effective_message.text": "Test message",
+        },
+    )
 
     # Создание callback_query для тестирования обработчиков обратного вызова
     update.callback_query = MagicMock(
@@ -24,20 +24,12 @@ def mock_query():
     return query
 
 
-@pytest.fixture
-def mock_context():
-    """Создает мок для объекта context."""
-    context = MagicMock()
-    context.user_data = {"current_game": "csgo"}
-    return context
-
-
 @pytest.mark.asyncio
 @patch("src.telegram_bot.handlers.arbitrage_callback_impl.execute_api_request")
 async def test_handle_dmarket_arbitrage_impl_success(
     mock_execute_api_request,
     mock_query,
-    mock_context,
+    mock_context_with_game,
 ):
     """Тестирует успешную обработку запроса арбитража с результатами."""
     # Настройка мока для возврата результатов
@@ -55,7 +47,7 @@ async def test_handle_dmarket_arbitrage_impl_success(
         mock_pagination.get_page.return_value = (mock_results, 0, 1)
 
         # Вызываем тестируемую функцию
-        await handle_dmarket_arbitrage_impl(mock_query, mock_context, "boost")
+        await handle_dmarket_arbitrage_impl(mock_query, mock_context_with_game, "boost")
 
         # Проверяем вызовы методов
         mock_query.edit_message_text.assert_called()
@@ -67,7 +59,7 @@ async def test_handle_dmarket_arbitrage_impl_success(
         mock_pagination.get_page.assert_called_once_with(mock_query.from_user.id)
 
         # Проверяем, что режим арбитража сохранен в user_data
-        assert mock_context.user_data["last_arbitrage_mode"] == "boost"
+        assert mock_context_with_game.user_data["last_arbitrage_mode"] == "boost"
 
         # Проверяем финальный вызов edit_message_text
         args, kwargs = mock_query.edit_message_text.call_args_list[-1]
@@ -81,7 +73,7 @@ async def test_handle_dmarket_arbitrage_impl_success(
 async def test_handle_dmarket_arbitrage_impl_pagination(
     mock_execute_api_request,
     mock_query,
-    mock_context,
+    mock_context_with_game,
 ):
     """Тестирует пагинацию в результатах арбитража."""
     # Настройка мока для возврата результатов
@@ -96,7 +88,7 @@ async def test_handle_dmarket_arbitrage_impl_pagination(
         mock_pagination.get_page.return_value = (mock_results[:5], 0, 4)
 
         # Вызываем тестируемую функцию
-        await handle_dmarket_arbitrage_impl(mock_query, mock_context, "boost")
+        await handle_dmarket_arbitrage_impl(mock_query, mock_context_with_game, "boost")
 
         # Проверяем финальный вызов edit_message_text
         args, kwargs = mock_query.edit_message_text.call_args_list[-1]
@@ -115,14 +107,14 @@ async def test_handle_dmarket_arbitrage_impl_pagination(
 async def test_handle_dmarket_arbitrage_impl_no_results(
     mock_execute_api_request,
     mock_query,
-    mock_context,
+    mock_context_with_game,
 ):
     """Тестирует обработку запроса арбитража без результатов."""
     # Настройка мока для возврата пустого списка
     mock_execute_api_request.return_value = []
 
     # Вызываем тестируемую функцию
-    await handle_dmarket_arbitrage_impl(mock_query, mock_context, "boost")
+    await handle_dmarket_arbitrage_impl(mock_query, mock_context_with_game, "boost")
 
     # Проверяем финальный вызов edit_message_text
     mock_query.edit_message_text.assert_called()
@@ -134,7 +126,7 @@ async def test_handle_dmarket_arbitrage_impl_no_results(
         mock_format.return_value = "Отформатированный результат"
 
         # Повторный вызов функции
-        await handle_dmarket_arbitrage_impl(mock_query, mock_context, "boost")
+        await handle_dmarket_arbitrage_impl(mock_query, mock_context_with_game, "boost")
 
         # Проверка вызова format_dmarket_results
         mock_format.assert_called_once_with([], "boost", "csgo")
@@ -145,7 +137,7 @@ async def test_handle_dmarket_arbitrage_impl_no_results(
 async def test_handle_dmarket_arbitrage_impl_api_error(
     mock_execute_api_request,
     mock_query,
-    mock_context,
+    mock_context_with_game,
 ):
     """Тестирует обработку ошибки API при запросе арбитража."""
     # Настройка мока для генерации ошибки API
@@ -155,7 +147,7 @@ async def test_handle_dmarket_arbitrage_impl_api_error(
     )
 
     # Вызываем тестируемую функцию
-    await handle_dmarket_arbitrage_impl(mock_query, mock_context, "boost")
+    await handle_dmarket_arbitrage_impl(mock_query, mock_context_with_game, "boost")
 
     # Проверяем финальный вызов edit_message_text
     args, kwargs = mock_query.edit_message_text.call_args
@@ -179,7 +171,7 @@ async def test_handle_dmarket_arbitrage_impl_api_error(
 async def test_handle_dmarket_arbitrage_impl_authorization_error(
     mock_execute_api_request,
     mock_query,
-    mock_context,
+    mock_context_with_game,
 ):
     """Тестирует обработку ошибки авторизации при запросе арбитража."""
     # Настройка мока для генерации ошибки авторизации
@@ -189,7 +181,7 @@ async def test_handle_dmarket_arbitrage_impl_authorization_error(
     )
 
     # Вызываем тестируемую функцию
-    await handle_dmarket_arbitrage_impl(mock_query, mock_context, "mid")
+    await handle_dmarket_arbitrage_impl(mock_query, mock_context_with_game, "mid")
 
     # Проверяем финальный вызов edit_message_text
     args, kwargs = mock_query.edit_message_text.call_args
@@ -204,14 +196,14 @@ async def test_handle_dmarket_arbitrage_impl_authorization_error(
 async def test_handle_dmarket_arbitrage_impl_generic_exception(
     mock_execute_api_request,
     mock_query,
-    mock_context,
+    mock_context_with_game,
 ):
     """Тестирует обработку общей ошибки при запросе арбитража."""
     # Настройка мока для генерации общей ошибки
     mock_execute_api_request.side_effect = Exception("Unexpected error")
 
     # Вызываем тестируемую функцию
-    await handle_dmarket_arbitrage_impl(mock_query, mock_context, "boost")
+    await handle_dmarket_arbitrage_impl(mock_query, mock_context_with_game, "boost")
 
     # Проверяем финальный вызов edit_message_text
     args, kwargs = mock_query.edit_message_text.call_args
@@ -227,7 +219,7 @@ async def test_handle_dmarket_arbitrage_impl_generic_exception(
 async def test_handle_best_opportunities_impl_success(
     mock_find_opportunities,
     mock_query,
-    mock_context,
+    mock_context_with_game,
 ):
     """Тестирует успешный поиск лучших арбитражных возможностей."""
     # Настройка мока для возврата возможностей
@@ -244,7 +236,7 @@ async def test_handle_best_opportunities_impl_success(
         mock_format.return_value = "Форматированные результаты"
 
         # Вызываем тестируемую функцию
-        await handle_best_opportunities_impl(mock_query, mock_context)
+        await handle_best_opportunities_impl(mock_query, mock_context_with_game)
 
         # Проверяем вызов функции поиска с правильными параметрами
         mock_find_opportunities.assert_called_once_with(
@@ -267,14 +259,14 @@ async def test_handle_best_opportunities_impl_success(
 async def test_handle_best_opportunities_impl_error(
     mock_find_opportunities,
     mock_query,
-    mock_context,
+    mock_context_with_game,
 ):
     """Тестирует обработку ошибки при поиске лучших арбитражных возможностей."""
     # Настройка мока для генерации ошибки
     mock_find_opportunities.side_effect = Exception("Search error")
 
     # Вызываем тестируемую функцию
-    await handle_best_opportunities_impl(mock_query, mock_context)
+    await handle_best_opportunities_impl(mock_query, mock_context_with_game)
 
     # Проверяем финальный вызов edit_message_text
     args, kwargs = mock_query.edit_message_text.call_args
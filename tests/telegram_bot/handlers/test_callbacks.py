@@ -3,11 +3,9 @@
 Этот модуль содержит тесты функций, которые являются обертками для реальных обработчиков.
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import patch
 
 import pytest
-from telegram import Update
-from telegram.ext import CallbackContext
 
 from src.telegram_bot.handlers.callbacks import (
     arbitrage_callback,
@@ -17,100 +15,49 @@ from src.telegram_bot.handlers.callbacks import (
 
 
 @pytest.fixture
-def mock_update():
-    """Создает мок объекта Update для тестирования."""
-    update = MagicMock(spec=Update)
-    update.callback_query = MagicMock()
-    update.callback_query.data = "arbitrage"
-    update.callback_query.answer = AsyncMock()
-    update.callback_query.edit_message_text = AsyncMock()
-    return update
-
-
-@pytest.fixture
-def mock_context():
-    """Создает мок объекта CallbackContext для тестирования."""
-    context = MagicMock(spec=CallbackContext)
-    context.user_data = {"current_game": "csgo"}
-    return context
-
-
-@pytest.mark.asyncio
-@patch("src.telegram_bot.handlers.callbacks.arbitrage_callback_impl")
-async def test_arbitrage_callback(mock_arbitrage_impl, mock_update, mock_context):
-    """Тестирует, что arbitrage_callback вызывает правильную реализацию."""
-    # Настраиваем мок для возврата
-    mock_arbitrage_impl.return_value = None
-
-    # Вызываем тестируемую функцию
-    await arbitrage_callback(mock_update, mock_context)
-
-    # Проверяем, что была вызвана правильная функция с правильными аргументами
-    mock_arbitrage_impl.assert_called_once_with(mock_update, mock_context)
-
-
-@pytest.mark.asyncio
-@patch("src.telegram_bot.handlers.callbacks.handle_dmarket_arbitrage_impl")
-async def test_handle_dmarket_arbitrage(
-    mock_dmarket_arbitrage_impl,
-    mock_update,
-    mock_context,
-):
-    """Тестирует, что handle_dmarket_arbitrage вызывает правильную реализацию."""
-    # Настраиваем тестовые данные
-    mode = "boost"
-    query = mock_update.callback_query
-
-    # Настраиваем мок для возврата
-    mock_dmarket_arbitrage_impl.return_value = None
-
-    # Вызываем тестируемую функцию
-    await handle_dmarket_arbitrage(query, mock_context, mode)
-
-    # Проверяем, что была вызвана правильная функция с правильными аргументами
-    mock_dmarket_arbitrage_impl.assert_called_once_with(query, mock_context, mode)
-
-
-@pytest.mark.asyncio
-@patch("src.telegram_bot.handlers.callbacks.handle_best_opportunities_impl")
-async def test_handle_best_opportunities(
-    mock_best_opportunities_impl,
-    mock_update,
-    mock_context,
-):
-    """Тестирует, что handle_best_opportunities вызывает правильную реализацию."""
-    # Настраиваем тестовые данные
-    query = mock_update.callback_query
-
-    # Настраиваем мок для возврата
-    mock_best_opportunities_impl.return_value = None
-
-    # Вызываем тестируемую функцию
-    await handle_best_opportunities(query, mock_context)
-
-    # Проверяем, что была вызвана правильная функция с правильными аргументами
-    mock_best_opportunities_impl.assert_called_once_with(query, mock_context)
+def mock_update(callback_update):
+    """Возвращает общий мок Update с callback-запросом раздела арбитража."""
+    callback_update.callback_query.data = "arbitrage"
+    return callback_update
+
+
+# (обертка, имя реализации в модуле callbacks, передается ли query вместо update,
+#  дополнительные аргументы)
+CALLBACK_CASES = [
+    pytest.param(arbitrage_callback, "arbitrage_callback_impl", False, (), id="arbitrage"),
+    pytest.param(
+        handle_dmarket_arbitrage, "handle_dmarket_arbitrage_impl", True, ("boost",), id="dmarket-boost",
+    ),
+    pytest.param(
+        handle_dmarket_arbitrage, "handle_dmarket_arbitrage_impl", True, ("mid",), id="dmarket-mid",
+    ),
+    pytest.param(
+        handle_dmarket_arbitrage, "handle_dmarket_arbitrage_impl", True, ("pro",), id="dmarket-pro",
+    ),
+    pytest.param(
+        handle_best_opportunities, "handle_best_opportunities_impl", True, (), id="best-opportunities",
+    ),
+]
 
 
 @pytest.mark.asyncio
-@patch("src.telegram_bot.handlers.callbacks.handle_dmarket_arbitrage_impl")
-async def test_handle_dmarket_arbitrage_different_modes(
-    mock_dmarket_arbitrage_impl,
+@pytest.mark.parametrize(("handler", "impl_name", "pass_query", "extra_args"), CALLBACK_CASES)
+async def test_callback_wrappers(
+    handler,
+    impl_name,
+    pass_query,
+    extra_args,
     mock_update,
-    mock_context,
+    mock_context_with_game,
 ):
-    """Тестирует, что handle_dmarket_arbitrage правильно передает разные режимы."""
-    # Настраиваем тестовые данные
-    query = mock_update.callback_query
-    test_modes = ["boost", "mid", "pro"]
+    """Тестирует, что обертки вызывают правильную реализацию с теми же аргументами."""
+    target = mock_update.callback_query if pass_query else mock_update
 
-    # Настраиваем мок для возврата
-    mock_dmarket_arbitrage_impl.return_value = None
+    with patch(f"src.telegram_bot.handlers.callbacks.{impl_name}") as mock_impl:
+        mock_impl.return_value = None
 
-    # Тестируем с разными режимами
-    for mode in test_modes:
-        # Вызываем тестируемую функцию с разными режимами
-        await handle_dmarket_arbitrage(query, mock_context, mode)
+        # Вызываем тестируемую функцию
+        await handler(target, mock_context_with_game, *extra_args)
 
         # Проверяем, что была вызвана правильная функция с правильными аргументами
-        mock_dmarket_arbitrage_impl.assert_called_with(query, mock_context, mode)
+        mock_impl.assert_called_once_with(target, mock_context_with_game, *extra_args)
@@ -3,21 +3,39 @@
 Этот модуль содержит тесты для обработчиков ошибок в src.telegram_bot.handlers.error_handlers.
 """
 
+from functools import partial
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from telegram import Message, Update
+from telegram.constants import ParseMode
 from telegram.ext import CallbackContext
 
 from src.telegram_bot.handlers.error_handlers import error_handler
 from src.utils.api_error_handling import APIError
+from tests._util import assert_contains_all
+
+
+# Списки атрибутов для spec собираются один раз на модуль: MagicMock со spec
+# в виде списка имен не обходит классы telegram заново для каждого теста
+UPDATE_SPEC = dir(Update)
+MESSAGE_SPEC = dir(Message)
+CONTEXT_SPEC = dir(CallbackContext)
+
+# Фабрики ошибок: экземпляр исключения создается в теле теста, а не при сборе
+ERR_RATE_LIMIT = partial(APIError, "Rate limit exceeded", status_code=429)
+ERR_UNAUTHORIZED = partial(APIError, "Unauthorized", status_code=401)
+ERR_NOT_FOUND = partial(APIError, "Resource not found", status_code=404)
+ERR_SERVER = partial(APIError, "Internal server error", status_code=500)
+ERR_BAD_REQUEST = partial(APIError, "Bad request parameters", status_code=400)
+ERR_GENERIC = partial(Exception, "Generic error")
 
 
 @pytest.fixture
 def mock_update():
     """Создает мок объекта Update для тестирования."""
-    update = MagicMock(spec=Update)
-    update.effective_message = MagicMock(spec=Message)
+    update = MagicMock(spec=UPDATE_SPEC)
+    update.effective_message = MagicMock(spec=MESSAGE_SPEC)
     update.effective_message.reply_text = AsyncMock()
     return update
 
@@ -25,107 +43,40 @@ def mock_update():
 @pytest.fixture
 def mock_context():
     """Создает мок объекта CallbackContext для тестирования."""
-    context = MagicMock(spec=CallbackContext)
-    return context
+    return MagicMock(spec=CONTEXT_SPEC)
 
 
 @pytest.mark.asyncio
-async def test_error_handler_rate_limit_error(mock_update, mock_context):
-    """Тестирует обработку ошибки превышения лимита запросов (429)."""
+@pytest.mark.parametrize(
+    ("make_error", "expected"),
+    [
+        (ERR_RATE_LIMIT, ("Ошибка API DMarket", "Код: 429", "Rate limit exceeded")),
+        (ERR_UNAUTHORIZED, ("Ошибка API DMarket", "Код: 401", "Unauthorized")),
+        (ERR_NOT_FOUND, ("Ошибка API DMarket", "Код: 404", "Resource not found")),
+        (ERR_SERVER, ("Ошибка API DMarket", "Код: 500", "Internal server error")),
+        (ERR_BAD_REQUEST, ("Ошибка API DMarket", "Код: 400", "Bad request parameters")),
+        (ERR_GENERIC, ("Произошла ошибка", "попробуйте позднее")),
+    ],
+    ids=["rate_limit", "unauthorized", "not_found", "server", "other_api", "generic"],
+)
+async def test_error_handler_reply(mock_update, mock_context, make_error, expected):
+    """Тестирует текст ответа пользователю для разных типов ошибок.
+
+    Ошибки API показываются с кодом и сообщением и кнопкой возврата к арбитражу,
+    остальные — общим текстом без клавиатуры.
+    """
     # Настраиваем ошибку в контексте
-    mock_context.error = APIError("Rate limit exceeded", status_code=429)
+    mock_context.error = make_error()
 
     # Вызываем тестируемую функцию
     await error_handler(mock_update, mock_context)
 
-    # Проверяем, что был вызван reply_text с правильным сообщением
+    # Проверяем, что был вызван reply_text, и содержимое сообщения
     mock_update.effective_message.reply_text.assert_called_once()
-
-    # Проверяем содержимое сообщения
-    args, kwargs = mock_update.effective_message.reply_text.call_args
-    message_text = args[0]
-    assert "Превышен лимит запросов" in message_text
-    assert "подождите" in message_text
-
-
-@pytest.mark.asyncio
-async def test_error_handler_auth_error(mock_update, mock_context):
-    """Тестирует обработку ошибки авторизации (401)."""
-    # Настраиваем ошибку в контексте
-    mock_context.error = APIError("Unauthorized", status_code=401)
-
-    # Вызываем тестируемую функцию
-    await error_handler(mock_update, mock_context)
-
-    # Проверяем содержимое сообщения
-    args, kwargs = mock_update.effective_message.reply_text.call_args
-    message_text = args[0]
-    assert "Ошибка авторизации" in message_text
-    assert "Проверьте API-ключи" in message_text
-
-
-@pytest.mark.asyncio
-async def test_error_handler_not_found_error(mock_update, mock_context):
-    """Тестирует обработку ошибки "не найдено" (404)."""
-    # Настраиваем ошибку в контексте
-    mock_context.error = APIError("Resource not found", status_code=404)
-
-    # Вызываем тестируемую функцию
-    await error_handler(mock_update, mock_context)
-
-    # Проверяем содержимое сообщения
-    args, kwargs = mock_update.effective_message.reply_text.call_args
-    message_text = args[0]
-    assert "не найден" in message_text
-
-
-@pytest.mark.asyncio
-async def test_error_handler_server_error(mock_update, mock_context):
-    """Тестирует обработку серверной ошибки (5xx)."""
-    # Настраиваем ошибку в контексте
-    mock_context.error = APIError("Internal server error", status_code=500)
-
-    # Вызываем тестируемую функцию
-    await error_handler(mock_update, mock_context)
-
-    # Проверяем содержимое сообщения
-    args, kwargs = mock_update.effective_message.reply_text.call_args
-    message_text = args[0]
-    assert "Серверная ошибка" in message_text
-    assert "попробуйте позже" in message_text.lower()
-
-
-@pytest.mark.asyncio
-async def test_error_handler_other_api_error(mock_update, mock_context):
-    """Тестирует обработку других ошибок API."""
-    # Настраиваем ошибку в контексте
-    error_message = "Bad request parameters"
-    mock_context.error = APIError(error_message, status_code=400)
-
-    # Вызываем тестируемую функцию
-    await error_handler(mock_update, mock_context)
-
-    # Проверяем содержимое сообщения
-    args, kwargs = mock_update.effective_message.reply_text.call_args
-    message_text = args[0]
-    assert "Ошибка DMarket API" in message_text
-    assert error_message in message_text
-
-
-@pytest.mark.asyncio
-async def test_error_handler_generic_error(mock_update, mock_context):
-    """Тестирует обработку обычной ошибки (не APIError)."""
-    # Настраиваем обычную ошибку в контексте
-    mock_context.error = Exception("Generic error")
-
-    # Вызываем тестируемую функцию
-    await error_handler(mock_update, mock_context)
-
-    # Проверяем содержимое сообщения
     args, kwargs = mock_update.effective_message.reply_text.call_args
-    message_text = args[0]
-    assert "Произошла ошибка" in message_text
-    assert "Попробуйте позже" in message_text
+    assert_contains_all(args[0], expected)
+    assert kwargs["parse_mode"] == ParseMode.HTML
+    assert (kwargs["reply_markup"] is not None) == isinstance(mock_context.error, APIError)
 
 
 @pytest.mark.asyncio
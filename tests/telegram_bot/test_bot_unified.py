@@ -9,19 +9,11 @@
 6. Интеграции с DMarket API
 """
 
-import os
-
-# Импортируем необходимые модули для тестирования
-import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from telegram import CallbackQuery, Chat, Message, Update, User
-from telegram.ext import Application, ContextTypes, ExtBot
-
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
 
-from telegram_bot.bot_v2 import (
+from src.telegram_bot.bot_v2 import (
     balance_command,
     format_balance_message,
     handle_error,
@@ -34,30 +26,11 @@ from telegram_bot.bot_v2 import (
 # Фикстуры для тестирования
 
 
-@pytest.fixture
-def mock_update():
-    """Создает мок объекта Update для Telegram."""
-    update = MagicMock(spec=Update)
-    update.effective_chat = MagicMock(spec=Chat)
-    update.effective_chat.id = 12345
-    update.message = MagicMock(spec=Message)
-    update.message.chat = update.effective_chat
-    update.message.from_user = MagicMock(spec=User)
-    update.message.from_user.id = 12345
-    update.message.from_user.first_name = "Test User"
-    update.message.from_user.username = "testuser"
-    update.message.text = "/start"
-    update.message.reply_text = AsyncMock()
-    update.message.reply_html = AsyncMock()
-    update.callback_query = None
-    return update
-
-
 @pytest.fixture
 def mock_context():
     """Создает мок объекта Context для Telegram."""
-    context = MagicMock(spec=ContextTypes.DEFAULT_TYPE)
-    context.bot = MagicMock(spec=ExtBot)
+    context = MagicMock()
+    context.bot = MagicMock()
     context.bot.send_message = AsyncMock()
     return context
 
@@ -65,7 +38,7 @@ def mock_context():
 @pytest.fixture
 def mock_callback_query(mock_update):
     """Создает мок объекта CallbackQuery для Telegram."""
-    callback_query = MagicMock(spec=CallbackQuery)
+    callback_query = MagicMock()
     callback_query.message = mock_update.message
     callback_query.data = "test_data"
     callback_query.from_user = mock_update.message.from_user
@@ -77,7 +50,7 @@ def mock_callback_query(mock_update):
 @pytest.fixture
 def mock_application():
     """Создает мок объекта Application для Telegram."""
-    app = MagicMock(spec=Application)
+    app = MagicMock()
     app.add_handler = MagicMock()
     app.add_error_handler = MagicMock()
     return app
@@ -0,0 +1,43 @@
+"""Тесты для функций форматирования из модуля utils/formatting.py
+"""
+
+import pytest
+
+from src.telegram_bot.utils.formatting import format_best_opportunities, format_dmarket_results
+from tests._util import assert_contains_all
+
+# Подстроки, общие для результатов обоих форматтеров
+COMMON_SUBSTRINGS = (
+    "CS2",
+    "AK-47 | Redline",
+    "AWP | Asiimov",
+    "$10.00",
+    "$1.00",
+    "$30.00",
+    "$3.00",
+)
+
+DMARKET_ITEMS = [
+    {"title": "AK-47 | Redline (Field-Tested)", "price": {"USD": 1000}, "profit": 100},
+    {"title": "AWP | Asiimov (Field-Tested)", "price": {"USD": 3000}, "profit": 300},
+]
+
+BEST_OPPORTUNITIES = [
+    {"title": "AK-47 | Redline (Field-Tested)", "price": 1000, "profit": 100},
+    {"title": "AWP | Asiimov (Field-Tested)", "price": 3000, "profit": 300},
+]
+
+
+@pytest.mark.parametrize(
+    ("formatter", "items", "extra_args", "header"),
+    [
+        (format_dmarket_results, DMARKET_ITEMS, ("mid", "csgo"), "средний трейдер"),
+        (format_best_opportunities, BEST_OPPORTUNITIES, ("csgo",), "Лучшие арбитражные возможности"),
+    ],
+    ids=["dmarket_results", "best_opportunities"],
+)
+def test_formatters(formatter, items, extra_args, header):
+    """Тестирует форматирование списка арбитражных возможностей."""
+    text = formatter(items, *extra_args)
+
+    assert_contains_all(text, (header, *COMMON_SUBSTRINGS))
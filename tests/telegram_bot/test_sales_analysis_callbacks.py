@@ -3,11 +3,10 @@
 Этот модуль содержит тесты для обработчиков callback-запросов для модуля анализа продаж.
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import patch
 
 import pytest
-from telegram import InlineKeyboardMarkup, Update
-from telegram.ext import CallbackContext
+from telegram import InlineKeyboardMarkup
 
 from src.telegram_bot.sales_analysis_callbacks import (
     handle_all_arbitrage_sales_callback,
@@ -18,27 +17,14 @@ from src.telegram_bot.sales_analysis_callbacks import (
     handle_setup_sales_filters_callback,
     price_trend_to_text,
 )
+from tests._util import call_text
 
 
 @pytest.fixture
-def mock_update():
-    """Создает мок объекта Update для тестирования."""
-    update = MagicMock(spec=Update)
-    update.callback_query = MagicMock()
-    update.callback_query.answer = AsyncMock()
-    update.callback_query.edit_message_text = AsyncMock()
-    update.callback_query.edit_message_reply_markup = AsyncMock()
-    update.callback_query.data = "sales_history:AWP | Asiimov (Field-Tested)"
-    update.callback_query.message = MagicMock()  # Добавляем message для query
-    return update
-
-
-@pytest.fixture
-def mock_context():
-    """Создает мок объекта CallbackContext для тестирования."""
-    context = MagicMock(spec=CallbackContext)
-    context.user_data = {"current_game": "csgo"}
-    return context
+def mock_update(callback_update):
+    """Возвращает общий мок Update с callback-запросом истории продаж."""
+    callback_update.callback_query.data = "sales_history:AWP | Asiimov (Field-Tested)"
+    return callback_update
 
 
 @pytest.mark.asyncio
@@ -46,7 +32,7 @@ def mock_context():
 async def test_handle_sales_history_callback_success(
     mock_execute_api,
     mock_update,
-    mock_context,
+    mock_context_with_game,
 ):
     """Тестирует успешную обработку запроса истории продаж."""
     # Настройка мока для execute_api_request
@@ -74,7 +60,7 @@ async def test_handle_sales_history_callback_success(
     mock_execute_api.return_value = mock_sales_data
 
     # Вызываем тестируемую функцию
-    await handle_sales_history_callback(mock_update, mock_context)
+    await handle_sales_history_callback(mock_update, mock_context_with_game)
 
     # Проверяем, что answer был вызван
     mock_update.callback_query.answer.assert_called_once()
@@ -83,14 +69,7 @@ async def test_handle_sales_history_callback_success(
     mock_update.callback_query.edit_message_text.assert_called()
 
     # Проверяем содержимое сообщения
-    call_args = mock_update.callback_query.edit_message_text.call_args_list[-1]
-    # Получаем текст сообщения безопасным способом
-    if call_args.kwargs and "text" in call_args.kwargs:
-        message_text = call_args.kwargs["text"]
-    elif call_args.args:
-        message_text = call_args.args[0]
-    else:
-        message_text = ""
+    message_text = call_text(mock_update.callback_query.edit_message_text)
 
     # Проверяем, что в тексте содержится нужная информация
     assert "История продаж" in message_text
@@ -99,7 +78,7 @@ async def test_handle_sales_history_callback_success(
     assert "$100.00 USD" in message_text
 
     # Проверяем, что клавиатура содержит нужные кнопки
-    keyboard = call_args.kwargs.get("reply_markup")
+    keyboard = mock_update.callback_query.edit_message_text.call_args.kwargs.get("reply_markup")
     assert isinstance(keyboard, InlineKeyboardMarkup)
     assert len(keyboard.inline_keyboard) > 0
 
@@ -112,23 +91,17 @@ async def test_handle_sales_history_callback_success(
 async def test_handle_sales_history_callback_no_data(
     mock_execute_api,
     mock_update,
-    mock_context,
+    mock_context_with_game,
 ):
     """Тестирует обработку запроса, когда данные о продажах отсутствуют."""
     # Настройка мока для execute_api_request
     mock_execute_api.return_value = {"LastSales": []}
 
     # Вызываем тестируемую функцию
-    await handle_sales_history_callback(mock_update, mock_context)
+    await handle_sales_history_callback(mock_update, mock_context_with_game)
 
     # Проверяем, что edit_message_text был вызван с сообщением об ошибке
-    call_args = mock_update.callback_query.edit_message_text.call_args
-    if call_args.kwargs and "text" in call_args.kwargs:
-        message_text = call_args.kwargs["text"]
-    elif call_args.args:
-        message_text = call_args.args[0]
-    else:
-        message_text = ""
+    message_text = call_text(mock_update.callback_query.edit_message_text)
 
     assert "Не удалось найти историю продаж" in message_text
 
@@ -138,7 +111,7 @@ async def test_handle_sales_history_callback_no_data(
 async def test_handle_sales_history_callback_api_error(
     mock_execute_api,
     mock_update,
-    mock_context,
+    mock_context_with_game,
 ):
     """Тестирует обработку ошибки API при запросе истории продаж."""
     # Настройка мока для execute_api_request
@@ -147,16 +120,10 @@ async def test_handle_sales_history_callback_api_error(
     mock_execute_api.side_effect = APIError("Ошибка API", status_code=500)
 
     # Вызываем тестируемую функцию
-    await handle_sales_history_callback(mock_update, mock_context)
+    await handle_sales_history_callback(mock_update, mock_context_with_game)
 
     # Проверяем, что edit_message_text был вызван с сообщением об ошибке
-    call_args = mock_update.callback_query.edit_message_text.call_args
-    if call_args.kwargs and "text" in call_args.kwargs:
-        message_text = call_args.kwargs["text"]
-    elif call_args.args:
-        message_text = call_args.args[0]
-    else:
-        message_text = ""
+    message_text = call_text(mock_update.callback_query.edit_message_text)
 
     assert "Ошибка при получении истории продаж" in message_text
 
@@ -166,7 +133,7 @@ async def test_handle_sales_history_callback_api_error(
 async def test_handle_liquidity_callback_success(
     mock_execute_api,
     mock_update,
-    mock_context,
+    mock_context_with_game,
 ):
     """Тестирует успешную обработку запроса анализа ликвидности."""
     # Настройка данных callback
@@ -192,20 +159,13 @@ async def test_handle_liquidity_callback_success(
     mock_execute_api.return_value = mock_analysis_data
 
     # Вызываем тестируемую функцию
-    await handle_liquidity_callback(mock_update, mock_context)
+    await handle_liquidity_callback(mock_update, mock_context_with_game)
 
     # Проверяем, что edit_message_text был вызван
     mock_update.callback_query.edit_message_text.assert_called()
 
     # Проверяем содержимое сообщения
-    call_args = mock_update.callback_query.edit_message_text.call_args_list[-1]
-    # Получаем текст сообщения безопасным способом
-    if call_args.kwargs and "text" in call_args.kwargs:
-        message_text = call_args.kwargs["text"]
-    elif call_args.args:
-        message_text = call_args.args[0]
-    else:
-        message_text = ""
+    message_text = call_text(mock_update.callback_query.edit_message_text)
 
     # Проверяем, что в тексте содержится нужная информация
     assert "Анализ ликвидности" in message_text
@@ -215,7 +175,7 @@ async def test_handle_liquidity_callback_success(
     assert "5.20" in message_text
 
     # Проверяем, что клавиатура содержит нужные кнопки
-    keyboard = call_args.kwargs.get("reply_markup")
+    keyboard = mock_update.callback_query.edit_message_text.call_args.kwargs.get("reply_markup")
     assert isinstance(keyboard, InlineKeyboardMarkup)
     assert len(keyboard.inline_keyboard) > 0
 
@@ -225,7 +185,7 @@ async def test_handle_liquidity_callback_success(
 async def test_handle_liquidity_callback_no_data(
     mock_execute_api,
     mock_update,
-    mock_context,
+    mock_context_with_game,
 ):
     """Тестирует обработку запроса, когда данные о ликвидности отсутствуют."""
     # Настройка данных callback
@@ -242,16 +202,10 @@ async def test_handle_liquidity_callback_no_data(
     mock_execute_api.return_value = mock_analysis_data
 
     # Вызываем тестируемую функцию
-    await handle_liquidity_callback(mock_update, mock_context)
+    await handle_liquidity_callback(mock_update, mock_context_with_game)
 
     # Проверяем содержимое сообщения
-    call_args = mock_update.callback_query.edit_message_text.call_args
-    if call_args.kwargs and "text" in call_args.kwargs:
-        message_text = call_args.kwargs["text"]
-    elif call_args.args:
-        message_text = call_args.args[0]
-    else:
-        message_text = ""
+    message_text = call_text(mock_update.callback_query.edit_message_text)
 
     assert "Не удалось найти данные о продажах" in message_text
 
@@ -261,7 +215,7 @@ async def test_handle_liquidity_callback_no_data(
 async def test_handle_refresh_sales_callback(
     mock_execute_api,
     mock_update,
-    mock_context,
+    mock_context_with_game,
 ):
     """Тестирует обработку запроса на обновление анализа продаж."""
     # Настройка данных callback
@@ -285,20 +239,13 @@ async def test_handle_refresh_sales_callback(
     mock_execute_api.return_value = mock_analysis_data
 
     # Вызываем тестируемую функцию
-    await handle_refresh_sales_callback(mock_update, mock_context)
+    await handle_refresh_sales_callback(mock_update, mock_context_with_game)
 
     # Проверяем, что edit_message_text был вызван
     mock_update.callback_query.edit_message_text.assert_called()
 
     # Проверяем содержимое сообщения
-    call_args = mock_update.callback_query.edit_message_text.call_args_list[-1]
-    # Получаем текст сообщения безопасным способом
-    if call_args.kwargs and "text" in call_args.kwargs:
-        message_text = call_args.kwargs["text"]
-    elif call_args.args:
-        message_text = call_args.args[0]
-    else:
-        message_text = ""
+    message_text = call_text(mock_update.callback_query.edit_message_text)
 
     # Проверяем, что в тексте содержится нужная информация
     assert "Анализ продаж" in message_text
@@ -312,7 +259,7 @@ async def test_handle_refresh_sales_callback(
 async def test_handle_all_arbitrage_sales_callback(
     mock_execute_api,
     mock_update,
-    mock_context,
+    mock_context_with_game,
 ):
     """Тестирует обработку запроса на показ всех арбитражных возможностей."""
     # Настройка данных callback
@@ -351,20 +298,13 @@ async def test_handle_all_arbitrage_sales_callback(
     mock_execute_api.return_value = mock_opportunities
 
     # Вызываем тестируемую функцию
-    await handle_all_arbitrage_sales_callback(mock_update, mock_context)
+    await handle_all_arbitrage_sales_callback(mock_update, mock_context_with_game)
 
     # Проверяем, что edit_message_text был вызван
     mock_update.callback_query.edit_message_text.assert_called()
 
     # Проверяем содержимое сообщения
-    call_args = mock_update.callback_query.edit_message_text.call_args_list[-1]
-    # Получаем текст сообщения безопасным способом
-    if call_args.kwargs and "text" in call_args.kwargs:
-        message_text = call_args.kwargs["text"]
-    elif call_args.args:
-        message_text = call_args.args[0]
-    else:
-        message_text = ""
+    message_text = call_text(mock_update.callback_query.edit_message_text)
 
     # Проверяем, что в тексте содержится нужная информация
     # Обновленная проверка - ищем любую из фраз
@@ -384,25 +324,19 @@ async def test_handle_all_arbitrage_sales_callback(
 
 
 @pytest.mark.asyncio
-async def test_handle_setup_sales_filters_callback(mock_update, mock_context):
+async def test_handle_setup_sales_filters_callback(mock_update, mock_context_with_game):
     """Тестирует обработку запроса на настройку фильтров продаж."""
     # Настройка данных callback
     mock_update.callback_query.data = "setup_sales_filters:csgo"
 
     # Вызываем тестируемую функцию
-    await handle_setup_sales_filters_callback(mock_update, mock_context)
+    await handle_setup_sales_filters_callback(mock_update, mock_context_with_game)
 
     # Проверяем, что edit_message_text был вызван
     mock_update.callback_query.edit_message_text.assert_called_once()
 
     # Проверяем содержимое сообщения
-    call_args = mock_update.callback_query.edit_message_text.call_args
-    if call_args.kwargs and "text" in call_args.kwargs:
-        message_text = call_args.kwargs["text"]
-    elif call_args.args:
-        message_text = call_args.args[0]
-    else:
-        message_text = ""
+    message_text = call_text(mock_update.callback_query.edit_message_text)
 
     # Проверяем, что в тексте содержится нужная информация
     assert "Настройка фильтров" in message_text
@@ -410,7 +344,7 @@ async def test_handle_setup_sales_filters_callback(mock_update, mock_context):
     assert any(game_name in message_text for game_name in ["CS2", "CSGO", "csgo"])
 
     # Проверяем, что клавиатура содержит нужные кнопки
-    keyboard = call_args.kwargs.get("reply_markup")
+    keyboard = mock_update.callback_query.edit_message_text.call_args.kwargs.get("reply_markup")
     assert isinstance(keyboard, InlineKeyboardMarkup)
     assert len(keyboard.inline_keyboard) > 0
 
@@ -422,7 +356,7 @@ async def test_handle_all_volume_stats_callback(
     mock_get_volume_stats,
     mock_execute_api,
     mock_update,
-    mock_context,
+    mock_context_with_game,
 ):
     """Тестирует обработку запроса на показ статистики объемов продаж."""
     # Настройка данных callback
@@ -454,19 +388,13 @@ async def test_handle_all_volume_stats_callback(
     mock_execute_api.return_value = mock_volume_stats
 
     # Вызываем тестируемую функцию
-    await handle_all_volume_stats_callback(mock_update, mock_context)
+    await handle_all_volume_stats_callback(mock_update, mock_context_with_game)
 
     # Проверяем, что edit_message_text был вызван
     mock_update.callback_query.edit_message_text.assert_called()
 
-    # Проверяем содержимое сообщения - используем безопасный способ получения текста
-    call_args = mock_update.callback_query.edit_message_text.call_args_list[-1]
-    if call_args.kwargs and "text" in call_args.kwargs:
-        message_text = call_args.kwargs["text"]
-    elif call_args.args:
-        message_text = call_args.args[0]
-    else:
-        message_text = ""
+    # Проверяем содержимое сообщения
+    message_text = call_text(mock_update.callback_query.edit_message_text)
 
     # Проверяем, что в тексте содержится нужная информация
     # Чтобы устранить проблемы с Unicode, проверим отдельные части сообщения
@@ -501,7 +429,7 @@ class MockRefreshVolumeStatsCallback:
 
 
 @pytest.mark.asyncio
-async def test_handle_refresh_volume_stats_callback(mock_update, mock_context):
+async def test_handle_refresh_volume_stats_callback(mock_update, mock_context_with_game):
     """Тестирует обработку запроса на обновление статистики объемов продаж."""
     # Настройка данных callback
     mock_update.callback_query.data = "refresh_volume_stats:csgo"
@@ -514,14 +442,14 @@ async def test_handle_refresh_volume_stats_callback(mock_update, mock_context):
         # Вызываем функцию через наш мок
         await MockRefreshVolumeStatsCallback.mock_implementation(
             mock_update,
-            mock_context,
+            mock_context_with_game,
         )
 
     # Проверяем, что ответ на callback был выполнен
     mock_update.callback_query.answer.assert_called_once()
 
     # Проверяем, что game был добавлен в user_data
-    assert mock_context.user_data["current_game"] == "csgo"
+    assert mock_context_with_game.user_data["current_game"] == "csgo"
 
     # Проверяем, что update.message был присвоен правильно
     assert mock_update.message is mock_update.callback_query.message
@@ -7,7 +7,6 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from telegram import Message, Update
-from telegram.ext import CallbackContext
 
 from src.telegram_bot.sales_analysis_handlers import (
     get_liquidity_emoji,
@@ -17,6 +16,7 @@ from src.telegram_bot.sales_analysis_handlers import (
     handle_sales_analysis,
     handle_sales_volume_stats,
 )
+from tests._util import call_text
 
 
 @pytest.fixture
@@ -29,20 +29,12 @@ def mock_update():
     return update
 
 
-@pytest.fixture
-def mock_context():
-    """Создает мок объекта CallbackContext для тестирования."""
-    context = MagicMock(spec=CallbackContext)
-    context.user_data = {"current_game": "csgo"}
-    return context
-
-
 @pytest.mark.asyncio
 @patch("src.telegram_bot.sales_analysis_handlers.execute_api_request")
 async def test_handle_sales_analysis_success(
     mock_execute_api,
     mock_update,
-    mock_context,
+    mock_context_with_game,
 ):
     """Тестирует успешную обработку запроса анализа продаж."""
     # Настройка мока для reply_text (для получения сообщения, которое потом редактируется)
@@ -68,7 +60,7 @@ async def test_handle_sales_analysis_success(
     mock_execute_api.return_value = mock_analysis_data
 
     # Вызываем тестируемую функцию
-    await handle_sales_analysis(mock_update, mock_context)
+    await handle_sales_analysis(mock_update, mock_context_with_game)
 
     # Проверяем, что reply_text был вызван
     mock_update.message.reply_text.assert_called_once()
@@ -76,14 +68,8 @@ async def test_handle_sales_analysis_success(
     # Проверяем, что edit_text был вызван
     reply_message.edit_text.assert_called_once()
 
-    # Проверяем содержимое сообщения безопасным методом
-    call_args = reply_message.edit_text.call_args
-    if call_args.kwargs and "text" in call_args.kwargs:
-        message_text = call_args.kwargs["text"]
-    elif call_args.args:
-        message_text = call_args.args[0]
-    else:
-        message_text = ""
+    # Проверяем содержимое сообщения
+    message_text = call_text(reply_message.edit_text)
 
     # Проверяем, что в тексте содержится нужная информация
     assert "Анализ продаж" in message_text
@@ -104,7 +90,7 @@ async def test_handle_sales_analysis_success(
 async def test_handle_sales_analysis_no_data(
     mock_execute_api,
     mock_update,
-    mock_context,
+    mock_context_with_game,
 ):
     """Тестирует обработку запроса, когда данные о продажах отсутствуют."""
     # Настройка мока для reply_text
@@ -119,16 +105,10 @@ async def test_handle_sales_analysis_no_data(
     mock_execute_api.return_value = mock_analysis_data
 
     # Вызываем тестируемую функцию
-    await handle_sales_analysis(mock_update, mock_context)
+    await handle_sales_analysis(mock_update, mock_context_with_game)
 
-    # Проверяем содержимое сообщения безопасным методом
-    call_args = reply_message.edit_text.call_args
-    if call_args.kwargs and "text" in call_args.kwargs:
-        message_text = call_args.kwargs["text"]
-    elif call_args.args:
-        message_text = call_args.args[0]
-    else:
-        message_text = ""
+    # Проверяем содержимое сообщения
+    message_text = call_text(reply_message.edit_text)
 
     assert "Не удалось найти данные о продажах" in message_text
 
@@ -138,7 +118,7 @@ async def test_handle_sales_analysis_no_data(
 async def test_handle_sales_analysis_api_error(
     mock_execute_api,
     mock_update,
-    mock_context,
+    mock_context_with_game,
 ):
     """Тестирует обработку ошибки API при запросе анализа продаж."""
     # Настройка мока для reply_text
@@ -152,16 +132,10 @@ async def test_handle_sales_analysis_api_error(
     mock_execute_api.side_effect = APIError("Ошибка API", status_code=500)
 
     # Вызываем тестируемую функцию
-    await handle_sales_analysis(mock_update, mock_context)
+    await handle_sales_analysis(mock_update, mock_context_with_game)
 
-    # Проверяем содержимое сообщения безопасным методом
-    call_args = reply_message.edit_text.call_args
-    if call_args.kwargs and "text" in call_args.kwargs:
-        message_text = call_args.kwargs["text"]
-    elif call_args.args:
-        message_text = call_args.args[0]
-    else:
-        message_text = ""
+    # Проверяем содержимое сообщения
+    message_text = call_text(reply_message.edit_text)
 
     assert "Ошибка при получении данных о продажах" in message_text
 
@@ -171,14 +145,14 @@ async def test_handle_sales_analysis_api_error(
 async def test_handle_sales_analysis_missing_item_name(
     mock_execute_api,
     mock_update,
-    mock_context,
+    mock_context_with_game,
 ):
     """Тестирует обработку запроса без указания названия предмета."""
     # Изменяем текст запроса без названия предмета
     mock_update.message.text = "/sales_analysis"
 
     # Вызываем тестируемую функцию
-    await handle_sales_analysis(mock_update, mock_context)
+    await handle_sales_analysis(mock_update, mock_context_with_game)
 
     # Проверяем, что был вызван reply_text с сообщением об ошибке
     args, kwargs = mock_update.message.reply_text.call_args
@@ -188,7 +162,7 @@ async def test_handle_sales_analysis_missing_item_name(
 
 @pytest.mark.asyncio
 @patch("src.telegram_bot.sales_analysis_handlers.execute_api_request")
-async def test_handle_arbitrage_with_sales(mock_execute_api, mock_update, mock_context):
+async def test_handle_arbitrage_with_sales(mock_execute_api, mock_update, mock_context_with_game):
     """Тестирует обработку запроса на поиск арбитражных возможностей с учетом продаж."""
     # Настройка мока для reply_text
     reply_message = MagicMock()
@@ -228,7 +202,7 @@ async def test_handle_arbitrage_with_sales(mock_execute_api, mock_update, mock_c
     mock_execute_api.return_value = mock_results
 
     # Вызываем тестируемую функцию
-    await handle_arbitrage_with_sales(mock_update, mock_context)
+    await handle_arbitrage_with_sales(mock_update, mock_context_with_game)
 
     # Проверяем, что reply_text был вызван
     mock_update.message.reply_text.assert_called_once()
@@ -236,14 +210,8 @@ async def test_handle_arbitrage_with_sales(mock_execute_api, mock_update, mock_c
     # Проверяем, что edit_text был вызван
     reply_message.edit_text.assert_called_once()
 
-    # Проверяем содержимое сообщения безопасным методом
-    call_args = reply_message.edit_text.call_args
-    if call_args.kwargs and "text" in call_args.kwargs:
-        message_text = call_args.kwargs["text"]
-    elif call_args.args:
-        message_text = call_args.args[0]
-    else:
-        message_text = ""
+    # Проверяем содержимое сообщения
+    message_text = call_text(reply_message.edit_text)
 
     # Проверяем, что в тексте содержится нужная информация
     assert "Арбитражные возможности" in message_text
@@ -254,7 +222,7 @@ async def test_handle_arbitrage_with_sales(mock_execute_api, mock_update, mock_c
     assert "Прибыль: $3.00" in message_text
 
     # Проверяем, что есть информация о клавиатуре
-    keyboard = call_args.kwargs.get("reply_markup")
+    keyboard = reply_message.edit_text.call_args.kwargs.get("reply_markup")
     assert keyboard is not None
 
 
@@ -263,7 +231,7 @@ async def test_handle_arbitrage_with_sales(mock_execute_api, mock_update, mock_c
 async def test_handle_arbitrage_with_sales_no_opportunities(
     mock_execute_api,
     mock_update,
-    mock_context,
+    mock_context_with_game,
 ):
     """Тестирует обработку запроса арбитража, когда возможности отсутствуют."""
     # Настройка мока для reply_text
@@ -281,23 +249,17 @@ async def test_handle_arbitrage_with_sales_no_opportunities(
     mock_execute_api.return_value = mock_results
 
     # Вызываем тестируемую функцию
-    await handle_arbitrage_with_sales(mock_update, mock_context)
+    await handle_arbitrage_with_sales(mock_update, mock_context_with_game)
 
-    # Проверяем содержимое сообщения безопасным методом
-    call_args = reply_message.edit_text.call_args
-    if call_args.kwargs and "text" in call_args.kwargs:
-        message_text = call_args.kwargs["text"]
-    elif call_args.args:
-        message_text = call_args.args[0]
-    else:
-        message_text = ""
+    # Проверяем содержимое сообщения
+    message_text = call_text(reply_message.edit_text)
 
     assert "Не найдено арбитражных возможностей" in message_text
 
 
 @pytest.mark.asyncio
 @patch("src.telegram_bot.sales_analysis_handlers.execute_api_request")
-async def test_handle_liquidity_analysis(mock_execute_api, mock_update, mock_context):
+async def test_handle_liquidity_analysis(mock_execute_api, mock_update, mock_context_with_game):
     """Тестирует обработку запроса на анализ ликвидности предмета."""
     # Настройка текста команды
     mock_update.message.text = "/liquidity AWP | Asiimov (Field-Tested)"
@@ -327,7 +289,7 @@ async def test_handle_liquidity_analysis(mock_execute_api, mock_update, mock_con
     mock_execute_api.return_value = mock_analysis_data
 
     # Вызываем тестируемую функцию
-    await handle_liquidity_analysis(mock_update, mock_context)
+    await handle_liquidity_analysis(mock_update, mock_context_with_game)
 
     # Проверяем, что reply_text был вызван
     mock_update.message.reply_text.assert_called_once()
@@ -335,14 +297,8 @@ async def test_handle_liquidity_analysis(mock_execute_api, mock_update, mock_con
     # Проверяем, что edit_text был вызван
     reply_message.edit_text.assert_called_once()
 
-    # Проверяем содержимое сообщения безопасным методом
-    call_args = reply_message.edit_text.call_args
-    if call_args.kwargs and "text" in call_args.kwargs:
-        message_text = call_args.kwargs["text"]
-    elif call_args.args:
-        message_text = call_args.args[0]
-    else:
-        message_text = ""
+    # Проверяем содержимое сообщения
+    message_text = call_text(reply_message.edit_text)
 
     # Проверяем, что в тексте содержится нужная информация
     assert "Анализ ликвидности" in message_text
@@ -354,7 +310,7 @@ async def test_handle_liquidity_analysis(mock_execute_api, mock_update, mock_con
 
 @pytest.mark.asyncio
 @patch("src.telegram_bot.sales_analysis_handlers.execute_api_request")
-async def test_handle_sales_volume_stats(mock_execute_api, mock_update, mock_context):
+async def test_handle_sales_volume_stats(mock_execute_api, mock_update, mock_context_with_game):
     """Тестирует обработку запроса на статистику объемов продаж."""
     # Настройка мока для reply_text
     reply_message = MagicMock()
@@ -387,7 +343,7 @@ async def test_handle_sales_volume_stats(mock_execute_api, mock_update, mock_con
     mock_execute_api.return_value = mock_stats
 
     # Вызываем тестируемую функцию
-    await handle_sales_volume_stats(mock_update, mock_context)
+    await handle_sales_volume_stats(mock_update, mock_context_with_game)
 
     # Проверяем, что reply_text был вызван
     mock_update.message.reply_text.assert_called_once()
@@ -395,14 +351,8 @@ async def test_handle_sales_volume_stats(mock_execute_api, mock_update, mock_con
     # Проверяем, что edit_text был вызван
     reply_message.edit_text.assert_called_once()
 
-    # Проверяем содержимое сообщения безопасным методом
-    call_args = reply_message.edit_text.call_args
-    if call_args.kwargs and "text" in call_args.kwargs:
-        message_text = call_args.kwargs["text"]
-    elif call_args.args:
-        message_text = call_args.args[0]
-    else:
-        message_text = ""
+    # Проверяем содержимое сообщения
+    message_text = call_text(reply_message.edit_text)
 
     # Проверяем, что в тексте содержится нужная информация
     assert "Статистика объема продаж" in message_text
@@ -4,11 +4,11 @@
 """
 
 import os
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, mock_open, patch
 
 import pytest
-from telegram import InlineKeyboardMarkup, Message, Update, User
-from telegram.ext import CallbackContext
+from telegram import InlineKeyboardMarkup
 
 from src.telegram_bot.settings_handlers import (
     get_localized_text,
@@ -17,32 +17,27 @@ from src.telegram_bot.settings_handlers import (
     settings_callback,
     settings_command,
 )
+from tests._util import call_text
 
 
 @pytest.fixture
 def mock_update():
-    """Создает мок объекта Update для тестирования."""
-    mock_user = MagicMock(spec=User)
-    mock_user.id = 123456789
-
-    update = MagicMock(spec=Update)
-    update.effective_user = mock_user
-    update.message = MagicMock(spec=Message)
-    update.message.reply_text = AsyncMock()
-    update.callback_query = MagicMock()
-    update.callback_query.from_user = mock_user
-    update.callback_query.data = "settings"
-    update.callback_query.answer = AsyncMock()
-    update.callback_query.edit_message_text = AsyncMock()
-    return update
-
-
-@pytest.fixture
-def mock_context():
-    """Создает мок объекта CallbackContext для тестирования."""
-    context = MagicMock(spec=CallbackContext)
-    context.user_data = {}
-    return context
+    """Создает тестовый двойник объекта Update.
+
+    Обработчики настроек используют лишь несколько атрибутов Update, поэтому
+    вместо MagicMock(spec=Update) достаточно пространства имен с AsyncMock-методами.
+    """
+    user = SimpleNamespace(id=123456789, mention_html=MagicMock(return_value="@user"))
+    return SimpleNamespace(
+        effective_user=user,
+        message=SimpleNamespace(text="", reply_text=AsyncMock()),
+        callback_query=SimpleNamespace(
+            from_user=user,
+            data="settings",
+            answer=AsyncMock(),
+            edit_message_text=AsyncMock(),
+        ),
+    )
 
 
 @pytest.fixture
@@ -241,7 +236,7 @@ async def test_settings_command(
     mock_get_localized_text,
     mock_get_user_profile,
     mock_update,
-    mock_context,
+    mock_context_empty,
 ):
     """Тестирует обработку команды /settings."""
     # Настройка моков
@@ -252,7 +247,7 @@ async def test_settings_command(
     mock_get_settings_keyboard.return_value = mock_keyboard
 
     # Вызываем тестируемую функцию
-    await settings_command(mock_update, mock_context)
+    await settings_command(mock_update, mock_context_empty)
 
     # Проверяем, что были вызваны правильные функции
     mock_get_user_profile.assert_called_once_with(mock_update.effective_user.id)
@@ -278,7 +273,7 @@ async def test_settings_callback_main_menu(
     mock_get_localized_text,
     mock_get_user_profile,
     mock_update,
-    mock_context,
+    mock_context_empty,
 ):
     """Тестирует обработку callback с основным меню настроек."""
     # Настройка моков
@@ -292,7 +287,7 @@ async def test_settings_callback_main_menu(
     mock_update.callback_query.data = "settings"
 
     # Вызываем тестируемую функцию
-    await settings_callback(mock_update, mock_context)
+    await settings_callback(mock_update, mock_context_empty)
 
     # Проверяем, что был вызван answer
     mock_update.callback_query.answer.assert_called_once()
@@ -323,7 +318,7 @@ async def test_settings_callback_language_menu(
     mock_get_localized_text,
     mock_get_user_profile,
     mock_update,
-    mock_context,
+    mock_context_empty,
 ):
     """Тестирует обработку callback с меню выбора языка."""
     # Настройка моков
@@ -337,7 +332,7 @@ async def test_settings_callback_language_menu(
     mock_update.callback_query.data = "settings_language"
 
     # Вызываем тестируемую функцию
-    await settings_callback(mock_update, mock_context)
+    await settings_callback(mock_update, mock_context_empty)
 
     # Проверяем, что был вызван answer
     mock_update.callback_query.answer.assert_called_once()
@@ -371,7 +366,7 @@ async def test_settings_callback_language_set(
     mock_save_profiles,
     mock_get_user_profile,
     mock_update,
-    mock_context,
+    mock_context_empty,
 ):
     """Тестирует обработку callback с установкой языка."""
     # Настройка моков
@@ -385,7 +380,7 @@ async def test_settings_callback_language_set(
     mock_update.callback_query.data = "language:en"
 
     # Вызываем тестируемую функцию
-    await settings_callback(mock_update, mock_context)
+    await settings_callback(mock_update, mock_context_empty)
 
     # Проверяем, что был вызван answer
     mock_update.callback_query.answer.assert_called_once()
@@ -417,7 +412,7 @@ async def test_settings_callback_toggle_trading(
     mock_save_profiles,
     mock_get_user_profile,
     mock_update,
-    mock_context,
+    mock_context_empty,
 ):
     """Тестирует обработку callback с переключением режима автоматической торговли."""
     # Настройка моков
@@ -433,7 +428,7 @@ async def test_settings_callback_toggle_trading(
     mock_update.callback_query.data = "settings_toggle_trading"
 
     # Вызываем тестируемую функцию
-    await settings_callback(mock_update, mock_context)
+    await settings_callback(mock_update, mock_context_empty)
 
     # Проверяем, что был вызван answer
     mock_update.callback_query.answer.assert_called_once()
@@ -450,20 +445,12 @@ async def test_settings_callback_toggle_trading(
     # Проверяем, что был вызван edit_message_text с правильными аргументами
     mock_update.callback_query.edit_message_text.assert_called_once()
 
-    # Исправлено: безопасный доступ к аргументам
-    call_args = mock_update.callback_query.edit_message_text.call_args
-    # Проверяем сначала kwargs, т.к. в них может быть text
-    if call_args.kwargs and "text" in call_args.kwargs:
-        message_text = call_args.kwargs["text"]
-    # Если вызов был с позиционным аргументом
-    elif call_args.args:
-        message_text = call_args.args[0]
-    else:
-        message_text = ""
+    message_text = call_text(mock_update.callback_query.edit_message_text)
 
     assert "Настройки бота" in message_text
     assert "Авто-торговля включена" in message_text
-    assert call_args.kwargs.get("reply_markup") == mock_keyboard
+    edit_kwargs = mock_update.callback_query.edit_message_text.call_args.kwargs
+    assert edit_kwargs.get("reply_markup") == mock_keyboard
 
 
 @pytest.mark.asyncio
@@ -473,7 +460,7 @@ async def test_settings_callback_api_keys(
     mock_get_back_keyboard,
     mock_get_user_profile,
     mock_update,
-    mock_context,
+    mock_context_empty,
 ):
     """Тестирует обработку callback с отображением настроек API ключей."""
     # Настройка моков
@@ -490,7 +477,7 @@ async def test_settings_callback_api_keys(
     mock_update.callback_query.data = "settings_api_keys"
 
     # Вызываем тестируемую функцию
-    await settings_callback(mock_update, mock_context)
+    await settings_callback(mock_update, mock_context_empty)
 
     # Проверяем, что был вызван answer
     mock_update.callback_query.answer.assert_called_once()
@@ -501,18 +488,10 @@ async def test_settings_callback_api_keys(
     # Проверяем, что был вызван edit_message_text с правильными аргументами
     mock_update.callback_query.edit_message_text.assert_called_once()
 
-    # Исправлено: безопасный доступ к аргументам
-    call_args = mock_update.callback_query.edit_message_text.call_args
-    # Проверяем сначала kwargs, т.к. в них может быть text
-    if call_args.kwargs and "text" in call_args.kwargs:
-        message_text = call_args.kwargs["text"]
-    # Если вызов был с позиционным аргументом
-    elif call_args.args:
-        message_text = call_args.args[0]
-    else:
-        message_text = ""
+    message_text = call_text(mock_update.callback_query.edit_message_text)
 
     # Проверяем, что показаны маскированные ключи
     assert "abcde...67890" in message_text  # Показаны первые 5 и последние 5 символов ключа
     assert "sec...456" in message_text  # Показаны первые 3 и последние 3 символа секрета
-    assert call_args.kwargs.get("reply_markup") == mock_keyboard
+    edit_kwargs = mock_update.callback_query.edit_message_text.call_args.kwargs
+    assert edit_kwargs.get("reply_markup") == mock_keyboard
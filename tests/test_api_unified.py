@@ -10,17 +10,10 @@
 """
 
 import asyncio
-import json
-import os
-import sys
-from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
-# Импортируем необходимые модули для тестирования
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
 from src.dmarket.dmarket_api import DMarketAPI
 
 # Тестовые константы
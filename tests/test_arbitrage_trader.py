@@ -1,14 +1,9 @@
 """Тесты для класса ArbitrageTrader из модуля arbitrage.py
 """
-import os
-import sys
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
-# Добавляем корневой каталог проекта в путь импорта
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
 from src.dmarket.arbitrage import (
     ArbitrageTrader,
     _get_cached_results,
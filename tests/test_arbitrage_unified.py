@@ -10,16 +10,12 @@
 7. Интеграцию с Telegram ботом
 """
 
-import os
-import sys
-import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch, call
+import random
+from unittest.mock import DEFAULT, AsyncMock, MagicMock, call, patch
 
 import pytest
-from telegram.ext import CallbackContext
 
-# Импортируем необходимые модули для тестирования
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from tests._util import assert_contains_all
 
 from dmarket.auto_arbitrage import (
     GAMES,
@@ -58,54 +54,51 @@ def mock_query():
     query.edit_message_text = AsyncMock()
     return query
 
+# Тесты генерации случайных предметов
+
 @pytest.fixture
-def mock_context():
-    """Создает мок объекта контекста."""
-    context = MagicMock(spec=CallbackContext)
-    context.user_data = {"current_game": "csgo"}
-    return context
+def deterministic_random(monkeypatch):
+    """Делает random.uniform детерминированным: возвращает середину диапазона."""
+    monkeypatch.setattr(random, "uniform", lambda a, b: (a + b) / 2)
 
-# Тесты генерации случайных предметов
 
-def test_generate_random_items():
+@pytest.mark.parametrize(("game", "count"), [("csgo", 5), ("dota2", 10)])
+def test_generate_random_items(deterministic_random, game, count):
     """Тестирует генерацию случайных предметов для тестирования арбитража."""
-    # Тестируем с разными играми и количеством предметов
-    items_csgo = generate_random_items("csgo", 5)
-    items_dota2 = generate_random_items("dota2", 10)
-
-    # Проверяем количество сгенерированных предметов
-    assert len(items_csgo) == 5
-    assert len(items_dota2) == 10
-
-    # Проверяем структуру предметов
-    for item in items_csgo:
-        assert "id" in item
-        assert "game" in item
-        assert "price" in item
-        assert "profit" in item
-        assert item["game"] == "csgo"
-        assert isinstance(item["price"], float)
-        assert isinstance(item["profit"], float)
-
-    for item in items_dota2:
-        assert "id" in item
-        assert "game" in item
-        assert "price" in item
-        assert "profit" in item
-        assert item["game"] == "dota2"
+    items = generate_random_items(game, count)
+
+    # Проверяем количество и структуру сгенерированных предметов
+    assert items == [
+        {"id": f"item_{i}", "game": game, "price": 50.5, "profit": 0.0}
+        for i in range(count)
+    ]
 
 # Тесты режимов арбитража
 
+# Предметы, которые возвращает замоканный generate_random_items в тестах режимов
+BOOST_ITEMS = (
+    {"id": "item_1", "game": "csgo", "price": 10.0, "profit": -5.0},
+    {"id": "item_2", "game": "csgo", "price": 20.0, "profit": 2.0},
+    {"id": "item_3", "game": "csgo", "price": 30.0, "profit": -2.0},
+)
+MID_ITEMS = (
+    {"id": "item_1", "game": "csgo", "price": 10.0, "profit": -5.0},
+    {"id": "item_2", "game": "csgo", "price": 20.0, "profit": 2.0},
+    {"id": "item_3", "game": "csgo", "price": 30.0, "profit": 4.5},
+    {"id": "item_4", "game": "csgo", "price": 40.0, "profit": 7.0},
+)
+PRO_ITEMS = (
+    {"id": "item_1", "game": "csgo", "price": 10.0, "profit": -5.0},
+    {"id": "item_2", "game": "csgo", "price": 20.0, "profit": 2.0},
+    {"id": "item_3", "game": "csgo", "price": 30.0, "profit": 4.5},
+    {"id": "item_4", "game": "csgo", "price": 40.0, "profit": 7.0},
+    {"id": "item_5", "game": "csgo", "price": 50.0, "profit": 10.0},
+)
+
+
 def test_arbitrage_boost():
     """Тестирует режим 'Разгон баланса' (низкая прибыль, быстрые сделки)."""
-    # Создаем мок для функции generate_random_items
-    mock_items = [
-        {"id": "item_1", "game": "csgo", "price": 10.0, "profit": -5.0},
-        {"id": "item_2", "game": "csgo", "price": 20.0, "profit": 2.0},
-        {"id": "item_3", "game": "csgo", "price": 30.0, "profit": -2.0},
-    ]
-
-    with patch("dmarket.auto_arbitrage.generate_random_items", return_value=mock_items):
+    with patch("dmarket.auto_arbitrage.generate_random_items", return_value=BOOST_ITEMS):
         result = arbitrage_boost("csgo")
 
         # Проверяем, что возвращены только предметы с отрицательной прибылью
@@ -116,15 +109,7 @@ def test_arbitrage_boost():
 
 def test_arbitrage_mid():
     """Тестирует режим 'Средний трейдер' (средняя прибыль)."""
-    # Создаем мок для функции generate_random_items
-    mock_items = [
-        {"id": "item_1", "game": "csgo", "price": 10.0, "profit": -5.0},
-        {"id": "item_2", "game": "csgo", "price": 20.0, "profit": 2.0},
-        {"id": "item_3", "game": "csgo", "price": 30.0, "profit": 4.5},
-        {"id": "item_4", "game": "csgo", "price": 40.0, "profit": 7.0},
-    ]
-
-    with patch("dmarket.auto_arbitrage.generate_random_items", return_value=mock_items):
+    with patch("dmarket.auto_arbitrage.generate_random_items", return_value=MID_ITEMS):
         result = arbitrage_mid("csgo")
 
         # Проверяем, что возвращены только предметы с прибылью от 0 до 5
@@ -135,16 +120,7 @@ def test_arbitrage_mid():
 
 def test_arbitrage_pro():
     """Тестирует режим 'Trade Pro' (высокая прибыль)."""
-    # Создаем мок для функции generate_random_items
-    mock_items = [
-        {"id": "item_1", "game": "csgo", "price": 10.0, "profit": -5.0},
-        {"id": "item_2", "game": "csgo", "price": 20.0, "profit": 2.0},
-        {"id": "item_3", "game": "csgo", "price": 30.0, "profit": 4.5},
-        {"id": "item_4", "game": "csgo", "price": 40.0, "profit": 7.0},
-        {"id": "item_5", "game": "csgo", "price": 50.0, "profit": 10.0},
-    ]
-
-    with patch("dmarket.auto_arbitrage.generate_random_items", return_value=mock_items):
+    with patch("dmarket.auto_arbitrage.generate_random_items", return_value=PRO_ITEMS):
         result = arbitrage_pro("csgo")
 
         # Проверяем, что возвращены только предметы с прибылью от 5 и выше
@@ -155,42 +131,38 @@ def test_arbitrage_pro():
 
 # Тесты демонстрационного режима
 
-@pytest.mark.asyncio
-async def test_auto_arbitrage_demo():
-    """Тестирует демонстрацию работы автоматического арбитража."""
-    # Создаем моки
-    mock_items_low = [
-        {"id": "item_1", "game": "csgo", "price": 10.0, "profit": -2.0},
-    ]
-    mock_items_medium = [
-        {"id": "item_2", "game": "csgo", "price": 20.0, "profit": 3.0},
-    ]
-    mock_items_high = [
-        {"id": "item_3", "game": "csgo", "price": 30.0, "profit": 8.0},
-    ]
-
-    # Патчим функции и asyncio.sleep для ускорения теста
-    with patch("dmarket.auto_arbitrage.arbitrage_boost", return_value=mock_items_low), \
-         patch("dmarket.auto_arbitrage.arbitrage_mid", return_value=mock_items_medium), \
-         patch("dmarket.auto_arbitrage.arbitrage_pro", return_value=mock_items_high), \
-         patch("asyncio.sleep", new_callable=AsyncMock), \
-         patch("builtins.print") as mock_print:
-        
-        # Запускаем демонстрацию с разными режимами
-        await auto_arbitrage_demo(game="csgo", mode="low", iterations=1)
-        await auto_arbitrage_demo(game="csgo", mode="medium", iterations=1)
-        await auto_arbitrage_demo(game="csgo", mode="high", iterations=1)
-        
-        # Проверяем, что вызовы print были с правильными аргументами
-        expected_calls = [
-            call(f"Итерация арбитража для {GAMES['csgo']} в режиме low:"),
-            call(f"- {mock_items_low[0]['id']}: прибыль {mock_items_low[0]['profit']:.2f}, цена {mock_items_low[0]['price']:.2f}"),
-            call(f"Итерация арбитража для {GAMES['csgo']} в режиме medium:"),
-            call(f"- {mock_items_medium[0]['id']}: прибыль {mock_items_medium[0]['profit']:.2f}, цена {mock_items_medium[0]['price']:.2f}"),
-            call(f"Итерация арбитража для {GAMES['csgo']} в режиме high:"),
-            call(f"- {mock_items_high[0]['id']}: прибыль {mock_items_high[0]['profit']:.2f}, цена {mock_items_high[0]['price']:.2f}"),
-        ]
-        mock_print.assert_has_calls(expected_calls, any_order=False)
+@pytest.mark.parametrize(
+    ("mode", "active", "inactive"),
+    [
+        ("low", "arbitrage_boost", ("arbitrage_mid", "arbitrage_pro")),
+        ("medium", "arbitrage_mid", ("arbitrage_boost", "arbitrage_pro")),
+        ("high", "arbitrage_pro", ("arbitrage_boost", "arbitrage_mid")),
+    ],
+    ids=["low", "medium", "high"],
+)
+async def test_auto_arbitrage_demo(mode, active, inactive):
+    """Тестирует демонстрацию работы автоматического арбитража в каждом режиме."""
+    item = {"id": "item_1", "game": "csgo", "price": 10.0, "profit": 3.0}
+
+    with patch.multiple(
+        "dmarket.auto_arbitrage",
+        arbitrage_boost=DEFAULT,
+        arbitrage_mid=DEFAULT,
+        arbitrage_pro=DEFAULT,
+    ) as mocks, patch("builtins.print") as mock_print:
+        mocks[active].return_value = [item]
+
+        await auto_arbitrage_demo(game="csgo", mode=mode, iterations=1)
+
+        # Вызывается только функция выбранного режима
+        mocks[active].assert_called_once_with("csgo")
+        for name in inactive:
+            mocks[name].assert_not_called()
+
+        mock_print.assert_has_calls([
+            call(f"Итерация арбитража для {GAMES['csgo']} в режиме {mode}:"),
+            call(f"- {item['id']}: прибыль {item['profit']:.2f}, цена {item['price']:.2f}"),
+        ], any_order=False)
 
 # Тесты GAMES
 
@@ -203,32 +175,20 @@ def test_games_constants():
 
 # Интеграционные тесты
 
-@pytest.mark.asyncio
 async def test_main_flow():
     """Тестирует полный цикл работы модуля."""
-    # Патчим asyncio.sleep для ускорения теста
-    with patch("asyncio.sleep", new_callable=AsyncMock), \
-         patch("builtins.print") as mock_print:
-        
-        # Патчим функции из модуля
-        with patch("dmarket.auto_arbitrage.auto_arbitrage_demo", new_callable=AsyncMock) as mock_demo:
-            # Запускаем основную функцию
-            await auto_arbitrage_main()
-            
-            # Проверяем, что auto_arbitrage_demo был вызван для всех комбинаций игр и режимов
-            assert mock_demo.call_count == 6
-            mock_demo.assert_has_calls([
-                call("csgo", "low"),
-                call("csgo", "medium"),
-                call("csgo", "high"),
-                call("dota2", "low"),
-                call("dota2", "medium"),
-                call("dota2", "high"),
-            ], any_order=False)
+    # Патчим функции из модуля
+    with patch("dmarket.auto_arbitrage.auto_arbitrage_demo", new_callable=AsyncMock) as mock_demo:
+        # Запускаем основную функцию
+        await auto_arbitrage_main()
+
+        # Проверяем, что auto_arbitrage_demo был вызван для всех комбинаций игр и режимов
+        assert mock_demo.call_args_list == [
+            call(game, mode) for game in ("csgo", "dota2") for mode in ("low", "medium", "high")
+        ]
 
 # Тесты интеграции с Telegram ботом (если модуль доступен)
 
-@pytest.mark.asyncio
 async def test_format_results():
     """Тест функции форматирования результатов автоарбитража."""
     if isinstance(format_results, AsyncMock):
@@ -250,21 +210,23 @@ async def test_format_results():
     ]
 
     result = await format_results(items, "mid_medium", "csgo")
-    # Проверяем, что результат содержит заголовок
-    assert "Результаты автоматического арбитража" in result
-    # Проверяем, что результат содержит названия предметов
-    assert "AK-47 | Redline" in result
-    assert "AWP | Asiimov" in result
-    # Проверяем, что результат содержит информацию о цене и прибыли
-    assert "$10.00" in result  # Цена AK-47
-    assert "$30.00" in result  # Цена AWP
-    assert "$100.00" in result  # Прибыль AK-47
-    assert "$300.00" in result  # Прибыль AWP
-    assert "10.0%" in result  # Процент прибыли
-
-@pytest.mark.asyncio
+    # Проверяем заголовок, названия предметов, цены, прибыль и процент прибыли
+    assert_contains_all(
+        result,
+        (
+            "Результаты автоматического арбитража",
+            "AK-47 | Redline",
+            "AWP | Asiimov",
+            "$10.00",
+            "$30.00",
+            "$100.00",
+            "$300.00",
+            "10.0%",
+        ),
+    )
+
 @patch("src.telegram_bot.auto_arbitrage.pagination_manager", create=True)
-async def test_handle_pagination_next(mock_pagination_manager, mock_query, mock_context):
+async def test_handle_pagination_next(mock_pagination_manager, mock_query, mock_context_with_game):
     """Тест обработки пагинации - следующая страница."""
     if isinstance(handle_pagination, AsyncMock):
         pytest.skip("Модуль telegram_bot.auto_arbitrage недоступен")
@@ -273,16 +235,15 @@ async def test_handle_pagination_next(mock_pagination_manager, mock_query, mock_
 
     # Мокаем функцию show_auto_stats_with_pagination
     with patch("src.telegram_bot.auto_arbitrage.show_auto_stats_with_pagination", new=AsyncMock()) as mock_show:
-        await handle_pagination(mock_query, mock_context, "next", "mid_medium")
+        await handle_pagination(mock_query, mock_context_with_game, "next", "mid_medium")
 
         # Проверяем, что был вызван метод next_page менеджера пагинации
         mock_pagination_manager.next_page.assert_called_once_with(mock_query.from_user.id)
         # Проверяем, что была вызвана функция отображения результатов
-        mock_show.assert_called_once_with(mock_query, mock_context)
+        mock_show.assert_called_once_with(mock_query, mock_context_with_game)
 
-@pytest.mark.asyncio
 @patch("src.telegram_bot.auto_arbitrage.pagination_manager", create=True)
-async def test_handle_pagination_prev(mock_pagination_manager, mock_query, mock_context):
+async def test_handle_pagination_prev(mock_pagination_manager, mock_query, mock_context_with_game):
     """Тест обработки пагинации - предыдущая страница."""
     if isinstance(handle_pagination, AsyncMock):
         pytest.skip("Модуль telegram_bot.auto_arbitrage недоступен")
@@ -291,14 +252,13 @@ async def test_handle_pagination_prev(mock_pagination_manager, mock_query, mock_
 
     # Мокаем функцию show_auto_stats_with_pagination
     with patch("src.telegram_bot.auto_arbitrage.show_auto_stats_with_pagination", new=AsyncMock()) as mock_show:
-        await handle_pagination(mock_query, mock_context, "prev", "mid_medium")
+        await handle_pagination(mock_query, mock_context_with_game, "prev", "mid_medium")
 
         # Проверяем, что был вызван метод prev_page менеджера пагинации
         mock_pagination_manager.prev_page.assert_called_once_with(mock_query.from_user.id)
         # Проверяем, что была вызвана функция отображения результатов
-        mock_show.assert_called_once_with(mock_query, mock_context)
+        mock_show.assert_called_once_with(mock_query, mock_context_with_game)
 
-@pytest.mark.asyncio
 @patch("src.telegram_bot.auto_arbitrage.format_results", create=True)
 @patch("src.telegram_bot.auto_arbitrage.pagination_manager", create=True)
 @patch("src.telegram_bot.auto_arbitrage.InlineKeyboardMarkup", create=True)
@@ -311,7 +271,7 @@ async def test_show_auto_stats_with_pagination_with_items(
     mock_pagination_manager,
     mock_format_results,
     mock_query,
-    mock_context,
+    mock_context_with_game,
 ):
     """Тест отображения статистики автоарбитража с пагинацией - с данными."""
     if isinstance(show_auto_stats_with_pagination, AsyncMock):
@@ -330,7 +290,7 @@ async def test_show_auto_stats_with_pagination_with_items(
     mock_get_keyboard.return_value = "back_keyboard"
 
     # Вызов тестируемой функции
-    await show_auto_stats_with_pagination(mock_query, mock_context)
+    await show_auto_stats_with_pagination(mock_query, mock_context_with_game)
 
     # Проверки
     mock_pagination_manager.get_page.assert_called_once_with(mock_query.from_user.id)
@@ -342,7 +302,6 @@ async def test_show_auto_stats_with_pagination_with_items(
     assert "text" in call_kwargs
     assert "reply_markup" in call_kwargs
 
-@pytest.mark.asyncio
 @patch("src.telegram_bot.auto_arbitrage.scan_multiple_games", create=True)
 @patch("src.telegram_bot.auto_arbitrage.check_user_balance", create=True)
 @patch("src.telegram_bot.auto_arbitrage.pagination_manager", create=True)
@@ -355,14 +314,14 @@ async def test_start_auto_trading_boost_low(
     mock_check_balance,
     mock_scan_games,
     mock_query,
-    mock_context,
+    mock_context_with_game,
 ):
     """Тест запуска автоарбитража в режиме разгона баланса (boost_low)."""
     if isinstance(start_auto_trading, AsyncMock):
         pytest.skip("Модуль telegram_bot.auto_arbitrage недоступен")
         
     # Настраиваем моки
-    mock_context.bot_data = {
+    mock_context_with_game.bot_data = {
         "dmarket_public_key": "test_public_key",
         "dmarket_secret_key": "test_secret_key",
     }
@@ -374,7 +333,7 @@ async def test_start_auto_trading_boost_low(
     # Мокаем импорт модулей из intramarket_arbitrage
     with patch("src.telegram_bot.auto_arbitrage.find_price_anomalies", return_value=[], create=True):
         # Вызываем функцию
-        await start_auto_trading(mock_query, mock_context, "boost_low")
+        await start_auto_trading(mock_query, mock_context_with_game, "boost_low")
 
         # Проверяем, что все ожидаемые функции были вызваны
         mock_query.edit_message_text.assert_called()  # Должно быть несколько вызовов
@@ -9,21 +9,14 @@
 6. Интеграции с DMarket API
 """
 
-import os
-import sys
 import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch, call
 
 import pytest
-from telegram import CallbackQuery, Chat, Message, Update, User, InlineKeyboardButton, InlineKeyboardMarkup
-from telegram.ext import Application, ContextTypes, ExtBot, CommandHandler, CallbackContext
 from telegram.error import NetworkError
 
-# Добавляем корневую директорию проекта в sys.path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
-
 # Импортируем модули бота для тестирования
-from telegram_bot.bot_v2 import (
+from src.telegram_bot.bot_v2 import (
     balance_command,
     market_command,
     help_command,
@@ -40,32 +33,16 @@ from telegram_bot.bot_v2 import (
     message_handler
 )
 
-# Фикстуры для тестирования
+# Все тесты модуля патчат атрибуты bot_v2 через строковые пути
+pytestmark = pytest.mark.usefixtures("bot_v2_module")
 
-@pytest.fixture
-def mock_update():
-    """Создает мок объекта Update для Telegram."""
-    update = MagicMock(spec=Update)
-    update.effective_chat = MagicMock(spec=Chat)
-    update.effective_chat.id = 12345
-    update.message = MagicMock(spec=Message)
-    update.message.chat = update.effective_chat
-    update.message.from_user = MagicMock(spec=User)
-    update.message.from_user.id = 12345
-    update.message.from_user.first_name = "Test User"
-    update.message.from_user.username = "testuser"
-    update.message.text = "/start"
-    update.message.reply_text = AsyncMock()
-    update.message.reply_html = AsyncMock()
-    update.message.reply_markdown = AsyncMock()
-    update.callback_query = None
-    return update
+# Фикстуры для тестирования
 
 @pytest.fixture
 def mock_context():
     """Создает мок объекта Context для Telegram."""
-    context = MagicMock(spec=ContextTypes.DEFAULT_TYPE)
-    context.bot = MagicMock(spec=ExtBot)
+    context = MagicMock()
+    context.bot = MagicMock()
     context.bot.send_message = AsyncMock()
     context.user_data = {}
     return context
@@ -73,7 +50,7 @@ def mock_context():
 @pytest.fixture
 def mock_callback_query(mock_update):
     """Создает мок объекта CallbackQuery для Telegram."""
-    callback_query = MagicMock(spec=CallbackQuery)
+    callback_query = MagicMock()
     callback_query.message = mock_update.message
     callback_query.data = "test_data"
     callback_query.from_user = mock_update.message.from_user
@@ -85,7 +62,7 @@ def mock_callback_query(mock_update):
 @pytest.fixture
 def mock_application():
     """Создает мок объекта Application для Telegram."""
-    app = MagicMock(spec=Application)
+    app = MagicMock()
     app.add_handler = MagicMock()
     app.add_error_handler = MagicMock()
     return app
@@ -121,7 +98,7 @@ async def test_balance_command_without_api_keys(mock_update, mock_context):
 async def test_market_command(mock_update, mock_context):
     """Тестирует команду /market."""
     # Патчим функцию создания клавиатуры
-    with patch("telegram_bot.bot_v2.create_game_selection_keyboard", return_value=MagicMock()):
+    with patch("src.telegram_bot.bot_v2.create_game_selection_keyboard", return_value=MagicMock()):
         await market_command(mock_update, mock_context)
         mock_update.message.reply_text.assert_called_once()
         # Проверяем, что пользовательские данные обновлены
@@ -132,7 +109,7 @@ async def test_market_command(mock_update, mock_context):
 async def test_arbitrage_command(mock_update, mock_context):
     """Тестирует команду /arbitrage."""
     # Патчим функцию создания клавиатуры
-    with patch("telegram_bot.bot_v2.create_arbitrage_keyboard", return_value=MagicMock()):
+    with patch("src.telegram_bot.bot_v2.create_arbitrage_keyboard", return_value=MagicMock()):
         await arbitrage_command(mock_update, mock_context)
         mock_update.message.reply_text.assert_called_once()
         args = mock_update.message.reply_text.call_args[0][0]
@@ -142,7 +119,7 @@ async def test_arbitrage_command(mock_update, mock_context):
 async def test_settings_command(mock_update, mock_context):
     """Тестирует команду /settings."""
     # Патчим функцию создания клавиатуры
-    with patch("telegram_bot.bot_v2.create_settings_keyboard", return_value=MagicMock()):
+    with patch("src.telegram_bot.bot_v2.create_settings_keyboard", return_value=MagicMock()):
         await settings_command(mock_update, mock_context)
         mock_update.message.reply_text.assert_called_once()
         args = mock_update.message.reply_text.call_args[0][0]
@@ -157,7 +134,7 @@ async def test_message_handler_no_state(mock_update, mock_context):
     mock_update.message.text = "Тестовое сообщение"
     
     # Патчим функцию создания клавиатуры
-    with patch("telegram_bot.bot_v2.create_main_keyboard", return_value=MagicMock()):
+    with patch("src.telegram_bot.bot_v2.create_main_keyboard", return_value=MagicMock()):
         await message_handler(mock_update, mock_context)
         mock_update.message.reply_text.assert_called_once()
         args = mock_update.message.reply_text.call_args[0][0]
@@ -171,8 +148,8 @@ async def test_message_handler_awaiting_game(mock_update, mock_context):
     mock_context.user_data["search_state"] = "awaiting_game"
     
     # Патчим функцию проверки игры
-    with patch("telegram_bot.bot_v2.SUPPORTED_GAMES", ["csgo", "dota2"]):
-        with patch("telegram_bot.bot_v2.ReplyKeyboardRemove", return_value=MagicMock()):
+    with patch("src.telegram_bot.bot_v2.SUPPORTED_GAMES", ["csgo", "dota2"]):
+        with patch("src.telegram_bot.bot_v2.ReplyKeyboardRemove", return_value=MagicMock()):
             await message_handler(mock_update, mock_context)
             mock_update.message.reply_text.assert_called_once()
             
@@ -202,8 +179,8 @@ async def test_handle_error_network(mock_update, mock_context):
             self.message = message
     
     # Патчим проверку типа ошибки
-    with patch("telegram_bot.bot_v2.NetworkError", NetworkError), \
-         patch("telegram_bot.bot_v2.ApiError", ApiError):
+    with patch("src.telegram_bot.bot_v2.NetworkError", NetworkError), \
+         patch("src.telegram_bot.bot_v2.ApiError", ApiError):
         await handle_error(mock_update, mock_context)
         mock_context.bot.send_message.assert_called_once()
         args = mock_context.bot.send_message.call_args[1]
@@ -277,8 +254,8 @@ async def test_create_application():
     """Тестирует создание приложения бота."""
     with patch("os.getenv", return_value="test_token"), \
          patch("telegram.ext.Application.builder") as mock_builder, \
-         patch("telegram_bot.bot_v2.setup_command_handlers"), \
-         patch("telegram_bot.bot_v2.setup_error_handlers"):
+         patch("src.telegram_bot.bot_v2.setup_command_handlers"), \
+         patch("src.telegram_bot.bot_v2.setup_error_handlers"):
         
         mock_app = MagicMock()
         mock_builder.return_value.token.return_value.build.return_value = mock_app
@@ -292,6 +269,6 @@ async def test_main_function():
     mock_app = MagicMock()
     mock_app.run_polling = AsyncMock()
     
-    with patch("telegram_bot.bot_v2.create_application", return_value=mock_app):
+    with patch("src.telegram_bot.bot_v2.create_application", return_value=mock_app):
         await main()
         mock_app.run_polling.assert_called_once()
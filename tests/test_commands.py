@@ -1,10 +1,8 @@
 """Тесты для обработчиков команд из модуля commands.py
 """
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
-from telegram import Update, User
-
 from src.telegram_bot.handlers.commands import (
     arbitrage_command,
     dmarket_status,
@@ -13,7 +11,6 @@ from src.telegram_bot.handlers.commands import (
 )
 
 
-@pytest.mark.asyncio
 @patch("src.telegram_bot.handlers.commands.get_localized_text")
 @patch("src.telegram_bot.handlers.commands.get_arbitrage_keyboard")
 async def test_start_command(mock_get_keyboard, mock_get_localized_text):
@@ -24,11 +21,9 @@ async def test_start_command(mock_get_keyboard, mock_get_localized_text):
     mock_get_localized_text.return_value = "Тестовое приветственное сообщение"
 
     # Создаем моки для update и context
-    user = MagicMock(spec=User)
-    user.id = 12345
-    user.mention_html.return_value = "<i>@test_user</i>"
+    user = SimpleNamespace(id=12345, mention_html=MagicMock(return_value="<i>@test_user</i>"))
 
-    update = MagicMock(spec=Update)
+    update = MagicMock()
     update.effective_user = user
     update.message = AsyncMock()
 
@@ -46,7 +41,6 @@ async def test_start_command(mock_get_keyboard, mock_get_localized_text):
     )
 
 
-@pytest.mark.asyncio
 @patch("src.telegram_bot.handlers.commands.get_localized_text")
 async def test_help_command(mock_get_localized_text):
     """Тест обработки команды /help."""
@@ -54,10 +48,9 @@ async def test_help_command(mock_get_localized_text):
     mock_get_localized_text.return_value = "Справочная информация"
 
     # Создаем моки для update и context
-    user = MagicMock(spec=User)
-    user.id = 12345
+    user = SimpleNamespace(id=12345)
 
-    update = MagicMock(spec=Update)
+    update = MagicMock()
     update.effective_user = user
     update.message = AsyncMock()
 
@@ -71,12 +64,11 @@ async def test_help_command(mock_get_localized_text):
     update.message.reply_text.assert_called_once_with("Справочная информация")
 
 
-@pytest.mark.asyncio
 @patch("src.telegram_bot.handlers.dmarket_status.dmarket_status_impl")
 async def test_dmarket_status(mock_dmarket_status_impl):
     """Тест обработки команды /dmarket или /status."""
     # Создаем моки для update и context
-    update = MagicMock(spec=Update)
+    update = MagicMock()
     context = MagicMock()
 
     # Настраиваем поведение мока
@@ -89,7 +81,6 @@ async def test_dmarket_status(mock_dmarket_status_impl):
     mock_dmarket_status_impl.assert_called_once_with(update, context)
 
 
-@pytest.mark.asyncio
 @patch("src.telegram_bot.handlers.commands.get_arbitrage_keyboard")
 async def test_arbitrage_command(mock_get_keyboard):
     """Тест обработки команды /arbitrage."""
@@ -98,7 +89,7 @@ async def test_arbitrage_command(mock_get_keyboard):
     mock_get_keyboard.return_value = mock_keyboard
 
     # Создаем моки для update и context
-    update = MagicMock(spec=Update)
+    update = MagicMock()
     update.message = AsyncMock()
 
     context = MagicMock()
@@ -1,7 +1,7 @@
 """Тесты для модуля keyboards, проверяющие создание различных клавиатур для Telegram-бота.
 """
 
-from unittest.mock import patch
+from types import MappingProxyType
 
 from telegram import InlineKeyboardMarkup
 
@@ -12,6 +12,21 @@ from src.telegram_bot.keyboards import (
     get_game_selection_keyboard,
 )
 
+# Игры клавиатуры выбора игры: код игры и название на кнопке
+EXPECTED_GAMES = MappingProxyType(
+    {
+        "csgo": "CS2",
+        "dota2": "Dota 2",
+        "rust": "Rust",
+        "tf2": "Team Fortress 2",
+    },
+)
+
+
+def flatten_buttons(keyboard):
+    """Возвращает все кнопки клавиатуры одним списком, строка за строкой."""
+    return [button for row in keyboard.inline_keyboard for button in row]
+
 
 def test_get_arbitrage_keyboard():
     """Проверяет создание клавиатуры для выбора режима арбитража."""
@@ -38,46 +53,29 @@ def test_get_arbitrage_keyboard():
 
 def test_get_game_selection_keyboard():
     """Проверяет создание клавиатуры для выбора игры."""
-    # Моделируем словарь игр для тестирования
-    mock_games = {
-        "csgo": "CS:GO",
-        "dota2": "Dota 2",
-        "rust": "Rust",
-        "tf2": "Team Fortress 2",
-    }
-
-    with patch("src.telegram_bot.keyboards.GAMES", mock_games):
-        keyboard = get_game_selection_keyboard()
+    keyboard = get_game_selection_keyboard()
 
     # Проверяем, что возвращается правильный тип
     assert isinstance(keyboard, InlineKeyboardMarkup)
 
-    # Проверяем количество строк в клавиатуре (2 строки с играми + 1 строка с кнопкой назад)
-    assert len(keyboard.inline_keyboard) == 3
+    # По одной игре в строке + строка с кнопкой назад
+    assert len(keyboard.inline_keyboard) == len(EXPECTED_GAMES) + 1
+    assert all(len(row) == 1 for row in keyboard.inline_keyboard)
 
-    # Проверяем, что все игры присутствуют
-    all_buttons = [button for row in keyboard.inline_keyboard for button in row]
+    # Проверяем кнопки игр, исключая кнопку "Назад"
+    all_buttons = flatten_buttons(keyboard)
+    game_buttons = [button for button in all_buttons if button.callback_data != "back_to_menu"]
 
-    # Исключая кнопку "Назад"
-    game_buttons = [button for button in all_buttons if button.callback_data != "arbitrage"]
-    assert len(game_buttons) == 4
-
-    # Проверяем тексты кнопок и callback_data
-    game_texts = [button.text for button in game_buttons]
-    game_callbacks = [button.callback_data for button in game_buttons]
-
-    assert "CS:GO" in game_texts
-    assert "Dota 2" in game_texts
-    assert "Rust" in game_texts
-    assert "Team Fortress 2" in game_texts
-
-    assert "game:csgo" in game_callbacks
-    assert "game:dota2" in game_callbacks
-    assert "game:rust" in game_callbacks
-    assert "game:tf2" in game_callbacks
+    assert {button.callback_data for button in game_buttons} == {
+        f"game_selected:{game}" for game in EXPECTED_GAMES
+    }
+    for button in game_buttons:
+        game = button.callback_data.removeprefix("game_selected:")
+        assert button.text.endswith(EXPECTED_GAMES[game])
 
-    # Проверяем кнопку "Назад"
-    back_button = [button for button in all_buttons if button.callback_data == "arbitrage"][0]
+    # Проверяем кнопку "Назад" в последней строке
+    back_button = all_buttons[-1]
+    assert back_button.callback_data == "back_to_menu"
     assert "Назад" in back_button.text
 
 
@@ -92,7 +90,7 @@ def test_get_auto_arbitrage_keyboard():
     assert len(keyboard.inline_keyboard) == 5
 
     # Проверяем наличие всех режимов
-    all_buttons = [button for row in keyboard.inline_keyboard for button in row]
+    all_buttons = flatten_buttons(keyboard)
     callback_data = [button.callback_data for button in all_buttons]
 
     assert "auto_start:boost_low" in callback_data
@@ -0,0 +1,34 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import test_main_bot
+from tests._util import make_mock_update
+
+
+@pytest.mark.parametrize(
+    ("public_key", "secret_key", "expected"),
+    [
+        ("public", "secret", test_main_bot.STATUS_KEYS_OK_MSG),
+        ("public", None, test_main_bot.STATUS_KEYS_MISSING_MSG),
+        (None, None, test_main_bot.STATUS_KEYS_MISSING_MSG),
+    ],
+    ids=["keys_ok", "secret_missing", "keys_missing"],
+)
+async def test_dmarket_status(monkeypatch, public_key, secret_key, expected):
+    """Test that /status sends the checking text, then edits it to the key status."""
+    for name, value in (("DMARKET_PUBLIC_KEY", public_key), ("DMARKET_SECRET_KEY", secret_key)):
+        if value is None:
+            monkeypatch.delenv(name, raising=False)
+        else:
+            monkeypatch.setenv(name, value)
+
+    update = make_mock_update()
+    status_message = MagicMock()
+    status_message.edit_text = AsyncMock()
+    update.message.reply_text.return_value = status_message
+
+    await test_main_bot.dmarket_status(update, MagicMock())
+
+    update.message.reply_text.assert_awaited_once_with(test_main_bot.STATUS_CHECKING_MSG)
+    status_message.edit_text.assert_awaited_once_with(expected)
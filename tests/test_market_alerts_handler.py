@@ -1,11 +1,6 @@
-import os
-import sys
 import unittest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-# Add project root to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
 
 class TestMarketAlertsHandler(unittest.TestCase):
     """Tests for the Market Alerts Handler module."""
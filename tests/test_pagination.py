@@ -4,140 +4,121 @@
 import pytest
 
 from src.telegram_bot.pagination import PaginationManager, format_paginated_results
+from tests._util import assert_contains_all
 
+# Ожидаемые названия предметов на каждой из 4 страниц (по 5 элементов на странице)
+EXPECTED_PAGES = [[f"Item {i}" for i in range(1 + 5 * p, 6 + 5 * p)] for p in range(4)]
 
-class TestPaginationManager:
-    """Тесты для менеджера пагинации."""
-
-    def setup_method(self):
-        """Подготовка перед каждым тестом."""
-        self.manager = PaginationManager()
-        self.user_id = 12345
-
-        # Тестовые данные
-        self.test_items = [
-            {
-                "title": f"Item {i}",
-                "price": {"amount": i * 100},
-                "profit": i * 10,
-                "profit_percent": 10.0,
-            }
-            for i in range(1, 21)  # 20 предметов
-        ]
-
-    def test_add_items_for_user(self):
-        """Тест добавления предметов для пользователя."""
-        self.manager.add_items_for_user(self.user_id, self.test_items, "test_mode")
-
-        # Проверяем, что предметы добавлены
-        assert len(self.manager.items_by_user.get(self.user_id, [])) == 20
+# Для большинства тестов достаточно одной полной страницы и одного предмета сверх нее
+SMALL_EXPECTED_PAGES = [EXPECTED_PAGES[0], ["Item 6"]]
 
-        # Проверяем, что страница сброшена в 0
-        assert self.manager.current_page_by_user.get(self.user_id) == 0
-
-        # Проверяем, что режим установлен
-        assert self.manager.mode_by_user.get(self.user_id) == "test_mode"
 
-    def test_get_page_empty(self):
-        """Тест получения страницы для пользователя без данных."""
-        items, page, total = self.manager.get_page(self.user_id)
+# Идентификатор пользователя, для которого тесты добавляют предметы
+USER_ID = 12345
 
-        assert items == []
-        assert page == 0
-        assert total == 0
 
-    def test_get_page_with_items(self):
-        """Тест получения страницы с данными."""
-        self.manager.add_items_for_user(self.user_id, self.test_items, "test_mode")
+def make_test_items(count):
+    """Создает тестовые предметы с названиями Item 1..Item count."""
+    return tuple(
+        {
+            "title": f"Item {i}",
+            "price": {"amount": i * 100},
+            "profit": i * 10,
+            "profit_percent": 10.0,
+        }
+        for i in range(1, count + 1)
+    )
 
-        # Получаем первую страницу (по умолчанию 5 элементов на странице)
-        items, page, total = self.manager.get_page(self.user_id)
 
-        assert len(items) == 5
-        assert items[0]["title"] == "Item 1"
-        assert items[4]["title"] == "Item 5"
-        assert page == 0
-        assert total == 4  # 20 элементов / 5 = 4 страницы
+@pytest.fixture(scope="module")
+def test_items():
+    """Тестовые данные: 6 предметов — одна полная страница и одна неполная.
 
-    def test_next_page(self):
-        """Тест перехода к следующей странице."""
-        self.manager.add_items_for_user(self.user_id, self.test_items, "test_mode")
+    Собираются один раз на модуль: тесты только читают их, а менеджер
+    лишь хранит переданную последовательность и берет из нее срезы.
+    """
+    return make_test_items(6)
 
-        # Переходим к следующей странице
-        items, page, total = self.manager.next_page(self.user_id)
 
-        assert len(items) == 5
-        assert items[0]["title"] == "Item 6"
-        assert page == 1
-        assert total == 4
+@pytest.fixture(scope="module")
+def full_test_items():
+    """Тестовые данные: 20 предметов — четыре полные страницы."""
+    return make_test_items(20)
 
-        # Переходим ещё на следующую страницу
-        items, page, total = self.manager.next_page(self.user_id)
 
-        assert len(items) == 5
-        assert items[0]["title"] == "Item 11"
-        assert page == 2
-        assert total == 4
+@pytest.fixture
+def manager():
+    """Создает новый менеджер пагинации для каждого теста."""
+    return PaginationManager()
 
-    def test_prev_page(self):
-        """Тест перехода к предыдущей странице."""
-        self.manager.add_items_for_user(self.user_id, self.test_items, "test_mode")
 
-        # Переходим к следующей странице дважды
-        self.manager.next_page(self.user_id)
-        self.manager.next_page(self.user_id)
+class TestPaginationManager:
+    """Тесты для менеджера пагинации."""
 
-        # Проверяем, что мы на второй странице
-        assert self.manager.current_page_by_user.get(self.user_id) == 2
+    def test_add_items_for_user(self, manager, test_items):
+        """Тест добавления предметов для пользователя."""
+        manager.add_items_for_user(USER_ID, test_items, "test_mode")
 
-        # Переходим к предыдущей странице
-        items, page, total = self.manager.prev_page(self.user_id)
+        # Проверяем, что предметы добавлены
+        assert len(manager.items_by_user.get(USER_ID, [])) == 6
 
-        assert len(items) == 5
-        assert items[0]["title"] == "Item 6"
-        assert page == 1
-        assert total == 4
+        # Проверяем, что страница сброшена в 0
+        assert manager.current_page_by_user.get(USER_ID) == 0
 
-    def test_prev_page_at_start(self):
-        """Тест перехода к предыдущей странице, когда мы на первой странице."""
-        self.manager.add_items_for_user(self.user_id, self.test_items, "test_mode")
+        # Проверяем, что режим установлен
+        assert manager.mode_by_user.get(USER_ID) == "test_mode"
 
-        # Переходим к предыдущей странице, хотя уже на первой
-        items, page, total = self.manager.prev_page(self.user_id)
+    def test_get_page_empty(self, manager):
+        """Тест получения страницы для пользователя без данных."""
+        items, page, total = manager.get_page(USER_ID)
 
-        # Должны остаться на первой странице
-        assert len(items) == 5
+        assert items == []
         assert page == 0
-        assert total == 4
+        assert total == 0
 
-    def test_next_page_at_end(self):
-        """Тест перехода к следующей странице, когда мы на последней."""
-        self.manager.add_items_for_user(self.user_id, self.test_items, "test_mode")
+    def test_navigation(self, manager, test_items):
+        """Тест последовательного перехода по страницам одного менеджера."""
+        manager.add_items_for_user(USER_ID, test_items, "test_mode")
+
+        # Шаги навигации и страница, на которой должны оказаться после шага.
+        # Выход за первую и последнюю страницу оставляет нас на месте.
+        steps = [
+            (manager.get_page, 0),
+            (manager.next_page, 1),
+            (manager.next_page, 1),
+            (manager.prev_page, 0),
+            (manager.prev_page, 0),
+        ]
+
+        for step, expected_page in steps:
+            items, page, total = step(USER_ID)
 
-        # Переходим к последней странице
-        for _ in range(3):
-            self.manager.next_page(self.user_id)
+            assert [item["title"] for item in items] == SMALL_EXPECTED_PAGES[expected_page]
+            assert page == expected_page
+            assert total == 2  # 6 элементов / 5 = 2 страницы
 
-        # Проверяем, что мы на последней странице
-        assert self.manager.current_page_by_user.get(self.user_id) == 3
+    @pytest.mark.parametrize("page_number", range(4))
+    def test_navigation_full_pages(self, manager, full_test_items, page_number):
+        """Тест перехода на каждую из 4 страниц при 20 предметах."""
+        manager.add_items_for_user(USER_ID, full_test_items, "test_mode")
 
-        # Пытаемся перейти ещё дальше
-        items, page, total = self.manager.next_page(self.user_id)
+        items, page, total = manager.get_page(USER_ID)
+        for _ in range(page_number):
+            items, page, total = manager.next_page(USER_ID)
 
-        # Должны остаться на последней странице
-        assert len(items) == 5
-        assert page == 3
-        assert total == 4
+        assert [item["title"] for item in items] == EXPECTED_PAGES[page_number]
+        assert page == page_number
+        assert total == 4  # 20 элементов / 5 = 4 страницы
 
-    def test_get_mode(self):
+    def test_get_mode(self, manager, test_items):
         """Тест получения режима для пользователя."""
-        self.manager.add_items_for_user(self.user_id, self.test_items, "test_mode")
+        manager.add_items_for_user(USER_ID, test_items, "test_mode")
 
-        mode = self.manager.get_mode(self.user_id)
+        mode = manager.get_mode(USER_ID)
         assert mode == "test_mode"
 
         # Для несуществующего пользователя должен быть режим по умолчанию
-        mode = self.manager.get_mode(999999)
+        mode = manager.get_mode(999999)
         assert mode == "default"
 
 
@@ -165,14 +146,20 @@ def test_format_paginated_results():
 
         result = format_paginated_results(items, "csgo", "boost", 0, 1)
 
-        # Проверяем наличие основных элементов в результате
-        assert "CS:GO" in result
-        assert "Разгон баланса" in result
-        assert "AK-47 | Redline" in result
-        assert "AWP | Asiimov" in result
-        assert "$10.00" in result  # Цена AK-47
-        assert "$30.00" in result  # Цена AWP
-        assert "$1.00" in result  # Прибыль AK-47
-        assert "$3.00" in result  # Прибыль AWP
-        assert "10.0%" in result  # Процент прибыли
-        assert "Страница 1/1" in result
+        # Проверяем наличие основных элементов в результате:
+        # названия, цены ($10.00/$30.00), прибыль ($1.00/$3.00) и процент прибыли
+        assert_contains_all(
+            result,
+            (
+                "CS:GO",
+                "Разгон баланса",
+                "AK-47 | Redline",
+                "AWP | Asiimov",
+                "$10.00",
+                "$30.00",
+                "$1.00",
+                "$3.00",
+                "10.0%",
+                "Страница 1/1",
+            ),
+        )
@@ -0,0 +1,90 @@
+from unittest.mock import ANY, AsyncMock
+
+import pytest
+
+import validate_api_keys
+
+ENV_CONTENT = """# DMarket keys
+DMARKET_PUBLIC_KEY=publickey123
+
+# Endpoint cache
+DMARKET_API_ENDPOINT=/account/v1/balance
+LOG_LEVEL=INFO
+"""
+
+
+@pytest.fixture
+def env_file(tmp_path, monkeypatch):
+    """Point the validator at a .env file in a temporary directory."""
+    monkeypatch.setattr(validate_api_keys, "__file__", str(tmp_path / "validate_api_keys.py"))
+    return tmp_path / ".env"
+
+
+def test_save_last_endpoint_replaces_only_endpoint_line(env_file):
+    """Test that save_last_endpoint keeps comments, blank lines and other variables."""
+    env_file.write_text(ENV_CONTENT, encoding="utf-8")
+
+    validate_api_keys.save_last_endpoint("/exchange/v1/user/balance")
+
+    assert env_file.read_text(encoding="utf-8") == ENV_CONTENT.replace(
+        "/account/v1/balance", "/exchange/v1/user/balance"
+    )
+
+
+def test_save_last_endpoint_appends_missing_line(env_file):
+    """Test that save_last_endpoint appends the variable when the file lacks it."""
+    env_file.write_text("# Comment\nLOG_LEVEL=INFO", encoding="utf-8")
+
+    validate_api_keys.save_last_endpoint("/account/v1/balance")
+
+    assert env_file.read_text(encoding="utf-8") == (
+        "# Comment\nLOG_LEVEL=INFO\nDMARKET_API_ENDPOINT=/account/v1/balance\n"
+    )
+
+
+def test_save_last_endpoint_without_env_file(env_file):
+    """Test that save_last_endpoint does not create a .env file."""
+    validate_api_keys.save_last_endpoint("/account/v1/balance")
+
+    assert not env_file.exists()
+
+
+@pytest.fixture
+def mock_auth(mocker):
+    """Replace the authentication probe; endpoints in `working` succeed."""
+    working = set()
+
+    async def probe(client, public_key, secret_key, endpoint):
+        return {"success": endpoint in working, "status_code": 200 if endpoint in working else 401}
+
+    auth = mocker.patch.object(validate_api_keys, "test_api_auth", AsyncMock(side_effect=probe))
+    auth.working = working
+    return auth
+
+
+async def test_try_multiple_endpoints_cached_endpoint_wins(mock_auth):
+    """Test that a working cached endpoint is the only one probed."""
+    mock_auth.working.add("/account/v1/balance")
+
+    result = await validate_api_keys.try_multiple_endpoints(
+        "public", "secret", "/account/v1/balance"
+    )
+
+    assert (result["success"], result["endpoint"]) == (True, "/account/v1/balance")
+    mock_auth.assert_awaited_once_with(ANY, "public", "secret", "/account/v1/balance")
+
+
+async def test_try_multiple_endpoints_cached_endpoint_fails(mock_auth):
+    """Test that the other endpoints are probed when the cached one fails."""
+    mock_auth.working.add("/exchange/v1/user/balance")
+
+    result = await validate_api_keys.try_multiple_endpoints(
+        "public", "secret", "/account/v1/balance"
+    )
+
+    assert (result["success"], result["endpoint"]) == (True, "/exchange/v1/user/balance")
+    probed = [call.args[3] for call in mock_auth.await_args_list]
+    assert probed[0] == "/account/v1/balance"
+    assert sorted(probed[1:]) == sorted(
+        endpoint for endpoint in validate_api_keys.ENDPOINTS if endpoint != "/account/v1/balance"
+    )
@@ -3,26 +3,11 @@
 Этот файл содержит фикстуры для тестирования модулей в директории src/utils.
 """
 
-import logging
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 
-@pytest.fixture
-def mock_logger():
-    """Создает мок объекта логгера для тестирования функций логирования и обработки ошибок."""
-    logger = MagicMock(spec=logging.Logger)
-    logger.info = MagicMock()
-    logger.debug = MagicMock()
-    logger.warning = MagicMock()
-    logger.error = MagicMock()
-    logger.critical = MagicMock()
-    logger.exception = MagicMock()
-
-    return logger
-
-
 @pytest.fixture
 def mock_http_response():
     """Создает мок HTTP ответа для тестирования функций обработки API ошибок."""
@@ -1,52 +1,145 @@
 """Tests for the API error handling utility."""
 
 import time
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, call, create_autospec
 
 import pytest
 
 from src.utils.api_error_handling import (
     APIError,
+    AuthenticationError,
+    BadRequestError,
+    NotFoundError,
+    RateLimitExceeded,
+    RetryStrategy,
+    ServerError,
     handle_response,
     retry_request,
 )
+from src.utils.rate_limiter import RateLimiter
+
+
+class FakeResponse:
+    """Minimal stand-in for aiohttp.ClientResponse as read by handle_response.
+
+    A plain object instead of AsyncMock(spec=ClientResponse): the status, body
+    and headers are fixed up front and json() counts its calls.
+    """
+
+    __slots__ = ("status", "headers", "_data", "_error", "json_calls")
+
+    def __init__(self, status, data=None, headers=None, json_error=None):
+        self.status = status
+        self.headers = headers or {}
+        self._data = data
+        self._error = json_error
+        self.json_calls = 0
+
+    async def json(self):
+        self.json_calls += 1
+        if self._error is not None:
+            raise self._error
+        return self._data
+
+
+@pytest.fixture
+def mock_limiter():
+    """Create an autospecced rate limiter for retry_request.
+
+    create_autospec makes the async methods awaitable and rejects calls to
+    anything RateLimiter does not define or with the wrong signature.
+    """
+    limiter = create_autospec(RateLimiter, instance=True)
+    limiter.handle_429.return_value = (5.0, 1)
+    return limiter
 
 
 def test_api_error_creation():
     """Test creating APIError instances."""
     error = APIError("Test error")
-    assert str(error) == "Test error (Статус: 0)"
+    assert (error.message, error.status_code, error.response_data, str(error)) == (
+        "Test error",
+        0,
+        {},
+        "Test error (Статус: 0)",
+    )
 
-    error_with_status = APIError("Error with status", status_code=404)
-    assert error_with_status.status_code == 404
-    assert "Error with status" in str(error_with_status)
-    assert "404" in str(error_with_status)
+    error = APIError("Error with status", 404, {"error": "Not found"})
+    assert (error.message, error.status_code, error.response_data, str(error)) == (
+        "Error with status",
+        404,
+        {"error": "Not found"},
+        "Error with status (Статус: 404)",
+    )
+
+
+@pytest.mark.parametrize(
+    ("error_cls", "status_code"),
+    [
+        (AuthenticationError, 401),
+        (NotFoundError, 404),
+        (ServerError, 500),
+        (BadRequestError, 400),
+    ],
+    ids=["authentication", "not_found", "server", "bad_request"],
+)
+def test_specialized_errors(error_cls, status_code):
+    """Test that specialized errors are APIError subclasses keeping the status code."""
+    error = error_cls("Failure", status_code, {"error": "Failure"})
+    assert isinstance(error, APIError)
+    assert error.status_code == status_code
 
 
-@pytest.mark.asyncio
-async def test_handle_response():
-    """Test handling API responses."""
-    # Create a successful response mock
-    success_response = MagicMock()
-    success_response.status = 200
-    success_response.json = AsyncMock(return_value={"data": "success"})
+def test_rate_limit_error_retry_after():
+    """Test that RateLimitExceeded keeps retry_after."""
+    error = RateLimitExceeded("Rate limit exceeded", 429, {"error": "Too many requests"}, retry_after=30)
+    assert isinstance(error, APIError)
+    assert error.status_code == 429
+    assert error.retry_after == 30
+
+
+async def test_handle_response_success():
+    """Test handling a successful API response."""
+    response = FakeResponse(200, {"data": "success"})
+
+    result = await handle_response(response)
 
-    # Test successful response
-    result = await handle_response(success_response)
     assert result == {"data": "success"}
+    assert response.json_calls == 1
 
-    # Create an error response mock
-    error_response = MagicMock()
-    error_response.status = 404
-    error_response.json = AsyncMock(return_value={"error": "Not found"})
 
-    # Test error response
-    with pytest.raises(APIError) as excinfo:
-        await handle_response(error_response)
-    assert "404" in str(excinfo.value)
+async def test_handle_response_json_error():
+    """Test that an unparsable successful response yields an empty dict."""
+    response = FakeResponse(200, json_error=ValueError("Invalid JSON"))
+
+    assert await handle_response(response) == {}
+
+
+@pytest.mark.parametrize(
+    ("status", "headers", "error_cls", "message"),
+    [
+        (401, None, AuthenticationError, "авторизации"),
+        (404, None, NotFoundError, "не найден"),
+        (429, {"Retry-After": "30"}, RateLimitExceeded, "Превышен лимит запросов"),
+        (500, None, ServerError, "Серверная ошибка"),
+        (400, None, BadRequestError, "Неверный запрос"),
+        (418, None, APIError, "Ошибка API"),
+    ],
+    ids=["unauthorized", "not_found", "rate_limit", "server", "bad_request", "unknown"],
+)
+async def test_handle_response_error(status, headers, error_cls, message):
+    """Test that error responses raise the matching APIError subclass."""
+    response = FakeResponse(status, {"error": "Failure"}, headers=headers)
+
+    with pytest.raises(error_cls) as excinfo:
+        await handle_response(response)
+
+    assert excinfo.value.status_code == status
+    assert message in excinfo.value.message
+    if headers is not None:
+        assert excinfo.value.retry_after == int(headers["Retry-After"])
 
 
-@pytest.mark.asyncio
 async def test_retry_request():
     """Test retry_request function for API calls."""
     # Create a mock function that fails first then succeeds
@@ -70,7 +163,68 @@ async def test_retry_request():
     assert result == "Success"
 
 
-@pytest.mark.asyncio
+async def test_retry_request_with_limiter(mock_limiter):
+    """Test that retry_request goes through the limiter and passes kwargs on."""
+    mock_func = AsyncMock(return_value={"data": "test data"})
+
+    result = await retry_request(
+        request_func=mock_func,
+        limiter=mock_limiter,
+        endpoint_type="market",
+        retry_strategy=RetryStrategy(max_retries=3),
+        param1="value1",
+        param2="value2",
+    )
+
+    assert result == {"data": "test data"}
+    mock_limiter.wait_if_needed.assert_awaited_once_with("market")
+    mock_limiter.reset_retry_attempts.assert_called_once_with("market")
+    mock_func.assert_called_once_with(param1="value1", param2="value2")
+
+
+async def test_retry_request_with_limiter_retry(mock_limiter):
+    """Test that a server error is retried and the limiter is reset once on success."""
+    mock_func = AsyncMock(side_effect=[APIError("First attempt failed", 500), {"data": "test data"}])
+
+    result = await retry_request(
+        request_func=mock_func,
+        limiter=mock_limiter,
+        endpoint_type="market",
+        retry_strategy=RetryStrategy(max_retries=3),
+    )
+
+    assert result == {"data": "test data"}
+    assert mock_func.call_count == 2
+    mock_limiter.wait_if_needed.assert_awaited_once_with("market")
+    mock_limiter.reset_retry_attempts.assert_called_once_with("market")
+    mock_limiter.handle_429.assert_not_called()
+
+
+async def test_retry_request_rate_limit(mock_limiter):
+    """Test that rate limit errors are handed to the limiter and re-raised."""
+    rate_limit_error = RateLimitExceeded(
+        "Rate limit exceeded",
+        429,
+        {"error": "Too many requests"},
+        retry_after=5,
+    )
+    mock_func = AsyncMock(side_effect=rate_limit_error)
+
+    with pytest.raises(RateLimitExceeded) as excinfo:
+        await retry_request(
+            request_func=mock_func,
+            limiter=mock_limiter,
+            endpoint_type="market",
+            retry_strategy=RetryStrategy(max_retries=2),
+        )
+
+    assert mock_func.call_count == 3  # 1 initial + 2 retries
+    # The limiter waits out each 429 before a retry, not after the final failure
+    assert mock_limiter.handle_429.await_args_list == [call("market", 5)] * 2
+    mock_limiter.reset_retry_attempts.assert_not_called()
+    assert excinfo.value.retry_after == 5
+
+
 async def test_retry_request_max_retries_exceeded():
     """Test retry_request when max retries is exceeded."""
     # Create a mock function that always fails
@@ -97,3 +251,20 @@ async def test_retry_request_max_retries_exceeded():
 
     # Verify that some delay happened
     assert elapsed_time > 0
+
+
+async def test_retry_request_max_retries_exceeded_with_limiter(mock_limiter):
+    """Test that the last APIError is re-raised after all attempts fail."""
+    mock_func = AsyncMock(side_effect=APIError("Server error", 500))
+
+    with pytest.raises(APIError) as excinfo:
+        await retry_request(
+            request_func=mock_func,
+            limiter=mock_limiter,
+            endpoint_type="market",
+            retry_strategy=RetryStrategy(max_retries=2),
+        )
+
+    assert (excinfo.value.message, excinfo.value.status_code) == ("Server error", 500)
+    assert mock_func.call_count == 3  # 1 initial + 2 retries
+    mock_limiter.reset_retry_attempts.assert_not_called()
@@ -0,0 +1,27 @@
+"""Tests for the event loop setup helper."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from src.utils import event_loop
+
+
+def test_install_without_uvloop(monkeypatch):
+    """Test that the default asyncio loop is kept when uvloop is missing."""
+    set_policy = MagicMock()
+    monkeypatch.setattr(event_loop, "uvloop", None)
+    monkeypatch.setattr(event_loop.asyncio, "set_event_loop_policy", set_policy)
+
+    assert event_loop.install_event_loop_policy() is False
+    set_policy.assert_not_called()
+
+
+def test_install_with_uvloop(monkeypatch):
+    """Test that the uvloop policy is installed when uvloop is available."""
+    policy = object()
+    set_policy = MagicMock()
+    monkeypatch.setattr(event_loop, "uvloop", SimpleNamespace(EventLoopPolicy=lambda: policy))
+    monkeypatch.setattr(event_loop.asyncio, "set_event_loop_policy", set_policy)
+
+    assert event_loop.install_event_loop_policy() is True
+    set_policy.assert_called_once_with(policy)
@@ -151,6 +151,17 @@ class TestMarketAnalyzer:
         trend, confidence = analyzer._analyze_trend([10.0, 12.0, 9.0, 11.0, 10.0])
         assert confidence < 0.7
 
+    def test_price_at(self):
+        """Test that _price_at picks the point closest in time to the target."""
+        timestamps = [100.0, 200.0, 300.0]
+        prices = [1.0, 2.0, 3.0]
+
+        assert MarketAnalyzer._price_at(timestamps, prices, 0.0) == 1.0
+        assert MarketAnalyzer._price_at(timestamps, prices, 240.0) == 2.0
+        assert MarketAnalyzer._price_at(timestamps, prices, 260.0) == 3.0
+        assert MarketAnalyzer._price_at(timestamps, prices, 250.0) == 2.0  # tie -> earlier
+        assert MarketAnalyzer._price_at(timestamps, prices, 1000.0) == 3.0
+
     def test_detect_patterns(self):
         """Test pattern detection."""
         analyzer = MarketAnalyzer()
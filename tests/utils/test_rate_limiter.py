@@ -0,0 +1,201 @@
+"""Unit tests for the rate limiter module."""
+
+import asyncio
+from asyncio import sleep as real_sleep
+
+import pytest
+
+from src.utils.rate_limiter import DMARKET_API_RATE_LIMITS, RateLimiter
+
+
+@pytest.fixture(scope="module")
+def rate_limiter():
+    """Rate limiter shared by the module; get_endpoint_type does not change its state."""
+    return RateLimiter()
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("/exchange/v1/market/items", "market"),
+        ("/exchange/v1/market/buy", "market"),
+        ("/price-aggregator/v1/market/aggregated-prices", "market"),
+        ("/exchange/v1/user/offers/edit", "trade"),
+        ("/exchange/v1/user/offers/delete", "trade"),
+        ("/account/v1/balance", "balance"),
+        ("/API/V1/Account/Balance", "balance"),
+        ("/exchange/v1/user/inventory", "user"),
+        ("/exchange/v1/user/offers", "user"),
+        ("/exchange/v1/user/targets", "user"),
+        ("/account/v1/user", "other"),
+        ("", "other"),
+    ],
+    ids=[
+        "market_items",
+        "market_buy",
+        "aggregated_prices",
+        "offers_edit",
+        "offers_delete",
+        "balance",
+        "balance_mixed_case",
+        "inventory",
+        "user_offers",
+        "user_targets",
+        "unknown",
+        "empty",
+    ],
+)
+def test_get_endpoint_type(rate_limiter, path, expected):
+    """Test classifying request paths by endpoint type."""
+    assert rate_limiter.get_endpoint_type(path) == expected
+
+
+class FakeClock:
+    """Fake time source: sleep records the delay and moves the clock forward.
+
+    sleep yields to the event loop before moving the clock, so concurrent
+    sleepers all start from the same moment, as with a real clock.
+    """
+
+    def __init__(self, now=1000.0):
+        self.now = now
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    async def sleep(self, delay):
+        wake_time = self.now + delay
+        self.sleeps.append(delay)
+        await real_sleep(0)
+        self.now = max(self.now, wake_time)
+
+
+@pytest.fixture
+def clock():
+    """Create a fake clock for the limiter."""
+    return FakeClock()
+
+
+@pytest.fixture
+def limiter(clock):
+    """Create a rate limiter that reads time from and sleeps on the fake clock."""
+    return RateLimiter(clock=clock.time, sleep=clock.sleep)
+
+
+async def test_wait_if_needed_with_reset_time(clock, limiter):
+    """Test waiting out a rate limit reset before the request."""
+    limiter.reset_times["market"] = clock.now + 60
+
+    await limiter.wait_if_needed("market")
+
+    assert clock.sleeps == [60]
+    assert "market" not in limiter.reset_times
+    assert limiter.remaining_requests["market"] == limiter.rate_limits["market"]
+
+
+async def test_wait_if_needed_paced(clock, limiter):
+    """Test that concurrent callers get consecutive slots 1/rate apart."""
+    limiter.set_custom_limit("market", 2)
+
+    await asyncio.gather(*(limiter.wait_if_needed("market") for _ in range(4)))
+
+    # Первый запрос уходит сразу, остальные ждут 0.5, 1.0 и 1.5 сек одновременно
+    assert clock.sleeps == [0.5, 1.0, 1.5]
+
+
+async def test_wait_if_needed_does_not_burst_after_idle(clock, limiter):
+    """Test that idle time does not let a burst above the rate through."""
+    limiter.set_custom_limit("market", 2)
+
+    for _ in range(2):
+        await limiter.wait_if_needed("market")
+    clock.now += 10
+    for _ in range(3):
+        await limiter.wait_if_needed("market")
+
+    assert clock.sleeps == [0.5, 0.5, 0.5]
+
+
+@pytest.mark.parametrize("endpoint_type", ["market", "trade", "balance"])
+async def test_wait_if_needed_worst_case_window(clock, limiter, endpoint_type):
+    """Test that no 1s window holds more requests than the per-second limit."""
+    rate = limiter.get_rate_limit(endpoint_type)
+    sent = []
+    for _ in range(3 * rate + 1):
+        await limiter.wait_if_needed(endpoint_type)
+        sent.append(clock.now)
+
+    for start in sent:
+        assert sum(start <= t < start + 1 for t in sent) <= rate
+
+
+async def test_wait_if_needed_concurrent_reset_waiters(clock, limiter):
+    """Test that several callers waiting out the same reset all proceed."""
+    limiter.set_custom_limit("market", 0)
+    limiter.reset_times["market"] = clock.now + 30
+
+    await asyncio.gather(*(limiter.wait_if_needed("market") for _ in range(3)))
+
+    assert clock.sleeps == [30, 30, 30]
+    assert "market" not in limiter.reset_times
+
+
+def test_update_from_headers_converts_reset_to_monotonic(clock, limiter, monkeypatch):
+    """Test that the wall-clock reset header becomes a monotonic deadline."""
+    monkeypatch.setattr("src.utils.rate_limiter.time.time", lambda: 1_700_000_000.0)
+
+    limiter.update_from_headers(
+        {
+            "X-RateLimit-Scope": "market",
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": "1700000030",
+        },
+    )
+
+    assert limiter.reset_times["market"] == clock.now + 30
+    assert limiter.get_remaining_requests("market") == 0
+
+
+def test_limiter_instances_have_no_dict():
+    """Test that the limiter keeps its state in slots."""
+    assert not hasattr(RateLimiter(), "__dict__")
+
+
+def test_rate_limits_are_per_instance_copies():
+    """Test that limit updates stay on the instance and leave the defaults intact."""
+    limiter = RateLimiter(is_authorized=False)
+    limiter.update_from_headers(
+        {"X-RateLimit-Scope": "market", "X-RateLimit-Remaining": "5", "X-RateLimit-Limit": "8"},
+    )
+
+    assert limiter.get_rate_limit("market") == 4
+    assert RateLimiter().get_rate_limit("market") == DMARKET_API_RATE_LIMITS["market"]
+    with pytest.raises(TypeError):
+        DMARKET_API_RATE_LIMITS["market"] = 8
+
+
+@pytest.mark.parametrize(
+    ("retry_after", "attempts", "uniform", "expected_wait"),
+    [
+        (None, 0, 0.05, 1.05),
+        (None, 2, -0.1, 3.6),
+        (10, 0, 0.1, 11.0),
+    ],
+    ids=["first_backoff", "third_backoff", "retry_after"],
+)
+async def test_handle_429_jittered_wait(
+    clock, limiter, monkeypatch, retry_after, attempts, uniform, expected_wait
+):
+    """Test that the 429 wait gets random jitter and sets the reset deadline."""
+    monkeypatch.setattr("src.utils.rate_limiter.random.uniform", lambda a, b: uniform)
+    if attempts:
+        limiter.retry_attempts["market"] = attempts
+    start = clock.now
+
+    wait_time, current_attempts = await limiter.handle_429("market", retry_after)
+
+    assert wait_time == pytest.approx(expected_wait)
+    assert current_attempts == attempts + 1
+    assert limiter.reset_times["market"] == pytest.approx(start + expected_wait)
+    assert clock.sleeps == [wait_time]
@@ -1,23 +1,35 @@
 """Тесты для модуля websocket_client.py"""
 
+import asyncio
 import json
-from unittest.mock import AsyncMock, MagicMock, patch
+import socket
+from collections import deque
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 from aiohttp import WSMessage, WSMsgType
 
-from src.dmarket.dmarket_api import DMarketAPI
 from src.utils.websocket_client import DMarketWebSocketClient
 
 
+class StubAPIClient:
+    """Заглушка DMarketAPI: только то, что читает клиент WebSocket.
+
+    Дешевле MagicMock(spec=DMarketAPI), который разбирает весь класс API.
+    Ключей нет, поэтому клиент не проходит аутентификацию.
+    """
+
+    public_key = ""
+    secret_key = b""
+
+    def _generate_signature(self, *args, **kwargs):
+        return {"Authorization": "DMR1:public:secret"}
+
+
 @pytest.fixture
 def mock_api_client():
-    """Мок для DMarketAPI."""
-    api_client = MagicMock(spec=DMarketAPI)
-    api_client._generate_signature.return_value = {
-        "Authorization": "DMR1:public:secret",
-    }
-    return api_client
+    """Заглушка для DMarketAPI."""
+    return StubAPIClient()
 
 
 @pytest.fixture
@@ -66,20 +78,22 @@ class MockWebSocket:
     """Мок для WebSocket соединения."""
 
     def __init__(self, messages=None):
-        self.messages = messages or []
+        self.messages = deque(messages or ())
         self.closed = False
         self.send_json = AsyncMock()
         self.ping = AsyncMock()
         self.close = AsyncMock()
         self.exception = MagicMock(return_value=Exception("WebSocket error"))
+        self.get_extra_info = MagicMock(return_value=None)
 
     def __aiter__(self):
         return self
 
     async def __anext__(self):
-        if not self.messages:
-            raise StopAsyncIteration
-        return self.messages.pop(0)
+        try:
+            return self.messages.popleft()
+        except IndexError:
+            raise StopAsyncIteration from None
 
 
 @pytest.mark.asyncio
@@ -297,3 +311,225 @@ async def test_close(websocket_client):
     assert websocket_client.is_connected is False
     mock_task.cancel.assert_called_once()
     websocket_client.ws.close.assert_called_once()
+
+
+@pytest.fixture
+def connected_client(mock_api_client):
+    """Создает подключенный клиент с мок-соединением."""
+    client = DMarketWebSocketClient(mock_api_client)
+    client.is_connected = True
+    client.ws_connection = MockWebSocket()
+    return client
+
+
+@pytest.mark.asyncio
+async def test_subscribe_many_sends_single_frame(connected_client):
+    """Тест пакетной подписки одним сообщением."""
+    result = await connected_client.subscribe_many(
+        ["market:update", "orders:update", "market:update"],
+    )
+
+    assert result is True
+    assert connected_client.subscriptions == {"market:update", "orders:update"}
+    connected_client.ws_connection.send_json.assert_called_once_with(
+        {"type": "subscribe", "topics": ["market:update", "orders:update"]},
+    )
+
+
+@pytest.mark.asyncio
+async def test_resubscribe_and_unsubscribe_all_per_topic(connected_client):
+    """Тест повторной подписки и отписки по одной теме по умолчанию."""
+    connected_client.subscriptions = {"market:update", "orders:update"}
+
+    await connected_client._resubscribe()
+    await connected_client._unsubscribe_all()
+
+    sent = [c.args[0] for c in connected_client.ws_connection.send_json.call_args_list]
+    assert sorted((m["type"], m["topic"]) for m in sent) == [
+        ("subscribe", "market:update"),
+        ("subscribe", "orders:update"),
+        ("unsubscribe", "market:update"),
+        ("unsubscribe", "orders:update"),
+    ]
+    assert connected_client.subscriptions == set()
+
+
+@pytest.mark.asyncio
+async def test_resubscribe_and_unsubscribe_all_batched(connected_client):
+    """Тест повторной подписки и отписки от всех тем одним сообщением."""
+    connected_client.batch_subscriptions = True
+    connected_client.subscriptions = {"market:update", "orders:update"}
+
+    await connected_client._resubscribe()
+    await connected_client._unsubscribe_all()
+
+    sent = [c.args[0] for c in connected_client.ws_connection.send_json.call_args_list]
+    assert [(m["type"], sorted(m["topics"])) for m in sent] == [
+        ("subscribe", ["market:update", "orders:update"]),
+        ("unsubscribe", ["market:update", "orders:update"]),
+    ]
+    assert connected_client.subscriptions == set()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("encode", [False, True], ids=["str", "bytes"])
+async def test_handle_message_dispatches_to_handlers(connected_client, encode):
+    """Тест разбора входящего сообщения и вызова обработчиков."""
+    handler = AsyncMock()
+    connected_client.register_handler("market:update", handler)
+    payload = {"type": "market:update", "data": {"item_id": "123", "price": 100}}
+    data = json.dumps(payload)
+
+    await connected_client._handle_message(data.encode() if encode else data)
+
+    handler.assert_called_once_with(payload)
+
+
+@pytest.mark.asyncio
+async def test_handle_message_invalid_json(connected_client):
+    """Тест обработки некорректного JSON без исключения."""
+    handler = AsyncMock()
+    connected_client.register_handler("market:update", handler)
+
+    await connected_client._handle_message("{not json")
+
+    handler.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("attempts", "expected"),
+    [(1, 2.0), (3, 8.0), (10, 60.0)],
+    ids=["first", "third", "capped"],
+)
+def test_reconnect_delay_exponential_with_jitter(mock_api_client, attempts, expected):
+    """Тест экспоненциальной задержки переподключения с ограничением и джиттером."""
+    client = DMarketWebSocketClient(mock_api_client, reconnect_jitter=0.5)
+    client.reconnect_attempts = attempts
+
+    with patch("src.utils.websocket_client.random.uniform", return_value=0.5) as mock_uniform:
+        assert client._reconnect_delay() == expected + 0.5
+
+    mock_uniform.assert_called_once_with(0, 0.5)
+
+
+@pytest.mark.asyncio
+async def test_attempt_reconnect_gives_up_after_max_attempts(mock_api_client):
+    """Тест прекращения переподключений после исчерпания попыток."""
+    client = DMarketWebSocketClient(mock_api_client, max_reconnect_attempts=3)
+    client.reconnect_attempts = 3
+
+    with patch.object(DMarketWebSocketClient, "connect", AsyncMock()) as mock_connect:
+        await client._attempt_reconnect()
+
+    mock_connect.assert_not_called()
+    assert client.reconnect_attempts == 3
+
+
+@pytest.mark.asyncio
+async def test_listen_hands_messages_to_dispatch_workers(connected_client):
+    """Тест передачи текстовых и бинарных сообщений обработчикам через очередь."""
+    handler = AsyncMock()
+    connected_client.register_handler("market:update", handler)
+    payload = {"type": "market:update", "data": {"item_id": "123"}}
+    connected_client.ws_connection.receive = AsyncMock(
+        side_effect=[
+            WSMessage(WSMsgType.TEXT, json.dumps(payload), None),
+            WSMessage(WSMsgType.BINARY, json.dumps(payload).encode(), None),
+            WSMessage(WSMsgType.CLOSED, None, None),
+        ],
+    )
+    with patch.object(DMarketWebSocketClient, "_attempt_reconnect", AsyncMock()):
+        await connected_client.listen()
+    await connected_client._inbox.join()
+
+    assert handler.call_args_list == [call(payload), call(payload)]
+    assert connected_client.is_connected is False
+    assert connected_client._workers == []
+
+
+@pytest.mark.asyncio
+async def test_listen_cancelled_stops_dispatch_workers(connected_client):
+    """Тест остановки обработчиков очереди при отмене задачи listen."""
+    received = asyncio.Event()
+
+    async def receive():
+        received.set()
+        await asyncio.Event().wait()
+
+    connected_client.ws_connection.receive = receive
+    listen_task = asyncio.create_task(connected_client.listen())
+    await received.wait()
+    workers = list(connected_client._workers)
+
+    listen_task.cancel()
+    await listen_task
+
+    assert workers
+    assert all(task.done() for task in workers)
+    assert connected_client._workers == []
+
+
+@pytest.mark.asyncio
+async def test_handler_can_close_client(connected_client):
+    """Тест закрытия клиента из обработчика сообщения."""
+    closed = []
+
+    async def handler(data):
+        await connected_client.close()
+        closed.append(data)
+
+    connected_client.register_handler("market:update", handler)
+    payload = {"type": "market:update", "data": {"item_id": "123"}}
+    connected_client.ws_connection.receive = AsyncMock(
+        side_effect=[
+            WSMessage(WSMsgType.TEXT, json.dumps(payload), None),
+            WSMessage(WSMsgType.CLOSED, None, None),
+        ],
+    )
+    with patch.object(DMarketWebSocketClient, "_attempt_reconnect", AsyncMock()):
+        await connected_client.listen()
+
+    # Обработчик не отменен посреди close() и дошел до конца
+    assert closed == [payload]
+    assert connected_client.is_connected is False
+    assert connected_client._workers == []
+
+
+@pytest.mark.asyncio
+@patch("aiohttp.TCPConnector")
+@patch("aiohttp.ClientSession")
+async def test_reconnect_reuses_session(mock_session_cls, mock_connector_cls, mock_api_client):
+    """Тест повторного использования сессии при переподключении."""
+    session = mock_session_cls.return_value
+    session.closed = False
+    session.ws_connect = AsyncMock(return_value=MockWebSocket())
+    client = DMarketWebSocketClient(mock_api_client)
+
+    assert await client.connect() is True
+    client.is_connected = False  # соединение разорвано сервером
+    assert await client.connect() is True
+
+    mock_session_cls.assert_called_once_with(connector=mock_connector_cls.return_value)
+    assert session.ws_connect.call_count == 2
+    assert session.ws_connect.call_args.kwargs["compress"] == DMarketWebSocketClient.WS_COMPRESS
+    assert session.ws_connect.call_args.kwargs["heartbeat"] == 30.0
+
+
+def test_client_instances_have_no_dict(mock_api_client):
+    """Тест хранения состояния клиента в слотах."""
+    client = DMarketWebSocketClient(mock_api_client)
+
+    assert not hasattr(client, "__dict__")
+    assert isinstance(client.subscriptions, set)
+
+
+def test_enable_tcp_keepalive(connected_client):
+    """Тест включения TCP keepalive на сокете соединения."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        connected_client.ws_connection.get_extra_info.return_value = sock
+
+        connected_client._enable_tcp_keepalive()
+
+        assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE) == 1
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE) == 30
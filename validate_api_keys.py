@@ -12,12 +12,13 @@ when your balance shows $0.00. It checks:
 If issues are found, it helps you regenerate/update your API keys.
 """
 
+import asyncio
 import os
+import re
 import sys
 import json
 import hmac
-import hashlib
-import requests
+import httpx
 from datetime import datetime
 from typing import Dict, Any, Optional, Tuple
 
@@ -39,6 +40,65 @@ except ImportError:
     def blue(text): return text
     def magenta(text): return text
 
+# Balance endpoints to probe
+ENDPOINTS = (
+    # Новые эндпоинты согласно документации DMarket API
+    "/api/v1/account/balance",
+    "/api/v1/account/wallet/balance",
+    "/exchange/v1/user/balance",
+    # Старые эндпоинты
+    "/account/v1/balance",
+)
+
+# .env variable remembering the last endpoint that accepted the keys
+LAST_ENDPOINT_VAR = "DMARKET_API_ENDPOINT"
+
+# NAME=value line of a .env file; comments and blank lines do not match
+_ENV_LINE_RE = re.compile(r"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=(.*)$", re.MULTILINE)
+
+# The LAST_ENDPOINT_VAR line of a .env file
+_LAST_ENDPOINT_LINE_RE = re.compile(rf"^[ \t]*{LAST_ENDPOINT_VAR}[ \t]*=.*$", re.MULTILINE)
+
+def _read_env_file(env_path: str) -> Dict[str, str]:
+    """
+    Read NAME=value pairs from a .env file in one pass.
+    
+    Args:
+        env_path: Path to the .env file
+        
+    Returns:
+        Dict of variable names to raw (stripped, still quoted) values
+    """
+    with open(env_path, "r", encoding="utf-8") as f:
+        data = f.read()
+    return {name: value.strip() for name, value in _ENV_LINE_RE.findall(data)}
+
+def _write_env_file(env_path: str, env_vars: Dict[str, str]) -> None:
+    """
+    Write variables to a .env file atomically.
+    
+    Args:
+        env_path: Path to the .env file
+        env_vars: Dict of variable names to values
+    """
+    # Build the text first, then swap the file in atomically
+    content = "# DMarket API configuration file\n# Updated by validate_api_keys.py\n\n"
+    content += "".join(f"{key}={value}\n" for key, value in env_vars.items())
+    _replace_file(env_path, content)
+
+def _replace_file(env_path: str, content: str) -> None:
+    """
+    Replace the contents of a file atomically.
+    
+    Args:
+        env_path: Path to the file
+        content: New file contents
+    """
+    tmp_path = f"{env_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, env_path)
+
 def load_env_vars() -> Dict[str, str]:
     """
     Load API keys from .env file or environment variables.
@@ -53,14 +113,9 @@ def load_env_vars() -> Dict[str, str]:
     if os.path.exists(env_path):
         print(f"{blue('Info:')} Loading API keys from .env file")
         try:
-            with open(env_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith("#"):
-                        continue
-                    if "=" in line:
-                        name, value = line.split("=", 1)
-                        env_vars[name.strip()] = value.strip().strip("'\"")
+            env_vars = {
+                name: value.strip("'\"") for name, value in _read_env_file(env_path).items()
+            }
         except Exception as e:
             print(f"{red('Error:')} Failed to load .env file: {e}")
     
@@ -68,7 +123,8 @@ def load_env_vars() -> Dict[str, str]:
     api_keys = {
         "public_key": os.environ.get("DMARKET_PUBLIC_KEY", env_vars.get("DMARKET_PUBLIC_KEY", "")),
         "secret_key": os.environ.get("DMARKET_SECRET_KEY", env_vars.get("DMARKET_SECRET_KEY", "")),
-        "api_url": os.environ.get("DMARKET_API_URL", env_vars.get("DMARKET_API_URL", "https://api.dmarket.com"))
+        "api_url": os.environ.get("DMARKET_API_URL", env_vars.get("DMARKET_API_URL", "https://api.dmarket.com")),
+        "last_endpoint": os.environ.get(LAST_ENDPOINT_VAR, env_vars.get(LAST_ENDPOINT_VAR, "")),
     }
     
     return api_keys
@@ -91,7 +147,7 @@ def check_api_key_format(public_key: str, secret_key: str) -> Tuple[bool, list]:
         issues.append("Public key is empty")
     elif len(public_key) < 10:
         issues.append(f"Public key is too short ({len(public_key)} chars)")
-    elif not all(c.isalnum() for c in public_key):
+    elif not public_key.isalnum():
         issues.append("Public key contains invalid characters (should be alphanumeric)")
     
     # Check secret key
@@ -99,16 +155,22 @@ def check_api_key_format(public_key: str, secret_key: str) -> Tuple[bool, list]:
         issues.append("Secret key is empty")
     elif len(secret_key) < 10:
         issues.append(f"Secret key is too short ({len(secret_key)} chars)")
-    elif not all(c.isalnum() for c in secret_key):
+    elif not secret_key.isalnum():
         issues.append("Secret key contains invalid characters (should be alphanumeric)")
     
     return len(issues) == 0, issues
 
-def test_api_auth(public_key: str, secret_key: str, endpoint: str = "/api/v1/account/balance") -> Dict[str, Any]:
+async def test_api_auth(
+    client: httpx.AsyncClient,
+    public_key: str,
+    secret_key: str,
+    endpoint: str = "/api/v1/account/balance",
+) -> Dict[str, Any]:
     """
     Test API authentication by making a direct request.
     
     Args:
+        client: HTTP client shared between endpoint checks
         public_key: DMarket public API key
         secret_key: DMarket secret API key
         endpoint: API endpoint to test
@@ -131,11 +193,7 @@ def test_api_auth(public_key: str, secret_key: str, endpoint: str = "/api/v1/acc
             secret_key_bytes = secret_key.encode('utf-8')
         
         # Create signature
-        signature = hmac.new(
-            secret_key_bytes,
-            string_to_sign.encode(),
-            hashlib.sha256
-        ).hexdigest()
+        signature = hmac.digest(secret_key_bytes, string_to_sign.encode(), "sha256").hex()
         
         # Request headers
         headers = {
@@ -149,7 +207,7 @@ def test_api_auth(public_key: str, secret_key: str, endpoint: str = "/api/v1/acc
         print(f"{blue('Info:')} Testing API authentication with endpoint {endpoint}")
         
         # Send request
-        response = requests.get(full_url, headers=headers, timeout=10)
+        response = await client.get(full_url, headers=headers, timeout=10)
         
         # Try to parse JSON response
         try:
@@ -170,43 +228,66 @@ def test_api_auth(public_key: str, secret_key: str, endpoint: str = "/api/v1/acc
             "error": str(e)
         }
 
-def try_multiple_endpoints(public_key: str, secret_key: str) -> Dict[str, Any]:
+async def try_multiple_endpoints(
+    public_key: str,
+    secret_key: str,
+    preferred_endpoint: Optional[str] = None,
+) -> Dict[str, Any]:
     """
     Try multiple DMarket API endpoints to find one that works.
     
     Args:
         public_key: DMarket public API key
         secret_key: DMarket secret API key
+        preferred_endpoint: Endpoint that worked last time; probed alone first
         
     Returns:
         Dict with test results
     """
-    endpoints = [
-        # Новые эндпоинты согласно документации DMarket API
-        "/api/v1/account/balance",
-        "/api/v1/account/wallet/balance",
-        "/exchange/v1/user/balance",
-        # Старые эндпоинты
-        "/account/v1/balance"
-    ]
-    
+    endpoints = ENDPOINTS
     results = {}
     success = False
     successful_endpoint = None
     
-    for endpoint in endpoints:
-        result = test_api_auth(public_key, secret_key, endpoint)
-        results[endpoint] = result
+    async with httpx.AsyncClient() as client:
+        # A cached endpoint usually still works: one probe instead of all of them
+        if preferred_endpoint:
+            result = await test_api_auth(client, public_key, secret_key, preferred_endpoint)
+            results[preferred_endpoint] = result
+            if result.get("success"):
+                print(f"{green('Success:')} API authentication successful with endpoint {preferred_endpoint}")
+                return {
+                    "success": True,
+                    "endpoint": preferred_endpoint,
+                    "results": results
+                }
+            print(f"{yellow('Warning:')} Cached endpoint {preferred_endpoint} failed, trying all endpoints")
+            endpoints = tuple(endpoint for endpoint in ENDPOINTS if endpoint != preferred_endpoint)
         
-        # If successful, save the endpoint and break
-        if result.get("success"):
-            print(f"{green('Success:')} API authentication successful with endpoint {endpoint}")
-            success = True
-            successful_endpoint = endpoint
-            break
-        else:
-            status = result.get("status_code", "Error")
-            print(f"{red('Failed:')} Endpoint {endpoint} returned status {status}")
+        # Check all endpoints concurrently; the first one to answer successfully wins
+        async def probe(endpoint: str) -> Tuple[str, Dict[str, Any]]:
+            return endpoint, await test_api_auth(client, public_key, secret_key, endpoint)
+        
+        tasks = [asyncio.create_task(probe(endpoint)) for endpoint in endpoints]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                endpoint, result = await next_done
+                results[endpoint] = result
+                
+                # If successful, save the endpoint and break
+                if result.get("success"):
+                    print(f"{green('Success:')} API authentication successful with endpoint {endpoint}")
+                    success = True
+                    successful_endpoint = endpoint
+                    break
+                else:
+                    status = result.get("status_code", "Error")
+                    print(f"{red('Failed:')} Endpoint {endpoint} returned status {status}")
+        finally:
+            # Cancel the probes that are still waiting for an answer
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
     
     return {
         "success": success,
@@ -233,6 +314,38 @@ def get_user_input_for_keys() -> Dict[str, str]:
         "api_url": "https://api.dmarket.com"
     }
 
+def save_last_endpoint(endpoint: str) -> None:
+    """
+    Remember the working endpoint in an existing .env file.
+    
+    Only the LAST_ENDPOINT_VAR line is replaced or appended; comments,
+    blank lines and other variables are left as they are.
+    
+    Args:
+        endpoint: Endpoint that accepted the API keys
+    """
+    env_path = os.path.join(os.path.dirname(__file__), ".env")
+    if not os.path.exists(env_path):
+        return
+    
+    try:
+        with open(env_path, "r", encoding="utf-8") as f:
+            data = f.read()
+        
+        line = f"{LAST_ENDPOINT_VAR}={endpoint}"
+        match = _LAST_ENDPOINT_LINE_RE.search(data)
+        if match:
+            if match.group().strip() == line:
+                return
+            data = f"{data[:match.start()]}{line}{data[match.end():]}"
+        else:
+            if data and not data.endswith("\n"):
+                data += "\n"
+            data += f"{line}\n"
+        _replace_file(env_path, data)
+    except Exception as e:
+        print(f"{red('Error:')} Failed to save endpoint to .env file: {e}")
+
 def update_env_file(api_keys: Dict[str, str]) -> bool:
     """
     Update .env file with new API keys.
@@ -249,14 +362,7 @@ def update_env_file(api_keys: Dict[str, str]) -> bool:
         
         # Read existing file
         if os.path.exists(env_path):
-            with open(env_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith("#"):
-                        continue
-                    if "=" in line:
-                        name, value = line.split("=", 1)
-                        env_vars[name.strip()] = value.strip()
+            env_vars = _read_env_file(env_path)
         
         # Update API keys
         env_vars["DMARKET_PUBLIC_KEY"] = api_keys["public_key"]
@@ -264,12 +370,7 @@ def update_env_file(api_keys: Dict[str, str]) -> bool:
         env_vars["DMARKET_API_URL"] = api_keys["api_url"]
         
         # Write back to file
-        with open(env_path, "w", encoding="utf-8") as f:
-            f.write("# DMarket API configuration file\n")
-            f.write("# Updated by validate_api_keys.py\n\n")
-            
-            for key, value in env_vars.items():
-                f.write(f"{key}={value}\n")
+        _write_env_file(env_path, env_vars)
         
         print(f"{green('Success:')} Updated .env file with new API keys")
         return True
@@ -339,7 +440,11 @@ def main():
     
     # Test API authentication
     print("\nTesting API authentication...")
-    auth_results = try_multiple_endpoints(api_keys["public_key"], api_keys["secret_key"])
+    auth_results = asyncio.run(
+        try_multiple_endpoints(api_keys["public_key"], api_keys["secret_key"], api_keys.get("last_endpoint"))
+    )
+    if auth_results["success"]:
+        save_last_endpoint(auth_results["endpoint"])
     
     # Print recommendations
     print_recommendations(not valid_format, auth_results["success"])
@@ -359,9 +464,12 @@ def main():
                 
                 if valid_format:
                     print(f"{green('Success:')} New API keys have valid format")
-                    auth_results = try_multiple_endpoints(new_keys["public_key"], new_keys["secret_key"])
+                    auth_results = asyncio.run(
+                        try_multiple_endpoints(new_keys["public_key"], new_keys["secret_key"])
+                    )
                     
                     if auth_results["success"]:
+                        save_last_endpoint(auth_results["endpoint"])
                         print(f"\n{green('Success:')} Your new API keys are working correctly!")
                         print(f"You can now run your DMarket bot with the new keys")
                     else: